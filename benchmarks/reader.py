@@ -0,0 +1,75 @@
+"""
+Benchmark for pyredis.protocol.Reader.
+
+Feeds N pipelined replies into a single Reader and drains them with gets().
+The time per reply should stay flat while N grows, a Reader that copies the
+unread rest of its buffer on every gets() shows quadratic growth instead.
+
+The second table parses one array reply of N elements, fed in 1500 byte
+chunks the way Connection.read() receives it.
+
+The third table parses a single bulk string of N megabytes fed in 64 KiB
+chunks, which is assembled in a preallocated buffer.
+
+Usage:
+    python -m benchmarks.reader
+"""
+
+import time
+
+from pyredis.protocol import Reader
+
+REPLY = b"$32\r\n" + b"x" * 32 + b"\r\n"
+
+
+def run(replies):
+    reader = Reader()
+    reader.feed(REPLY * replies)
+    start = time.perf_counter()
+    while reader.gets() is not False:
+        pass
+    return time.perf_counter() - start
+
+
+def run_array(elements, chunk=1500):
+    data = b"*%d\r\n" % elements + REPLY * elements
+    reader = Reader()
+    start = time.perf_counter()
+    for offset in range(0, len(data), chunk):
+        reader.feed(data, offset, min(chunk, len(data) - offset))
+        result = reader.gets()
+    assert len(result) == elements
+    return time.perf_counter() - start
+
+
+def run_bulk(megabytes, chunk=65536):
+    payload = b"x" * (megabytes * 1024 * 1024)
+    data = b"$%d\r\n" % len(payload) + payload + b"\r\n"
+    reader = Reader()
+    start = time.perf_counter()
+    for offset in range(0, len(data), chunk):
+        reader.feed(data, offset, min(chunk, len(data) - offset))
+        result = reader.gets()
+    assert len(result) == len(payload)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'replies':>10} {'total (s)':>12} {'per reply (us)':>16}")
+    for replies in (1000, 5000, 20000, 80000):
+        elapsed = run(replies)
+        print(f"{replies:>10} {elapsed:>12.4f} {elapsed / replies * 1e6:>16.3f}")
+    print()
+    print(f"{'elements':>10} {'total (s)':>12} {'per element (us)':>16}")
+    for elements in (1000, 10000, 100000):
+        elapsed = run_array(elements)
+        print(f"{elements:>10} {elapsed:>12.4f} {elapsed / elements * 1e6:>16.3f}")
+    print()
+    print(f"{'megabytes':>10} {'total (s)':>12} {'per MB (ms)':>16}")
+    for megabytes in (5, 20, 50):
+        elapsed = run_bulk(megabytes)
+        print(f"{megabytes:>10} {elapsed:>12.4f} {elapsed / megabytes * 1e3:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
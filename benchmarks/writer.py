@@ -0,0 +1,49 @@
+"""
+Benchmark for pyredis.protocol.writer and writer_many.
+
+Serializes a batch of N SET commands, once with one writer() call per
+command joined afterwards, and once with writer_many() into a reused
+bytearray, the way bulk mode queues commands on a connection.
+
+Usage:
+    python -m benchmarks.writer
+"""
+
+import time
+
+from pyredis.protocol import writer
+from pyredis.protocol import writer_many
+
+
+def commands(count):
+    return [("SET", f"key:{i}", "x" * 32) for i in range(count)]
+
+
+def run_writer(batch):
+    start = time.perf_counter()
+    b"".join([writer(*args) for args in batch])
+    return time.perf_counter() - start
+
+
+def run_writer_many(batch, out):
+    start = time.perf_counter()
+    writer_many(batch, out)
+    del out[:]
+    return time.perf_counter() - start
+
+
+def main():
+    out = bytearray()
+    print(f"{'commands':>10} {'writer (us)':>14} {'writer_many (us)':>18}")
+    for count in (1000, 5000, 20000):
+        batch = commands(count)
+        elapsed = run_writer(batch)
+        elapsed_many = run_writer_many(batch, out)
+        print(
+            f"{count:>10} {elapsed / count * 1e6:>14.3f}"
+            f" {elapsed_many / count * 1e6:>18.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
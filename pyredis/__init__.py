@@ -11,6 +11,7 @@ License: MIT (see LICENSE for details)
 from pyredis.exceptions import PyRedisConnError
 from pyredis.exceptions import PyRedisConnReadTimeout
 from pyredis.exceptions import PyRedisConnClosed
+from pyredis.exceptions import PyRedisDeadlineExceeded
 from pyredis.exceptions import PyRedisError
 from pyredis.exceptions import ProtocolError
 from pyredis.exceptions import ReplyError
@@ -61,6 +62,7 @@ __all__ = [
     "PyRedisConnError",
     "PyRedisConnReadTimeout",
     "PyRedisConnClosed",
+    "PyRedisDeadlineExceeded",
     "PyRedisError",
     "ProtocolError",
     "ReplyError",
@@ -161,14 +163,36 @@ def get_by_url(
 
 
 def _opts_type_helper(opt, value):
-    if opt in ["database", "pool_size", "retries"]:
+    if opt in [
+        "database",
+        "pool_size",
+        "retries",
+        "read_buffer_size",
+        "max_read_buffer",
+        "pipeline_max_batch",
+    ]:
         return int(value)
-    elif opt in ["conn_timeout", "read_timeout"]:
+    elif opt in ["conn_timeout", "read_timeout", "pipeline_delay"]:
         return float(value)
-    elif opt in ["slave_ok"]:
+    elif opt == "socket_options":
+        return _socket_options_helper(value)
+    elif opt in ["slave_ok", "auto_pipeline"]:
         if value in ["true", "True", 1]:
             return True
         else:
             return False
     else:
         return value
+
+
+def _socket_options_helper(value):
+    options = dict()
+    for opt in value.split(","):
+        key, option = opt.split(":", 1)
+        if key in ["tcp_nodelay", "keepalive"]:
+            options[key] = option in ["true", "True", "1"]
+        elif key == "user_timeout":
+            options[key] = float(option)
+        else:
+            options[key] = int(option)
+    return options
@@ -1,49 +1,58 @@
 import asyncio
-import random
-from collections import deque
+import time
 from uuid import uuid4
 
 from pyredis.connection import AsyncConnection
 from pyredis.exceptions import PyRedisError
-from pyredis.helper import slot_from_key
+from pyredis.exceptions import ReplyError
+from pyredis.helper import BaseClusterMap
 
 
-class AsyncClusterMap(object):
+class AsyncClusterMap(BaseClusterMap):
     def __init__(
         self,
         seeds,
         password=None,
         lock=None,
         username=None,
+        refresh_delay=0.1,
+        refresh_interval=1,
     ):
-        self._id = uuid4()
+        super().__init__(
+            seeds=seeds,
+            password=password,
+            username=username,
+            refresh_delay=refresh_delay,
+            refresh_interval=refresh_interval,
+        )
         if lock is None:
             self._lock = asyncio.Lock()
         else:
             self._lock = lock
-        self._map = {}
-        self._seeds = deque(seeds)
-        self._password = password
-        self._username = username
-
-    @property
-    def id(self):
-        return self._id
-
-    @staticmethod
-    def _make_str(endpoint):
-        return str(endpoint[0]) + "_" + str(endpoint[1])
+        self._refresh_task = None
 
     async def _fetch_map(self):
-        for seed in self._seeds:
+        for endpoint in self._endpoints():
             conn = AsyncConnection(
-                host=seed[0],
-                port=seed[1],
+                host=endpoint[0],
+                port=endpoint[1],
                 encoding="utf-8",
                 password=self._password,
                 username=self._username,
             )
             try:
+                if self._shards:
+                    await conn.write(
+                        *["CLUSTER", "SHARDS"]
+                    )
+                    try:
+                        return self._slots_from_shards(await conn.read())
+                    except ReplyError as err:
+                        # Servers before Redis 7 only know CLUSTER SLOTS,
+                        # other errors move on to the next node.
+                        if not self._unknown_command(err):
+                            raise
+                        self._shards = False
                 await conn.write(
                     *["CLUSTER", "SLOTS"]
                 )
@@ -57,54 +66,32 @@ class AsyncClusterMap(object):
             "{0}".format(self._seeds)
         )
 
-    def _update_slot(
-        self,
-        slot,
-        master,
-        slaves
-    ):
-        self._map[slot] = {
-            "master": self._make_str(master),
-            "slave": self._make_str(random.choice(slaves)),
-        }
+    async def _refresh(self, wait):
+        await asyncio.sleep(wait)
+        try:
+            await self.update(self.id)
+        except PyRedisError:
+            # Failed refreshes are spaced out the same way.
+            self._refreshed = time.monotonic()
 
-    def get_slot(
-        self,
-        shard_key,
-        slave=None
-    ):
-        if not slave:
-            return self._map[slot_from_key(shard_key)]["master"]
-        else:
-            return self._map[slot_from_key(shard_key)]["slave"]
+    def refresh(self):
+        """
+        Schedule a refresh of the whole map in a background task.
 
-    def hosts(
-        self,
-        slave=None
-    ):
-        result = set()
-        if not slave:
-            selector = "master"
-        else:
-            selector = "slave"
-        for host in self._map.values():
-            result.add(host[selector])
-        return result
+        Does nothing if a refresh is already scheduled.
+        """
+        task = self._refresh_task
+        if task is not None and not task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh(self._refresh_wait())
+        )
 
     async def update(self, map_id):
         async with self._lock:
             if map_id != self.id:
                 return self.id
-            slots = await self._fetch_map()
-            for entry in slots:
-                for slot in range(
-                    entry[0],
-                    entry[1] + 1
-                ):
-                    self._update_slot(
-                        slot=slot,
-                        master=entry[2],
-                        slaves=entry[3:]
-                    )
+            self._table = self._build(await self._fetch_map())
             self._id = uuid4()
+            self._refreshed = time.monotonic()
             return self.id
@@ -1,8 +1,12 @@
 from pyredis.connection import Connection
 from pyredis.connection import AsyncConnection
 from pyredis.helper import dict_from_list
+from pyredis.helper import get_deadline
 from pyredis.helper import ClusterMap
 from pyredis.async_helper import AsyncClusterMap
+from pyredis.client.pipeline import AsyncPipeline
+from pyredis.client.pipeline import Pipeline
+from pyredis.client.pipeline import PipelineResult
 from pyredis.client.client import Client
 from pyredis.client.async_client import AsyncClient
 from pyredis.client.cluster import ClusterClient
@@ -25,9 +29,13 @@ __all__ = [
     "AsyncPubSubClient",
     "SentinelClient",
     "AsyncSentinelClient",
+    "Pipeline",
+    "AsyncPipeline",
+    "PipelineResult",
     "Connection",
     "AsyncConnection",
     "dict_from_list",
+    "get_deadline",
     "ClusterMap",
     "AsyncClusterMap",
 ]
@@ -1,5 +1,36 @@
+import contextlib
+
 from pyredis import commands
+from pyredis.client.pipeline import AsyncPipeline
 from pyredis.connection import AsyncConnection
+from pyredis.exceptions import PyRedisError
+from pyredis.helper import get_deadline
+
+
+class _MultiplexBatch(object):
+    """
+    Bulk mode of a single pipeline on a multiplexed connection.
+
+    Other coroutines keep using the connection meanwhile, so the batch
+    collects its own commands and sends them with request_many().
+    """
+
+    def __init__(self, conn, bulk_size):
+        self._cluster = False
+        self._conn = conn
+        self._bulk_size = bulk_size
+        self._commands = list()
+        self.results = list()
+
+    async def execute(self, *args, **kwargs):
+        self._commands.append(args)
+        if len(self._commands) == self._bulk_size:
+            await self.fetch()
+
+    async def fetch(self):
+        commands = self._commands
+        self._commands = list()
+        self.results.extend(await self._conn.request_many(commands))
 
 
 class AsyncClient(
@@ -19,8 +50,13 @@ class AsyncClient(
     """
     Asynchronous Redis Client.
 
-    Handles connection lifecycle and command execution asynchronously,
-    inheriting all standard Redis command mixins.
+    Handles connection lifecycle, command execution, and bulk mode
+    operations asynchronously, inheriting all standard Redis command mixins.
+
+    With multiplex=True the client may be shared by any number of
+    coroutines, their commands are in flight on the one connection at the
+    same time. auto_pipeline=True additionally coalesces the commands of
+    one event loop iteration into a single write.
     """
 
     def __init__(self, **kwargs):
@@ -31,19 +67,245 @@ class AsyncClient(
             **kwargs: Connection options forwarded to AsyncConnection.
         """
         super().__init__()
+        self._multiplex = bool(
+            kwargs.get("multiplex") or kwargs.get("auto_pipeline")
+        )
         self._conn = AsyncConnection(**kwargs)
+        self._bulk = False
+        self._bulk_keep = False
+        self._bulk_errors = None
+        self._bulk_results = None
+        self._bulk_size = None
+        self._bulk_size_current = None
+
+    async def _bulk_fetch(self):
+        await self._conn.flush()
+        count = self._bulk_size_current
+        self._bulk_size_current = 0
+        # Replies that are not kept are skipped unparsed, only errors are
+        # counted.
+        if self._bulk_keep:
+            self._bulk_results.extend(await self._conn.read_many(count))
+            return
+        errors = await self._conn.skip_many(count)
+        if self._bulk_errors is not None:
+            self._bulk_errors += errors
+
+    async def _execute_bulk(self, *args):
+        self._conn.queue(*args)
+        self._bulk_size_current += 1
+        if self._bulk_size_current == self._bulk_size:
+            await self._bulk_fetch()
+
+    @property
+    def bulk(self):
+        """Flag indicating if bulk mode is active."""
+        return self._bulk
+
+    def bulk_start(self, bulk_size=5000, keep_results=True, count_errors=False):
+        """
+        Start bulk command pipelining mode.
+
+        Args:
+            bulk_size: Maximum commands to queue before reading responses.
+            keep_results: Flag indicating if responses should be returned.
+            count_errors: If keep_results is False, count the failed
+                commands, bulk_stop() then returns their number.
+        """
+        if self._multiplex:
+            raise PyRedisError("bulk mode is not supported with multiplex")
+        if self.bulk:
+            raise PyRedisError("Already in bulk mode")
+        self._bulk = True
+        self._bulk_size = bulk_size
+        self._bulk_size_current = 0
+        if keep_results:
+            self._bulk_results = []
+            self._bulk_keep = True
+        elif count_errors:
+            self._bulk_errors = 0
+
+    async def bulk_stop(self):
+        """
+        Stop bulk mode and retrieve results asynchronously.
+
+        Returns:
+            List of execution results if keep_results was set, the number
+            of failed commands if count_errors was set.
+        """
+        if not self.bulk:
+            raise PyRedisError("Not in bulk mode")
+        try:
+            await self._bulk_fetch()
+            if self._bulk_errors is not None:
+                return self._bulk_errors
+            return self._bulk_results
+        finally:
+            self._bulk_reset()
+
+    def _bulk_reset(self):
+        self._bulk = False
+        self._bulk_keep = False
+        self._bulk_errors = None
+        self._bulk_results = None
+        self._bulk_size = None
+        self._bulk_size_current = None
 
-    async def execute(self, *args):
+    @contextlib.asynccontextmanager
+    async def pipeline(self, transaction=False, bulk_size=5000):
+        """
+        Queue commands in a block and collect their replies.
+
+        Commands are sent in batches of bulk_size, the rest is sent when
+        the block exits. If the block raises, a transaction is discarded
+        and the replies of already queued commands are dropped. On a
+        multiplexed client other coroutines keep using the connection, a
+        transaction is then sent as a whole when the block exits.
+
+        Args:
+            transaction: If True, wrap the commands in MULTI/EXEC.
+            bulk_size: Maximum commands to queue before reading responses.
+
+        Yields:
+            AsyncPipeline, its result holds the replies once the block
+            exited.
+        """
+        if self._multiplex:
+            batch = _MultiplexBatch(
+                self._conn, None if transaction else bulk_size
+            )
+            pipe = AsyncPipeline(batch)
+            if transaction:
+                await batch.execute("MULTI")
+            try:
+                yield pipe
+            except BaseException:
+                if not transaction:
+                    await batch.fetch()
+                raise
+            if transaction:
+                await batch.execute("EXEC")
+            await batch.fetch()
+            pipe._finish(batch.results, transaction=transaction)
+            return
+        self.bulk_start(bulk_size=bulk_size)
+        pipe = AsyncPipeline(self)
+        try:
+            if transaction:
+                await self._execute_bulk("MULTI")
+            yield pipe
+            if transaction:
+                await self._execute_bulk("EXEC")
+        except BaseException:
+            try:
+                if transaction:
+                    await self._execute_bulk("DISCARD")
+                await self._bulk_fetch()
+            except Exception:
+                await self.close()
+            finally:
+                self._bulk_reset()
+            raise
+        pipe._finish(await self.bulk_stop(), transaction=transaction)
+
+    async def execute(
+        self,
+        *args,
+        stream=False,
+        timeout=None,
+        deadline=None,
+        block=None
+    ):
         """
         Asynchronously execute a Redis command.
 
         Args:
             *args: Command name and positional arguments.
+            stream: If True, return an async iterator yielding the elements
+                of an aggregate reply as they are parsed off the stream. The
+                connection is reserved until the iterator is drained.
+            timeout: Seconds the whole call, including connect, write and
+                read, may take.
+            deadline: time.monotonic() value the call has to finish by.
+            block: Server side blocking time of the command in seconds,
+                extends the deadline. timeout, deadline and block cannot be
+                combined with stream.
 
         Returns:
             Parsed Redis reply.
         """
+        deadline = get_deadline(
+            timeout=timeout,
+            deadline=deadline,
+            block=block,
+            read_timeout=self._conn.read_timeout
+        )
+        if stream and deadline is not None:
+            # The deadline would end before the stream is consumed.
+            raise PyRedisError(
+                "timeout, deadline and block are not supported with stream"
+            )
+        if deadline is None:
+            return await self._execute(*args, stream=stream)
+        async with self._conn.deadline(deadline):
+            return await self._execute(*args, stream=stream)
+
+    async def _execute(self, *args, stream=False):
+        if self._multiplex:
+            if stream:
+                raise PyRedisError("stream is not supported with multiplex")
+            return await self._conn.request(*args)
+        if self._bulk:
+            if stream:
+                raise PyRedisError("stream is not supported in bulk mode")
+            await self._execute_bulk(*args)
+            return None
         await self._conn.write(*args)
+        if stream:
+            return await self._conn.read_iter()
+        return await self._conn.read()
+
+    async def get_into(self, key, target):
+        """
+        Asynchronously stream the value of key into a buffer or file.
+
+        Args:
+            key: Key to fetch.
+            target: Writable buffer (bytearray, mmap, memoryview) large
+                enough for the value, or a file-like object with write().
+
+        Returns:
+            Number of bytes written, or None if the key does not exist.
+        """
+        if self._multiplex:
+            raise PyRedisError("get_into is not supported with multiplex")
+        if self._bulk:
+            raise PyRedisError("get_into is not supported in bulk mode")
+        await self._conn.write(b"GET", key)
+        return await self._conn.read_into(target)
+
+    async def set_from(self, key, source, *args, length=None):
+        """
+        Asynchronously stream the value of key from a buffer or file into SET.
+
+        Args:
+            key: Key to set.
+            source: Buffer (bytes, bytearray, mmap) or readable file-like
+                object providing the value.
+            *args: Additional SET options, e.g. "EX", 60.
+            length: Number of bytes to send. Required for unseekable
+                file-like objects.
+
+        Returns:
+            Parsed Redis reply.
+        """
+        if self._multiplex:
+            raise PyRedisError("set_from is not supported with multiplex")
+        if self._bulk:
+            raise PyRedisError("set_from is not supported in bulk mode")
+        await self._conn.write_stream(
+            (b"SET", key), source, tail=args, length=length
+        )
         return await self._conn.read()
 
     async def close(self):
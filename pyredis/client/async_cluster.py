@@ -1,9 +1,44 @@
+import asyncio
+import contextlib
+
 from pyredis import commands
 import pyredis.client
+from pyredis.client.pipeline import AsyncPipeline
+from pyredis.client.pipeline import cluster_replies
+from pyredis.client.pipeline import cluster_requests
 from pyredis.exceptions import PyRedisConnError
 from pyredis.exceptions import PyRedisConnReadTimeout
 from pyredis.exceptions import PyRedisError
 from pyredis.exceptions import ReplyError
+from pyredis.helper import merge_multi_key
+from pyredis.helper import parse_redirect
+from pyredis.helper import split_multi_key
+
+
+class _AsyncClusterBatch(object):
+    """
+    Commands of an async cluster pipeline, sent per node every bulk_size
+    commands.
+    """
+
+    def __init__(self, client, bulk_size):
+        self._cluster = True
+        self._client = client
+        self._bulk_size = bulk_size
+        self._commands = list()
+        self.results = list()
+
+    async def execute(self, *args, shard_key=None, sock=None, **kwargs):
+        if not bool(shard_key) != bool(sock):
+            raise PyRedisError("Ether shard_key or sock has to be provided")
+        self._commands.append((args, shard_key, sock))
+        if len(self._commands) == self._bulk_size:
+            await self.fetch()
+
+    async def fetch(self):
+        commands = self._commands
+        self._commands = list()
+        self.results.extend(await self._client._execute_pipeline(commands))
 
 
 class AsyncClusterClient(
@@ -37,6 +72,13 @@ class AsyncClusterClient(
         read_timeout=2,
         cluster_map=None,
         username=None,
+        read_buffer_size=16384,
+        max_read_buffer=1048576,
+        socket_options=None,
+        transport="stream",
+        auto_pipeline=False,
+        pipeline_max_batch=None,
+        pipeline_delay=0,
     ):
         """
         Initialize the AsyncClusterClient.
@@ -51,6 +93,17 @@ class AsyncClusterClient(
             read_timeout: Read timeout in seconds.
             cluster_map: Optional pre-configured AsyncClusterMap instance.
             username: Optional username for Redis ACL authentication.
+            read_buffer_size: Initial receive buffer size of connections.
+            max_read_buffer: Maximum receive buffer size of connections.
+            socket_options: Dict of socket options applied to connections.
+            transport: Transport of connections, "stream" or "protocol".
+            auto_pipeline: If True, the client may be shared by concurrent
+                coroutines and the commands of one event loop iteration are
+                written to each node in a single write.
+            pipeline_max_batch: Number of queued commands per node that
+                triggers a write right away.
+            pipeline_delay: Seconds to wait for more commands before a
+                batch is written.
         """
         super().__init__()
         if not bool(seeds) != bool(cluster_map):
@@ -69,6 +122,13 @@ class AsyncClusterClient(
             self._map = pyredis.client.AsyncClusterMap(seeds=seeds)
         self._map_id = self._map.id
         self._username = username
+        self._read_buffer_size = read_buffer_size
+        self._max_read_buffer = max_read_buffer
+        self._socket_options = socket_options
+        self._transport = transport
+        self._auto_pipeline = auto_pipeline
+        self._pipeline_max_batch = pipeline_max_batch
+        self._pipeline_delay = pipeline_delay
 
     async def _cleanup_conns(self):
         hosts = self._map.hosts(slave=self._slave_ok)
@@ -93,6 +153,13 @@ class AsyncClusterClient(
             password=self._password,
             database=self._database,
             username=self._username,
+            read_buffer_size=self._read_buffer_size,
+            max_read_buffer=self._max_read_buffer,
+            socket_options=self._socket_options,
+            transport=self._transport,
+            auto_pipeline=self._auto_pipeline,
+            pipeline_max_batch=self._pipeline_max_batch,
+            pipeline_delay=self._pipeline_delay,
         )
         self._conns[sock] = client
 
@@ -122,13 +189,151 @@ class AsyncClusterClient(
         """
         return False
 
+    async def _execute_basic(self, *args, conn, asking=False):
+        if asking:
+            args = ["ASKING", *args]
+        if self._auto_pipeline:
+            return await conn.request(*args)
+        await conn.write(*args)
+        return await conn.read()
+
+    async def _send_requests(self, conns, requests, deadline):
+        # Multiplexed connections are shared with other callers, every node
+        # gets its batch with request_many() and the nodes are awaited
+        # together. Otherwise all batches are written before any is read.
+        if self._auto_pipeline:
+            targets = list(requests)
+            results = await asyncio.gather(
+                *(self._request_many(conns[target], requests[target], deadline)
+                  for target in targets),
+                return_exceptions=True
+            )
+            replies = dict()
+            failed = None
+            for target, result in zip(targets, results):
+                if isinstance(result, BaseException):
+                    failed = failed or result
+                    if self._conns.get(target) is conns[target]:
+                        del self._conns[target]
+                    await conns[target].close()
+                else:
+                    replies[target] = result
+            if failed is not None:
+                raise failed
+            return replies
+        replies = dict()
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                if deadline is not None:
+                    for conn in conns.values():
+                        await stack.enter_async_context(
+                            conn.deadline(deadline)
+                        )
+                for target, request in requests.items():
+                    for args in request:
+                        conns[target].queue(*args)
+                    await conns[target].flush()
+                for target, request in requests.items():
+                    replies[target] = await conns[target].read_many(
+                        len(request)
+                    )
+        except (PyRedisConnError, PyRedisConnReadTimeout):
+            # Nodes whose replies were not read are out of sync.
+            for target in requests:
+                if target not in replies:
+                    if self._conns.get(target) is conns[target]:
+                        del self._conns[target]
+                    await conns[target].close()
+            raise
+        return replies
+
+    @staticmethod
+    async def _request_many(conn, request, deadline):
+        if deadline is None:
+            return await conn.request_many(request)
+        async with conn.deadline(deadline):
+            return await conn.request_many(request)
+
+    async def _execute_pipeline(self, commands, retries=3, deadline=None):
+        # Commands are (args, shard_key, sock) tuples. Every round sends one
+        # batch per node and reads the batches back, only commands answered
+        # with MOVED or ASK take part in the next round.
+        results = [None] * len(commands)
+        pending = range(len(commands))
+        asking = dict()
+        while pending:
+            batches = dict()
+            for index in pending:
+                args, shard_key, sock = commands[index]
+                target = asking.get(index) or sock
+                if not target:
+                    target = await self._get_slot_info(shard_key)
+                batches.setdefault(target, list()).append(index)
+            requests = cluster_requests(commands, batches, asking)
+            conns = dict()
+            for target in requests:
+                if target not in self._conns.keys():
+                    await self._connect(target)
+                conns[target] = self._conns[target]
+            try:
+                replies = await self._send_requests(conns, requests, deadline)
+            except (PyRedisConnError, PyRedisConnReadTimeout):
+                self._map.refresh()
+                raise
+            pending, moved, asking = cluster_replies(
+                commands, batches, asking, replies, results
+            )
+            retries -= 1
+            if pending and retries < 1:
+                for index in pending:
+                    results[index] = PyRedisError(
+                        "Slot moved to often or wrong shard_key, giving up,"
+                    )
+                break
+            for slot, node in moved.items():
+                self._map.moved(slot, node)
+        return results
+
+    @contextlib.asynccontextmanager
+    async def pipeline(self, transaction=False, bulk_size=5000):
+        """
+        Queue commands in a block and collect their replies.
+
+        Queued commands are grouped by the node serving their slot and sent
+        as one pipelined batch per node, every bulk_size commands and when
+        the block exits. Replies are returned in the order the commands were
+        queued. Only commands redirected by MOVED or ASK are sent again,
+        MOVED right away to the node named in the reply. If the block
+        raises, commands not sent yet are dropped.
+
+        Args:
+            transaction: Not supported, transactions cannot span nodes.
+            bulk_size: Maximum commands to queue before sending them.
+
+        Yields:
+            AsyncPipeline, its result holds the replies once the block
+            exited.
+        """
+        if transaction:
+            raise PyRedisError(
+                "Transactions are not supported by AsyncClusterClient"
+            )
+        batch = _AsyncClusterBatch(self, bulk_size)
+        pipe = AsyncPipeline(batch)
+        yield pipe
+        await batch.fetch()
+        pipe._finish(batch.results)
+
     async def execute(
         self,
         *args,
         shard_key=None,
         sock=None,
         asking=False,
-        retries=3
+        retries=3,
+        timeout=None,
+        deadline=None,
+        block=None
     ):
         """
         Execute a Redis command on the appropriate cluster node asynchronously.
@@ -139,24 +344,48 @@ class AsyncClusterClient(
             sock: Optional explicit socket identifier (host_port) to route to.
             asking: Flag indicating if this is an ASKING command redirection.
             retries: Number of retries on slot redirection before failing.
+            timeout: Seconds the whole call, including connect, write and
+                read, may take.
+            deadline: time.monotonic() value the call has to finish by.
+            block: Server side blocking time of the command in seconds,
+                extends the deadline.
 
         Returns:
-            The Redis command response.
+            The Redis command response. MGET, MSET, DEL, EXISTS, TOUCH and
+            UNLINK with keys of several slots are split per slot and sent
+            as one pipelined batch per node, counts are summed and MGET
+            values returned in key order.
         """
         if not bool(shard_key) != bool(sock):
             raise PyRedisError("Ether shard_key or sock has to be provided")
+        deadline = pyredis.client.get_deadline(
+            timeout=timeout,
+            deadline=deadline,
+            block=block,
+            read_timeout=self._read_timeout
+        )
+        if shard_key and not asking:
+            parts = split_multi_key(args)
+            if parts is not None:
+                replies = await self._execute_pipeline(
+                    [
+                        (part_args, part_args[1], None)
+                        for _, part_args, _ in parts
+                    ],
+                    retries=retries,
+                    deadline=deadline
+                )
+                return merge_multi_key(parts, replies)
         if not sock:
             sock = await self._get_slot_info(shard_key)
         if sock not in self._conns.keys():
             await self._connect(sock)
+        conn = self._conns[sock]
         try:
-            if asking:
-                await self._conns[sock].write(
-                    *["ASKING", *args]
-                )
-            else:
-                await self._conns[sock].write(*args)
-            return await self._conns[sock].read()
+            if deadline is None:
+                return await self._execute_basic(*args, conn=conn, asking=asking)
+            async with conn.deadline(deadline):
+                return await self._execute_basic(*args, conn=conn, asking=asking)
         except ReplyError as err:
             errstr = str(err)
             if retries <= 1 and (
@@ -171,12 +400,12 @@ class AsyncClusterClient(
                         f"Explicitly set socket, but key does "
                         f"not belong to this redis: {sock}"
                     )
-                self._map_id = await self._map.update(self._map_id)
-                await self._cleanup_conns()
+                self._map.moved(*parse_redirect(errstr))
                 return await self.execute(
                     *args,
                     shard_key=shard_key,
-                    retries=retries - 1
+                    retries=retries - 1,
+                    deadline=deadline
                 )
             elif errstr.startswith("ASK"):
                 sock = errstr.split()[2].replace(
@@ -187,12 +416,15 @@ class AsyncClusterClient(
                     *args,
                     sock=sock,
                     retries=retries - 1,
-                    asking=True
+                    asking=True,
+                    deadline=deadline
                 )
             else:
                 raise err
         except (PyRedisConnError, PyRedisConnReadTimeout) as err:
-            await self._conns[sock].close()
-            del self._conns[sock]
-            await self._map.update(self._map_id)
+            # Concurrent callers on the same node fail together.
+            if self._conns.get(sock) is conn:
+                del self._conns[sock]
+            await conn.close()
+            self._map.refresh()
             raise err
@@ -10,7 +10,7 @@ class AsyncSentinelClient(object):
     Handles connectivity to Sentinel nodes and master/slave service discovery asynchronously.
     """
 
-    def __init__(self, sentinels, password=None, username=None):
+    def __init__(self, sentinels, password=None, username=None, socket_options=None):
         """
         Initialize the AsyncSentinelClient.
 
@@ -18,11 +18,13 @@ class AsyncSentinelClient(object):
             sentinels: List of (host, port) tuples representing the Sentinel nodes.
             password: Optional password for Sentinel authentication.
             username: Optional username for Sentinel ACL authentication.
+            socket_options: Dict of socket options applied to connections.
         """
         self._conn = None
         self._sentinels = deque(sentinels)
         self._password = password
         self._username = username
+        self._socket_options = socket_options
 
     async def _sentinel_connect(self, sentinel):
         host, port = sentinel
@@ -33,6 +35,7 @@ class AsyncSentinelClient(object):
             sentinel=True,
             password=self._password,
             username=self._username,
+            socket_options=self._socket_options,
         )
         try:
             await self.execute("PING")
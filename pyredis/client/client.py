@@ -1,5 +1,8 @@
+import contextlib
+
 from pyredis import commands
 import pyredis.client
+from pyredis.client.pipeline import Pipeline
 from pyredis.exceptions import PyRedisError
 
 
@@ -35,66 +38,207 @@ class Client(
         self._conn = pyredis.client.Connection(**kwargs)
         self._bulk = False
         self._bulk_keep = False
+        self._bulk_errors = None
         self._bulk_results = None
         self._bulk_size = None
         self._bulk_size_current = None
+        self._bulk_window = None
+        self._bulk_outstanding = 0
+        self._bulk_noreply = False
 
     def _bulk_fetch(self):
-        while self._bulk_size_current != 0:
-            result = self._conn.read(raise_on_result_err=False)
-            self._bulk_size_current -= 1
-            if self._bulk_keep:
-                self._bulk_results.append(result)
+        self._conn.flush()
+        if self._bulk_noreply:
+            self._bulk_size_current = 0
+            return
+        self._bulk_read(self._bulk_size_current + self._bulk_outstanding)
+        self._bulk_size_current = 0
+        self._bulk_outstanding = 0
+
+    def _bulk_read(self, count):
+        # Replies that are not kept are skipped unparsed, only errors are
+        # counted.
+        if self._bulk_keep:
+            self._bulk_results.extend(self._conn.read_many(count))
+            return
+        errors = self._conn.skip_many(count)
+        if self._bulk_errors is not None:
+            self._bulk_errors += errors
+
+    def _bulk_send(self):
+        # Sliding window: send the queued commands, collect the replies
+        # that already arrived and only wait for replies while more than
+        # window commands are in flight.
+        self._conn.flush()
+        self._bulk_outstanding += self._bulk_size_current
+        self._bulk_size_current = 0
+        # Replies are either all parsed or all skipped, the parser and
+        # skip_many() do not share the state of a partially read reply.
+        if self._bulk_keep:
+            results = self._conn.read_ready(self._bulk_outstanding)
+            self._bulk_outstanding -= len(results)
+            self._bulk_results.extend(results)
+        else:
+            skipped, errors = self._conn.skip_ready(self._bulk_outstanding)
+            self._bulk_outstanding -= skipped
+            if self._bulk_errors is not None:
+                self._bulk_errors += errors
+        excess = self._bulk_outstanding - self._bulk_window
+        if excess > 0:
+            self._bulk_read(excess)
+            self._bulk_outstanding -= excess
 
     def _execute_basic(self, *args):
         self._conn.write(*args)
         return self._conn.read()
 
     def _execute_bulk(self, *args):
-        self._conn.write(*args)
+        self._conn.queue(*args)
         self._bulk_size_current += 1
         if self._bulk_size_current == self._bulk_size:
-            self._bulk_fetch()
+            if self._bulk_window:
+                self._bulk_send()
+            else:
+                self._bulk_fetch()
 
     @property
     def bulk(self):
         """Flag indicating if bulk mode is active."""
         return self._bulk
 
-    def bulk_start(self, bulk_size=5000, keep_results=True):
+    def bulk_start(
+        self,
+        bulk_size=5000,
+        keep_results=True,
+        window=None,
+        count_errors=False,
+    ):
         """
         Start bulk command pipelining mode.
 
         Args:
             bulk_size: Maximum commands to queue before reading responses.
             keep_results: Flag indicating if responses should be returned.
+            window: Maximum commands in flight. If set, every bulk_size
+                commands are sent right away and replies are collected as
+                they arrive, waiting for the server only while more than
+                window replies are outstanding.
+            count_errors: If keep_results is False, count the failed
+                commands, bulk_stop() then returns their number.
         """
         if self.bulk:
             raise PyRedisError("Already in bulk mode")
+        if window is not None and window < bulk_size:
+            raise PyRedisError("window must not be smaller than bulk_size")
         self._bulk = True
         self._bulk_size = bulk_size
         self._bulk_size_current = 0
+        self._bulk_window = window
+        self._bulk_outstanding = 0
         if keep_results:
             self._bulk_results = []
             self._bulk_keep = True
+        elif count_errors:
+            self._bulk_errors = 0
 
     def bulk_stop(self):
         """
         Stop bulk mode and retrieve results.
 
         Returns:
-            List of execution results if keep_results was set.
+            List of execution results if keep_results was set, the number
+            of failed commands if count_errors was set.
         """
         if not self.bulk:
             raise PyRedisError("Not in bulk mode")
-        self._bulk_fetch()
-        results = self._bulk_results
+        if self._bulk_noreply:
+            raise PyRedisError("Bulk mode is controlled by noreply()")
+        try:
+            self._bulk_fetch()
+            if self._bulk_errors is not None:
+                return self._bulk_errors
+            return self._bulk_results
+        finally:
+            self._bulk_reset()
+
+    def _bulk_reset(self):
         self._bulk = False
         self._bulk_keep = False
+        self._bulk_errors = None
         self._bulk_results = None
         self._bulk_size = None
         self._bulk_size_current = None
-        return results
+        self._bulk_window = None
+        self._bulk_outstanding = 0
+        self._bulk_noreply = False
+
+    @contextlib.contextmanager
+    def noreply(self, bulk_size=5000):
+        """
+        Send the commands of a block without the server replying to them.
+
+        The block is wrapped in CLIENT REPLY OFF/ON, commands are sent every
+        bulk_size commands and no reply is read or parsed, so errors of the
+        commands are not reported. A final PING resynchronizes the
+        connection. Requires Redis 3.2 or later.
+
+        Args:
+            bulk_size: Maximum commands to queue before sending them.
+
+        Yields:
+            The client, its commands return None inside the block.
+        """
+        self.bulk_start(bulk_size=bulk_size, keep_results=False)
+        self._bulk_noreply = True
+        self._conn.queue("CLIENT", "REPLY", "OFF")
+        try:
+            yield self
+        finally:
+            try:
+                self._conn.queue("CLIENT", "REPLY", "ON")
+                self._conn.sync()
+            except Exception:
+                self.close()
+                raise
+            finally:
+                self._bulk_reset()
+
+    @contextlib.contextmanager
+    def pipeline(self, transaction=False, bulk_size=5000, window=None):
+        """
+        Queue commands in a block and collect their replies.
+
+        Commands are sent in batches of bulk_size, the rest is sent when
+        the block exits. If the block raises, a transaction is discarded
+        and the replies of already queued commands are dropped.
+
+        Args:
+            transaction: If True, wrap the commands in MULTI/EXEC.
+            bulk_size: Maximum commands to queue before reading responses.
+            window: Maximum commands in flight, see bulk_start().
+
+        Yields:
+            Pipeline, its result holds the replies once the block exited.
+        """
+        self.bulk_start(bulk_size=bulk_size, window=window)
+        pipe = Pipeline(self)
+        try:
+            if transaction:
+                self._execute_bulk("MULTI")
+            yield pipe
+            if transaction:
+                self._execute_bulk("EXEC")
+        except BaseException:
+            try:
+                if transaction:
+                    self._execute_bulk("DISCARD")
+                self._bulk_fetch()
+            except Exception:
+                self.close()
+            finally:
+                self._bulk_reset()
+            raise
+        pipe._finish(self.bulk_stop(), transaction=transaction)
 
     def close(self):
         """Close the underlying connection."""
@@ -105,16 +249,96 @@ class Client(
         """Flag indicating if connection is closed."""
         return self._conn.closed
 
-    def execute(self, *args):
+    def get_into(self, key, target):
+        """
+        Stream the value of key into a buffer or file.
+
+        The value is copied to target as it arrives from the socket, it is
+        never held in memory as a whole.
+
+        Args:
+            key: Key to fetch.
+            target: Writable buffer (bytearray, mmap, memoryview) large
+                enough for the value, or a file-like object with write().
+
+        Returns:
+            Number of bytes written, or None if the key does not exist.
+        """
+        if self._bulk:
+            raise PyRedisError("get_into is not supported in bulk mode")
+        self._conn.write(b"GET", key)
+        return self._conn.read_into(target)
+
+    def set_from(self, key, source, *args, length=None):
+        """
+        Stream the value of key from a buffer or file into SET.
+
+        Args:
+            key: Key to set.
+            source: Buffer (bytes, bytearray, mmap) or readable file-like
+                object providing the value.
+            *args: Additional SET options, e.g. "EX", 60.
+            length: Number of bytes to send. Required for unseekable
+                file-like objects.
+
+        Returns:
+            Parsed Redis reply.
+        """
+        if self._bulk:
+            raise PyRedisError("set_from is not supported in bulk mode")
+        self._conn.write_stream(
+            (b"SET", key), source, tail=args, length=length
+        )
+        return self._conn.read()
+
+    def execute(
+        self,
+        *args,
+        stream=False,
+        timeout=None,
+        deadline=None,
+        block=None
+    ):
         """
         Execute a Redis command.
 
         Args:
             *args: Command name and positional arguments.
+            stream: If True, return an iterator yielding the elements of an
+                aggregate reply as they are parsed off the socket. The
+                connection is reserved until the iterator is drained.
+            timeout: Seconds the whole call, including connect, write and
+                read, may take.
+            deadline: time.monotonic() value the call has to finish by.
+            block: Server side blocking time of the command in seconds,
+                extends the deadline. timeout, deadline and block cannot be
+                combined with stream.
 
         Returns:
             Parsed Redis reply.
         """
+        deadline = pyredis.client.get_deadline(
+            timeout=timeout,
+            deadline=deadline,
+            block=block,
+            read_timeout=self._conn.read_timeout
+        )
+        if stream and deadline is not None:
+            # The deadline would end before the stream is consumed.
+            raise PyRedisError(
+                "timeout, deadline and block are not supported with stream"
+            )
+        if deadline is None:
+            return self._execute(*args, stream=stream)
+        with self._conn.deadline(deadline):
+            return self._execute(*args, stream=stream)
+
+    def _execute(self, *args, stream=False):
+        if stream:
+            if self._bulk:
+                raise PyRedisError("stream is not supported in bulk mode")
+            self._conn.write(*args)
+            return self._conn.read_iter()
         if not self._bulk:
             return self._execute_basic(*args)
         else:
@@ -1,9 +1,42 @@
+import contextlib
+
 from pyredis import commands
 import pyredis.client
+from pyredis.client.pipeline import Pipeline
+from pyredis.client.pipeline import cluster_replies
+from pyredis.client.pipeline import cluster_requests
 from pyredis.exceptions import PyRedisConnError
 from pyredis.exceptions import PyRedisConnReadTimeout
 from pyredis.exceptions import PyRedisError
 from pyredis.exceptions import ReplyError
+from pyredis.helper import merge_multi_key
+from pyredis.helper import parse_redirect
+from pyredis.helper import split_multi_key
+
+
+class _ClusterBatch(object):
+    """
+    Commands of a cluster pipeline, sent per node every bulk_size commands.
+    """
+
+    def __init__(self, client, bulk_size):
+        self._cluster = True
+        self._client = client
+        self._bulk_size = bulk_size
+        self._commands = list()
+        self.results = list()
+
+    def execute(self, *args, shard_key=None, sock=None, **kwargs):
+        if not bool(shard_key) != bool(sock):
+            raise PyRedisError("Ether shard_key or sock has to be provided")
+        self._commands.append((args, shard_key, sock))
+        if len(self._commands) == self._bulk_size:
+            self.fetch()
+
+    def fetch(self):
+        commands = self._commands
+        self._commands = list()
+        self.results.extend(self._client._execute_pipeline(commands))
 
 
 class ClusterClient(
@@ -37,6 +70,9 @@ class ClusterClient(
         read_timeout=2,
         cluster_map=None,
         username=None,
+        read_buffer_size=16384,
+        max_read_buffer=1048576,
+        socket_options=None,
     ):
         """
         Initialize the ClusterClient.
@@ -51,6 +87,9 @@ class ClusterClient(
             read_timeout: Read timeout in seconds.
             cluster_map: Optional pre-configured ClusterMap instance.
             username: Optional username for Redis ACL authentication.
+            read_buffer_size: Initial receive buffer size of connections.
+            max_read_buffer: Maximum receive buffer size of connections.
+            socket_options: Dict of socket options applied to connections.
         """
         super().__init__()
         if not bool(seeds) != bool(cluster_map):
@@ -69,6 +108,9 @@ class ClusterClient(
             self._map = pyredis.client.ClusterMap(seeds=seeds)
         self._map_id = self._map.id
         self._username = username
+        self._read_buffer_size = read_buffer_size
+        self._max_read_buffer = max_read_buffer
+        self._socket_options = socket_options
 
     def _cleanup_conns(self):
         hosts = self._map.hosts(slave=self._slave_ok)
@@ -93,6 +135,9 @@ class ClusterClient(
             password=self._password,
             database=self._database,
             username=self._username,
+            read_buffer_size=self._read_buffer_size,
+            max_read_buffer=self._max_read_buffer,
+            socket_options=self._socket_options,
         )
         self._conns[sock] = client
 
@@ -122,13 +167,110 @@ class ClusterClient(
         """
         return False
 
+    @staticmethod
+    def _execute_basic(*args, conn, asking=False):
+        if asking:
+            conn.write(
+                *["ASKING", *args]
+            )
+        else:
+            conn.write(*args)
+        return conn.read()
+
+    def _execute_pipeline(self, commands, retries=3, deadline=None):
+        # Commands are (args, shard_key, sock) tuples. Every round sends one
+        # batch per node and reads the batches back, only commands answered
+        # with MOVED or ASK take part in the next round.
+        results = [None] * len(commands)
+        pending = range(len(commands))
+        asking = dict()
+        while pending:
+            batches = dict()
+            for index in pending:
+                args, shard_key, sock = commands[index]
+                target = asking.get(index) or sock
+                if not target:
+                    target = self._get_slot_info(shard_key)
+                batches.setdefault(target, list()).append(index)
+            requests = cluster_requests(commands, batches, asking)
+            for target in requests:
+                if target not in self._conns.keys():
+                    self._connect(target)
+            replies = dict()
+            try:
+                with contextlib.ExitStack() as stack:
+                    if deadline is not None:
+                        for target in requests:
+                            stack.enter_context(
+                                self._conns[target].deadline(deadline)
+                            )
+                    for target, request in requests.items():
+                        conn = self._conns[target]
+                        for args in request:
+                            conn.queue(*args)
+                        conn.flush()
+                    for target, request in requests.items():
+                        replies[target] = self._conns[target].read_many(
+                            len(request)
+                        )
+            except (PyRedisConnError, PyRedisConnReadTimeout):
+                # Nodes whose replies were not read are out of sync.
+                for target in requests:
+                    if target not in replies and target in self._conns:
+                        self._conns.pop(target).close()
+                self._map.refresh()
+                raise
+            pending, moved, asking = cluster_replies(
+                commands, batches, asking, replies, results
+            )
+            retries -= 1
+            if pending and retries < 1:
+                for index in pending:
+                    results[index] = PyRedisError(
+                        "Slot moved to often or wrong shard_key, giving up,"
+                    )
+                break
+            for slot, node in moved.items():
+                self._map.moved(slot, node)
+        return results
+
+    @contextlib.contextmanager
+    def pipeline(self, transaction=False, bulk_size=5000):
+        """
+        Queue commands in a block and collect their replies.
+
+        Queued commands are grouped by the node serving their slot and sent
+        as one pipelined batch per node, every bulk_size commands and when
+        the block exits. Replies are returned in the order the commands were
+        queued. Only commands redirected by MOVED or ASK are sent again,
+        MOVED right away to the node named in the reply. If the block
+        raises, commands not sent yet are dropped.
+
+        Args:
+            transaction: Not supported, transactions cannot span nodes.
+            bulk_size: Maximum commands to queue before sending them.
+
+        Yields:
+            Pipeline, its result holds the replies once the block exited.
+        """
+        if transaction:
+            raise PyRedisError("Transactions are not supported by ClusterClient")
+        batch = _ClusterBatch(self, bulk_size)
+        pipe = Pipeline(batch)
+        yield pipe
+        batch.fetch()
+        pipe._finish(batch.results)
+
     def execute(
         self,
         *args,
         shard_key=None,
         sock=None,
         asking=False,
-        retries=3
+        retries=3,
+        timeout=None,
+        deadline=None,
+        block=None
     ):
         """
         Execute a Redis command on the appropriate cluster node.
@@ -139,24 +281,48 @@ class ClusterClient(
             sock: Optional explicit socket identifier (host_port) to route to.
             asking: Flag indicating if this is an ASKING command redirection.
             retries: Number of retries on slot redirection before failing.
+            timeout: Seconds the whole call, including connect, write and
+                read, may take.
+            deadline: time.monotonic() value the call has to finish by.
+            block: Server side blocking time of the command in seconds,
+                extends the deadline.
 
         Returns:
-            The Redis command response.
+            The Redis command response. MGET, MSET, DEL, EXISTS, TOUCH and
+            UNLINK with keys of several slots are split per slot and sent
+            as one pipelined batch per node, counts are summed and MGET
+            values returned in key order.
         """
         if not bool(shard_key) != bool(sock):
             raise PyRedisError("Ether shard_key or sock has to be provided")
+        deadline = pyredis.client.get_deadline(
+            timeout=timeout,
+            deadline=deadline,
+            block=block,
+            read_timeout=self._read_timeout
+        )
+        if shard_key and not asking:
+            parts = split_multi_key(args)
+            if parts is not None:
+                replies = self._execute_pipeline(
+                    [
+                        (part_args, part_args[1], None)
+                        for _, part_args, _ in parts
+                    ],
+                    retries=retries,
+                    deadline=deadline
+                )
+                return merge_multi_key(parts, replies)
         if not sock:
             sock = self._get_slot_info(shard_key)
         if sock not in self._conns.keys():
             self._connect(sock)
+        conn = self._conns[sock]
         try:
-            if asking:
-                self._conns[sock].write(
-                    *["ASKING", *args]
-                )
-            else:
-                self._conns[sock].write(*args)
-            return self._conns[sock].read()
+            if deadline is None:
+                return self._execute_basic(*args, conn=conn, asking=asking)
+            with conn.deadline(deadline):
+                return self._execute_basic(*args, conn=conn, asking=asking)
         except ReplyError as err:
             errstr = str(err)
             if retries <= 1 and (
@@ -171,12 +337,12 @@ class ClusterClient(
                         f"Explicitly set socket, but key does "
                         f"not belong to this redis: {sock}"
                     )
-                self._map_id = self._map.update(self._map_id)
-                self._cleanup_conns()
+                self._map.moved(*parse_redirect(errstr))
                 return self.execute(
                     *args,
                     shard_key=shard_key,
-                    retries=retries - 1
+                    retries=retries - 1,
+                    deadline=deadline
                 )
             elif errstr.startswith("ASK"):
                 sock = errstr.split()[2].replace(
@@ -187,12 +353,13 @@ class ClusterClient(
                     *args,
                     sock=sock,
                     retries=retries - 1,
-                    asking=True
+                    asking=True,
+                    deadline=deadline
                 )
             else:
                 raise err
         except (PyRedisConnError, PyRedisConnReadTimeout) as err:
             self._conns[sock].close()
             del self._conns[sock]
-            self._map.update(self._map_id)
+            self._map.refresh()
             raise err
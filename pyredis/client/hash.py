@@ -1,8 +1,14 @@
+import contextlib
+
 from pyredis import commands
 import pyredis.client
+from pyredis.client.pipeline import Pipeline
 from pyredis.exceptions import PyRedisConnError
 from pyredis.exceptions import PyRedisError
+from pyredis.helper import get_deadline
+from pyredis.helper import merge_multi_key
 from pyredis.helper import slot_from_key
+from pyredis.helper import split_multi_key
 
 
 class HashClient(
@@ -35,6 +41,9 @@ class HashClient(
         conn_timeout=2,
         read_timeout=2,
         username=None,
+        read_buffer_size=16384,
+        max_read_buffer=1048576,
+        socket_options=None,
     ):
         """
         Initialize the HashClient.
@@ -47,16 +56,21 @@ class HashClient(
             conn_timeout: Connection timeout in seconds.
             read_timeout: Read timeout in seconds.
             username: Optional username for Redis ACL authentication.
+            read_buffer_size: Initial receive buffer size of connections.
+            max_read_buffer: Maximum receive buffer size of connections.
+            socket_options: Dict of socket options applied to connections.
         """
         super().__init__()
         self._conns = dict()
         self._conn_names = list()
         self._bulk = False
         self._bulk_keep = False
+        self._bulk_errors = None
         self._bulk_results = None
         self._bulk_size = None
         self._bulk_size_current = None
         self._bulk_bucket_order = list()
+        self._bulk_noreply = False
         self._closed = False
         self._cluster = True
         self._map = dict()
@@ -68,24 +82,58 @@ class HashClient(
             conn_timeout=conn_timeout,
             read_timeout=read_timeout,
             username=username,
+            read_buffer_size=read_buffer_size,
+            max_read_buffer=max_read_buffer,
+            socket_options=socket_options,
         )
         self._init_map()
 
     def _bulk_fetch(self):
+        counts = dict()
         for conn in self._bulk_bucket_order:
-            result = conn.read(raise_on_result_err=False)
-            if self._bulk_keep:
-                self._bulk_results.append(result)
+            counts[conn] = counts.get(conn, 0) + 1
+        for conn in counts:
+            conn.flush()
+        if self._bulk_noreply:
+            self._bulk_bucket_order = list()
+            self._bulk_size_current = 0
+            return
+        if self._bulk_keep:
+            replies = {
+                conn: iter(conn.read_many(count))
+                for conn, count in counts.items()
+            }
+            for conn in self._bulk_bucket_order:
+                self._bulk_results.append(next(replies[conn]))
+        else:
+            # Replies that are not kept are skipped unparsed, only errors
+            # are counted.
+            for conn, count in counts.items():
+                errors = conn.skip_many(count)
+                if self._bulk_errors is not None:
+                    self._bulk_errors += errors
         self._bulk_bucket_order = list()
         self._bulk_size_current = 0
 
+    def _execute(self, *args, conn):
+        if not self._bulk:
+            return self._execute_basic(
+                *args,
+                conn=conn
+            )
+        else:
+            self._execute_bulk(
+                *args,
+                conn=conn
+            )
+
     @staticmethod
     def _execute_basic(*args, conn):
         conn.write(*args)
         return conn.read()
 
     def _execute_bulk(self, *args, conn):
-        conn.write(*args)
+        conn.queue(*args)
         self._bulk_size_current += 1
         self._bulk_bucket_order.append(conn)
         if self._bulk_size_current == self._bulk_size:
@@ -100,6 +148,9 @@ class HashClient(
         conn_timeout,
         read_timeout,
         username,
+        read_buffer_size,
+        max_read_buffer,
+        socket_options,
     ):
         for bucket in buckets:
             host, port = bucket
@@ -114,6 +165,9 @@ class HashClient(
                 conn_timeout=conn_timeout,
                 read_timeout=read_timeout,
                 username=username,
+                read_buffer_size=read_buffer_size,
+                max_read_buffer=max_read_buffer,
+                socket_options=socket_options,
             )
 
     def _init_map(self):
@@ -131,13 +185,15 @@ class HashClient(
         """Flag indicating if bulk mode is active."""
         return self._bulk
 
-    def bulk_start(self, bulk_size=5000, keep_results=True):
+    def bulk_start(self, bulk_size=5000, keep_results=True, count_errors=False):
         """
         Start bulk command pipelining mode.
 
         Args:
             bulk_size: Maximum commands to queue before reading responses.
             keep_results: Flag indicating if responses should be returned.
+            count_errors: If keep_results is False, count the failed
+                commands, bulk_stop() then returns their number.
         """
         if self.bulk:
             raise PyRedisError("Already in bulk mode")
@@ -147,24 +203,103 @@ class HashClient(
         if keep_results:
             self._bulk_results = []
             self._bulk_keep = True
+        elif count_errors:
+            self._bulk_errors = 0
 
     def bulk_stop(self):
         """
         Stop bulk mode and retrieve results.
 
         Returns:
-            List of execution results if keep_results was set.
+            List of execution results if keep_results was set, the number
+            of failed commands if count_errors was set.
         """
         if not self.bulk:
             raise PyRedisError("Not in bulk mode")
-        self._bulk_fetch()
-        results = self._bulk_results
+        if self._bulk_noreply:
+            raise PyRedisError("Bulk mode is controlled by noreply()")
+        try:
+            self._bulk_fetch()
+            if self._bulk_errors is not None:
+                return self._bulk_errors
+            return self._bulk_results
+        finally:
+            self._bulk_reset()
+
+    def _bulk_reset(self):
         self._bulk = False
         self._bulk_keep = False
+        self._bulk_errors = None
         self._bulk_results = None
         self._bulk_size = None
         self._bulk_size_current = None
-        return results
+        self._bulk_bucket_order = list()
+        self._bulk_noreply = False
+
+    @contextlib.contextmanager
+    def noreply(self, bulk_size=5000):
+        """
+        Send the commands of a block without the servers replying to them.
+
+        Every bucket connection is wrapped in CLIENT REPLY OFF/ON, commands
+        are sent every bulk_size commands and no reply is read or parsed,
+        so errors of the commands are not reported. A final PING per bucket
+        resynchronizes the connections. Requires Redis 3.2 or later.
+
+        Args:
+            bulk_size: Maximum commands to queue before sending them.
+
+        Yields:
+            The client, its commands return None inside the block.
+        """
+        self.bulk_start(bulk_size=bulk_size, keep_results=False)
+        self._bulk_noreply = True
+        for conn in self._conns.values():
+            conn.queue("CLIENT", "REPLY", "OFF")
+        try:
+            yield self
+        finally:
+            try:
+                for conn in self._conns.values():
+                    conn.queue("CLIENT", "REPLY", "ON")
+                    conn.sync()
+            except Exception:
+                self.close()
+                raise
+            finally:
+                self._bulk_reset()
+
+    @contextlib.contextmanager
+    def pipeline(self, transaction=False, bulk_size=5000):
+        """
+        Queue commands in a block and collect their replies.
+
+        Commands are sent to their buckets in batches of bulk_size, the
+        rest is sent when the block exits. Replies keep the order the
+        commands were queued in.
+
+        Args:
+            transaction: Not supported, transactions cannot span buckets.
+            bulk_size: Maximum commands to queue before reading responses.
+
+        Yields:
+            Pipeline, its result holds the replies once the block exited.
+        """
+        if transaction:
+            raise PyRedisError("Transactions are not supported by HashClient")
+        self.bulk_start(bulk_size=bulk_size)
+        pipe = Pipeline(self)
+        try:
+            yield pipe
+        except BaseException:
+            try:
+                self._bulk_fetch()
+            except Exception:
+                self.close()
+            finally:
+                self._bulk_reset()
+            raise
+        pipe._finish(self.bulk_stop())
 
     def close(self):
         """Close all connections to the server buckets."""
@@ -177,7 +312,38 @@ class HashClient(
         """Flag indicating if the client connections are closed."""
         return self._closed
 
-    def execute(self, *args, shard_key=None, sock=None):
+    def _execute_split(self, parts, timeout, deadline, block):
+        # Every bucket gets its part before any reply is read.
+        conns = [self._conns[bucket] for bucket, _, _ in parts]
+        deadline = get_deadline(
+            timeout=timeout,
+            deadline=deadline,
+            block=block,
+            read_timeout=conns[0].read_timeout
+        )
+        try:
+            with contextlib.ExitStack() as stack:
+                if deadline is not None:
+                    for conn in conns:
+                        stack.enter_context(conn.deadline(deadline))
+                for conn, (_, args, _) in zip(conns, parts):
+                    conn.write(*args)
+                return [
+                    conn.read(raise_on_result_err=False) for conn in conns
+                ]
+        except PyRedisConnError as err:
+            self.close()
+            raise err
+
+    def execute(
+        self,
+        *args,
+        shard_key=None,
+        sock=None,
+        timeout=None,
+        deadline=None,
+        block=None
+    ):
         """
         Execute a command on the appropriate bucket.
 
@@ -185,26 +351,55 @@ class HashClient(
             *args: Command name and arguments.
             shard_key: Key used to calculate the slot and route the command.
             sock: Optional explicit socket name/bucket to route to.
+            timeout: Seconds the whole call, including connect, write and
+                read, may take.
+            deadline: time.monotonic() value the call has to finish by.
+            block: Server side blocking time of the command in seconds,
+                extends the deadline.
 
         Returns:
-            The Redis command response, or None if in bulk mode.
+            The Redis command response, or None if in bulk mode. MGET,
+            MSET, DEL, EXISTS, TOUCH and UNLINK with keys of several buckets
+            are split per bucket, counts are summed and MGET values returned
+            in key order.
+
+        Raises:
+            PyRedisError: If such a command spans several buckets in bulk
+                mode.
         """
         if not bool(shard_key) != bool(sock):
             raise PyRedisError("Ether shard_key or sock has to be provided")
+        if shard_key:
+            parts = split_multi_key(args, route=self._map.__getitem__)
+            if parts is not None:
+                if self._bulk:
+                    raise PyRedisError(
+                        "Multi key commands spanning several buckets are not "
+                        "supported in bulk mode"
+                    )
+                return merge_multi_key(
+                    parts,
+                    self._execute_split(
+                        parts,
+                        timeout=timeout,
+                        deadline=deadline,
+                        block=block
+                    )
+                )
         if not sock:
             sock = self._map[slot_from_key(shard_key)]
         conn = self._conns[sock]
+        deadline = get_deadline(
+            timeout=timeout,
+            deadline=deadline,
+            block=block,
+            read_timeout=conn.read_timeout
+        )
         try:
-            if not self._bulk:
-                return self._execute_basic(
-                    *args,
-                    conn=conn
-                )
-            else:
-                self._execute_bulk(
-                    *args,
-                    conn=conn
-                )
+            if deadline is None:
+                return self._execute(*args, conn=conn)
+            with conn.deadline(deadline):
+                return self._execute(*args, conn=conn)
         except PyRedisConnError as err:
             self.close()
             raise err
@@ -0,0 +1,243 @@
+from pyredis import commands
+from pyredis.exceptions import PyRedisError
+from pyredis.exceptions import ReplyError
+from pyredis.helper import parse_redirect
+
+
+class PipelineResult(object):
+    """
+    Replies of a finished pipeline, in the order the commands were queued.
+
+    Indexing and iterating return the raw replies, failed commands are
+    represented by their exception instance. get() raises it instead.
+    """
+
+    def __init__(self, values):
+        """
+        Initialize the result.
+
+        Args:
+            values: List of replies, errors as exception instances.
+        """
+        self._values = values
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __repr__(self):
+        return f"PipelineResult({self._values!r})"
+
+    @property
+    def values(self):
+        """List of replies, errors as exception instances."""
+        return self._values
+
+    @property
+    def errors(self):
+        """List of (index, exception) tuples of the failed commands."""
+        return [
+            (index, value) for index, value in enumerate(self._values)
+            if isinstance(value, Exception)
+        ]
+
+    @property
+    def ok(self):
+        """True if no command failed."""
+        return not any(isinstance(value, Exception) for value in self._values)
+
+    def get(self, index):
+        """
+        Return the reply of a command, raising it if the command failed.
+
+        Args:
+            index: Position of the command, as returned when queueing it.
+
+        Returns:
+            The reply of the command.
+        """
+        value = self._values[index]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+class Pipeline(
+    commands.Connection,
+    commands.Geo,
+    commands.Hash,
+    commands.HyperLogLog,
+    commands.Key,
+    commands.List,
+    commands.Publish,
+    commands.Scripting,
+    commands.Set,
+    commands.SSet,
+    commands.String,
+):
+    """
+    Batch of commands queued on a client in bulk mode.
+
+    Returned by the pipeline() context manager of Client, HashClient,
+    ClusterClient and the pools. Commands are queued through the regular
+    command methods, each returns the index of its reply in result. The
+    client's bulk_size logic sends queued commands and collects their
+    replies in batches, the remaining ones are sent when the block exits.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize the pipeline.
+
+        Args:
+            client: Client in bulk mode the commands are queued on.
+        """
+        super().__init__()
+        self._client = client
+        self._cluster = client._cluster
+        self._count = 0
+        self._result = None
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def result(self):
+        """PipelineResult, available once the pipeline block exited."""
+        if self._result is None:
+            raise PyRedisError("Pipeline has not been executed yet")
+        return self._result
+
+    def execute(self, *args, **kwargs):
+        """
+        Queue a command.
+
+        Args:
+            *args: Command name and positional arguments.
+            **kwargs: Execution options of the client, e.g. shard_key.
+
+        Returns:
+            Index of the command's reply in result.
+        """
+        if self._result is not None:
+            raise PyRedisError("Pipeline has already been executed")
+        self._client.execute(*args, **kwargs)
+        self._count += 1
+        return self._count - 1
+
+    def _finish(self, replies, transaction=False):
+        if transaction:
+            replies = self._exec_values(replies)
+        self._result = PipelineResult(replies)
+        return self._result
+
+    @staticmethod
+    def _exec_values(replies):
+        # Replies are MULTI, one QUEUED per command and EXEC. If EXEC
+        # failed, commands rejected while queueing keep their own error.
+        reply = replies[-1]
+        if isinstance(reply, list):
+            return reply
+        if reply is None:
+            reply = PyRedisError("Transaction aborted")
+        return [
+            queued if isinstance(queued, Exception) else reply
+            for queued in replies[1:-1]
+        ]
+
+
+class AsyncPipeline(Pipeline):
+    """
+    Batch of commands queued on an asynchronous client in bulk mode.
+
+    Returned by the pipeline() async context manager of AsyncClient,
+    AsyncHashClient, AsyncClusterClient and the async pools. Command
+    methods have to be awaited, as reaching bulk_size sends the queued
+    commands.
+    """
+
+    async def execute(self, *args, **kwargs):
+        """
+        Asynchronously queue a command.
+
+        Args:
+            *args: Command name and positional arguments.
+            **kwargs: Execution options of the client, e.g. shard_key.
+
+        Returns:
+            Index of the command's reply in result.
+        """
+        if self._result is not None:
+            raise PyRedisError("Pipeline has already been executed")
+        await self._client.execute(*args, **kwargs)
+        self._count += 1
+        return self._count - 1
+
+
+def cluster_requests(commands, batches, asking):
+    """
+    Build the per node requests of a cluster pipeline round.
+
+    Args:
+        commands: List of (args, shard_key, sock) tuples.
+        batches: Dict of node to the indexes of the commands it is sent.
+        asking: Dict of the indexes of ASK redirected commands to their node.
+
+    Returns:
+        Dict of node to the list of argument tuples to send, ASKING is
+        prepended to redirected commands.
+    """
+    requests = dict()
+    for target, indexes in batches.items():
+        request = list()
+        for index in indexes:
+            if index in asking:
+                request.append(("ASKING",))
+            request.append(commands[index][0])
+        requests[target] = request
+    return requests
+
+
+def cluster_replies(commands, batches, asking, replies, results):
+    """
+    Store the replies of a cluster pipeline round in submission order.
+
+    Args:
+        commands: List of (args, shard_key, sock) tuples.
+        batches: Dict of node to the indexes of the commands it was sent.
+        asking: Dict of the indexes of ASK redirected commands to their node.
+        replies: Dict of node to the list of its replies.
+        results: List the replies are stored in, by command index.
+
+    Returns:
+        Tuple of the sorted indexes to retry, a dict of the slots of MOVED
+        replies to their new node and a dict of ASK redirected indexes to
+        their node.
+    """
+    retry = list()
+    moved = dict()
+    redirects = dict()
+    for target, indexes in batches.items():
+        node_replies = iter(replies[target])
+        for index in indexes:
+            if index in asking:
+                next(node_replies)
+            reply = next(node_replies)
+            if isinstance(reply, ReplyError):
+                errstr = str(reply)
+                if errstr.startswith("MOVED") and commands[index][1]:
+                    slot, node = parse_redirect(errstr)
+                    moved[slot] = node
+                    retry.append(index)
+                    continue
+                if errstr.startswith("ASK"):
+                    redirects[index] = errstr.split()[2].replace(":", "_")
+                    retry.append(index)
+                    continue
+            results[index] = reply
+    return sorted(retry), moved, redirects
@@ -7,22 +7,25 @@ class Connection(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def echo(self, *args, shard_key=None, sock=None):
+    def echo(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ECHO", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"ECHO", *args]
+            *[b"ECHO", *args],
+            **kwargs
         )
 
-    def ping(self, shard_key=None, sock=None):
+    def ping(self, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 b"PING",
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
-        return self.execute(b"PING")
+        return self.execute(b"PING", **kwargs)
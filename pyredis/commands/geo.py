@@ -7,62 +7,74 @@ class Geo(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def geoadd(self, *args):
+    def geoadd(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GEOADD", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GEOADD", *args]
+            *[b"GEOADD", *args],
+            **kwargs
         )
 
-    def geodist(self, *args):
+    def geodist(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GEODIST", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GEODIST", *args]
+            *[b"GEODIST", *args],
+            **kwargs
         )
 
-    def geohash(self, *args):
+    def geohash(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GEOHASH", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GEOHASH", *args]
+            *[b"GEOHASH", *args],
+            **kwargs
         )
 
-    def georadius(self, *args):
+    def georadius(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GEORADIUS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GEORADIUS", *args]
+            *[b"GEORADIUS", *args],
+            **kwargs
         )
 
-    def geopos(self, *args):
+    def geopos(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GEOPOS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GEOPOS", *args]
+            *[b"GEOPOS", *args],
+            **kwargs
         )
 
-    def georadiusbymember(self, *args):
+    def georadiusbymember(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GEORADIUSBYMEMBER", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GEORADIUSBYMEMBER", *args]
+            *[b"GEORADIUSBYMEMBER", *args],
+            **kwargs
         )
@@ -7,152 +7,182 @@ class Hash(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def hdel(self, *args):
+    def hdel(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HDEL", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HDEL", *args]
+            *[b"HDEL", *args],
+            **kwargs
         )
 
-    def hexists(self, *args):
+    def hexists(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HEXISTS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HEXISTS", *args]
+            *[b"HEXISTS", *args],
+            **kwargs
         )
 
-    def hget(self, *args):
+    def hget(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HGET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HGET", *args]
+            *[b"HGET", *args],
+            **kwargs
         )
 
-    def hgetall(self, *args):
+    def hgetall(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HGETALL", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HGETALL", *args]
+            *[b"HGETALL", *args],
+            **kwargs
         )
 
-    def hincrby(self, *args):
+    def hincrby(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HINCRBY", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HINCRBY", *args]
+            *[b"HINCRBY", *args],
+            **kwargs
         )
 
-    def hincrbyfloat(self, *args):
+    def hincrbyfloat(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HINCRBYFLOAT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HINCRBYFLOAT", *args]
+            *[b"HINCRBYFLOAT", *args],
+            **kwargs
         )
 
-    def hkeys(self, *args):
+    def hkeys(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HKEYS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HKEYS", *args]
+            *[b"HKEYS", *args],
+            **kwargs
         )
 
-    def hlen(self, *args):
+    def hlen(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HLEN", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HLEN", *args]
+            *[b"HLEN", *args],
+            **kwargs
         )
 
-    def hmget(self, *args):
+    def hmget(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HMGET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HMGET", *args]
+            *[b"HMGET", *args],
+            **kwargs
         )
 
-    def hmset(self, *args):
+    def hmset(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HMSET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HMSET", *args]
+            *[b"HMSET", *args],
+            **kwargs
         )
 
-    def hset(self, *args):
+    def hset(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HSET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HSET", *args]
+            *[b"HSET", *args],
+            **kwargs
         )
 
-    def hsetnx(self, *args):
+    def hsetnx(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HSETNX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HSETNX", *args]
+            *[b"HSETNX", *args],
+            **kwargs
         )
 
-    def hstrlen(self, *args):
+    def hstrlen(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HSTRLEN", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HSTRLEN", *args]
+            *[b"HSTRLEN", *args],
+            **kwargs
         )
 
-    def hvals(self, *args):
+    def hvals(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HVALS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HVALS", *args]
+            *[b"HVALS", *args],
+            **kwargs
         )
 
-    def hscan(self, *args):
+    def hscan(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"HSCAN", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"HSCAN", *args]
+            *[b"HSCAN", *args],
+            **kwargs
         )
@@ -7,32 +7,38 @@ class HyperLogLog(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def pfadd(self, *args):
+    def pfadd(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PFADD", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PFADD", *args]
+            *[b"PFADD", *args],
+            **kwargs
         )
 
-    def pfcount(self, *args):
+    def pfcount(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PFCOUNT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PFCOUNT", *args]
+            *[b"PFCOUNT", *args],
+            **kwargs
         )
 
-    def pfmerge(self, *args):
+    def pfmerge(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PFMERGE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PFMERGE", *args]
+            *[b"PFMERGE", *args],
+            **kwargs
         )
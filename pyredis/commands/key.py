@@ -7,220 +7,286 @@ class Key(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def delete(self, *args):
+    def delete(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"DEL", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"DEL", *args]
+            *[b"DEL", *args],
+            **kwargs
         )
 
-    def dump(self, *args):
+    def dump(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"DUMP", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"DUMP", *args]
+            *[b"DUMP", *args],
+            **kwargs
         )
 
-    def exists(self, *args):
+    def exists(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"EXISTS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"EXISTS", *args]
+            *[b"EXISTS", *args],
+            **kwargs
         )
 
-    def expire(self, *args):
+    def expire(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"EXPIRE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"EXPIRE", *args]
+            *[b"EXPIRE", *args],
+            **kwargs
         )
 
-    def expireat(self, *args):
+    def expireat(self, *args, **kwargs):
         if self._cluster:
-            return self.execute(b"EXPIREAT")
+            return self.execute(b"EXPIREAT", **kwargs)
         return self.execute(
-            *[b"EXPIREAT", *args]
+            *[b"EXPIREAT", *args],
+            **kwargs
         )
 
-    def keys(self, *args, shard_key=None, sock=None):
+    def keys(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"KEYS", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"KEYS", *args]
+            *[b"KEYS", *args],
+            **kwargs
         )
 
-    def migrate(self, *args):
+    def migrate(self, *args, **kwargs):
         if self._cluster:
             raise NotImplementedError
         return self.execute(
-            *[b"MIGRATE", *args]
+            *[b"MIGRATE", *args],
+            **kwargs
         )
 
-    def move(self, *args):
+    def move(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"MOVE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"MOVE", *args]
+            *[b"MOVE", *args],
+            **kwargs
         )
 
-    def object(self, *args, shard_key=None, sock=None):
+    def object(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"DEL", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"OBJECT", *args]
+            *[b"OBJECT", *args],
+            **kwargs
         )
 
-    def persist(self, *args):
+    def persist(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PERSIST", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PERSIST", *args]
+            *[b"PERSIST", *args],
+            **kwargs
         )
 
-    def pexpire(self, *args):
+    def pexpire(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PEXPIRE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PEXPIRE", *args]
+            *[b"PEXPIRE", *args],
+            **kwargs
         )
 
-    def pexpireat(self, *args):
+    def pexpireat(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PEXPIREAT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PEXPIREAT", *args]
+            *[b"PEXPIREAT", *args],
+            **kwargs
         )
 
-    def pttl(self, *args):
+    def pttl(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PTTL", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PTTL", *args]
+            *[b"PTTL", *args],
+            **kwargs
         )
 
-    def randomkey(self, *args, shard_key=None, sock=None):
+    def randomkey(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RANDOMKEY", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"RANDOMKEY", *args]
+            *[b"RANDOMKEY", *args],
+            **kwargs
         )
 
-    def rename(self, *args):
+    def rename(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RENAME", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"RENAME", *args]
+            *[b"RENAME", *args],
+            **kwargs
         )
 
-    def renamenx(self, *args):
+    def renamenx(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RENAMENX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"RENAMENX", *args]
+            *[b"RENAMENX", *args],
+            **kwargs
         )
 
-    def restore(self, *args):
+    def restore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RESTORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"RESTORE", *args]
+            *[b"RESTORE", *args],
+            **kwargs
         )
 
-    def scan(self, *args, shard_key=None, sock=None):
+    def scan(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SCAN", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"SCAN", *args]
+            *[b"SCAN", *args],
+            **kwargs
         )
 
-    def sort(self, *args):
+    def sort(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SORT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SORT", *args]
+            *[b"SORT", *args],
+            **kwargs
         )
 
-    def ttl(self, *args):
+    def touch(self, *args, **kwargs):
+        if self._cluster:
+            return self.execute(
+                *[b"TOUCH", *args],
+                shard_key=args[0],
+                **kwargs
+            )
+        return self.execute(
+            *[b"TOUCH", *args],
+            **kwargs
+        )
+
+    def ttl(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"TTL", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"TTL", *args]
+            *[b"TTL", *args],
+            **kwargs
         )
 
-    def type(self, *args):
+    def type(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"TYPE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
+            )
+        return self.execute(
+            *[b"TYPE", *args],
+            **kwargs
+        )
+
+    def unlink(self, *args, **kwargs):
+        if self._cluster:
+            return self.execute(
+                *[b"UNLINK", *args],
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"TYPE", *args]
+            *[b"UNLINK", *args],
+            **kwargs
         )
 
-    def wait(self, *args):
+    def wait(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"WAIT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"WAIT", *args]
+            *[b"WAIT", *args],
+            **kwargs
         )
@@ -7,172 +7,213 @@ class List(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def blpop(self, *args):
+    def blpop(self, *args, **kwargs):
+        # The server side timeout extends the deadline of the call.
+        if args:
+            kwargs.setdefault("block", args[-1])
         if self._cluster:
             return self.execute(
                 *[b"BLPOP", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"BLPOP", *args]
+            *[b"BLPOP", *args],
+            **kwargs
         )
 
-    def brpop(self, *args):
+    def brpop(self, *args, **kwargs):
+        if args:
+            kwargs.setdefault("block", args[-1])
         if self._cluster:
             return self.execute(
                 *[b"BRPOP", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"BRPOP", *args]
+            *[b"BRPOP", *args],
+            **kwargs
         )
 
-    def brpoplpush(self, *args):
+    def brpoplpush(self, *args, **kwargs):
+        if args:
+            kwargs.setdefault("block", args[-1])
         if self._cluster:
             return self.execute(
                 *[b"BRPOPPUSH", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"BRPOPPUSH", *args]
+            *[b"BRPOPPUSH", *args],
+            **kwargs
         )
 
-    def lindex(self, *args):
+    def lindex(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LINDEX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LINDEX", *args]
+            *[b"LINDEX", *args],
+            **kwargs
         )
 
-    def linsert(self, *args):
+    def linsert(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LINSERT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LINSERT", *args]
+            *[b"LINSERT", *args],
+            **kwargs
         )
 
-    def llen(self, *args):
+    def llen(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LLEN", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LLEN", *args]
+            *[b"LLEN", *args],
+            **kwargs
         )
 
-    def lpop(self, *args):
+    def lpop(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LPOP", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LPOP", *args]
+            *[b"LPOP", *args],
+            **kwargs
         )
 
-    def lpush(self, *args):
+    def lpush(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LPUSH", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LPUSH", *args]
+            *[b"LPUSH", *args],
+            **kwargs
         )
 
-    def lpushx(self, *args):
+    def lpushx(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LPUSHX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LPUSHX", *args]
+            *[b"LPUSHX", *args],
+            **kwargs
         )
 
-    def lrange(self, *args):
+    def lrange(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LRANGE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LRANGE", *args]
+            *[b"LRANGE", *args],
+            **kwargs
         )
 
-    def lrem(self, *args):
+    def lrem(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LREM", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LREM", *args]
+            *[b"LREM", *args],
+            **kwargs
         )
 
-    def lset(self, *args):
+    def lset(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LSET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LSET", *args]
+            *[b"LSET", *args],
+            **kwargs
         )
 
-    def ltrim(self, *args):
+    def ltrim(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"LTRIM", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"LTRIM", *args]
+            *[b"LTRIM", *args],
+            **kwargs
         )
 
-    def rpop(self, *args):
+    def rpop(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RPOP", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"RPOP", *args]
+            *[b"RPOP", *args],
+            **kwargs
         )
 
-    def rpoplpush(self, *args):
+    def rpoplpush(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RPOPLPUSH", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"RPOPLPUSH", *args]
+            *[b"RPOPLPUSH", *args],
+            **kwargs
         )
 
-    def rpush(self, *args):
+    def rpush(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RPUSH", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"RPUSH", *args]
+            *[b"RPUSH", *args],
+            **kwargs
         )
 
-    def rpushx(self, *args):
+    def rpushx(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"RPUSHX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"RPUSHX", *args]
+            *[b"RPUSHX", *args],
+            **kwargs
         )
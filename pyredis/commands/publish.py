@@ -7,9 +7,10 @@ class Publish(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def publish(self, *args):
+    def publish(self, *args, **kwargs):
         if self._cluster:
             raise NotImplementedError
         return self.execute(
-            *[b"PUBLISH", *args]
+            *[b"PUBLISH", *args],
+            **kwargs
         )
@@ -7,79 +7,93 @@ class Scripting(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def eval(self, *args, shard_key=None, sock=None):
+    def eval(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"EVAL", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"EVAL", *args]
+            *[b"EVAL", *args],
+            **kwargs
         )
 
-    def evalsha(self, *args, shard_key=None, sock=None):
+    def evalsha(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"EVALSHA", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"EVALSHA", *args]
+            *[b"EVALSHA", *args],
+            **kwargs
         )
 
-    def script_debug(self, *args, shard_key=None, sock=None):
+    def script_debug(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SCRIPT", b"DEBUG", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"SCRIPT", b"DEBUG", *args]
+            *[b"SCRIPT", b"DEBUG", *args],
+            **kwargs
         )
 
-    def script_exists(self, *args, shard_key=None, sock=None):
+    def script_exists(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SCRIPT", b"EXISTS", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"SCRIPT", b"EXISTS", *args]
+            *[b"SCRIPT", b"EXISTS", *args],
+            **kwargs
         )
 
-    def script_flush(self, *args, shard_key=None, sock=None):
+    def script_flush(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SCRIPT", b"FLUSH", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"SCRIPT", b"FLUSH", *args]
+            *[b"SCRIPT", b"FLUSH", *args],
+            **kwargs
         )
 
-    def script_kill(self, *args, shard_key=None, sock=None):
+    def script_kill(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SCRIPT", b"KILL", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"SCRIPT", b"KILL", *args]
+            *[b"SCRIPT", b"KILL", *args],
+            **kwargs
         )
 
-    def script_load(self, *args, shard_key=None, sock=None):
+    def script_load(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SCRIPT", b"LOAD", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"SCRIPT", b"LOAD", *args]
+            *[b"SCRIPT", b"LOAD", *args],
+            **kwargs
         )
@@ -7,152 +7,182 @@ class Set(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def sadd(self, *args):
+    def sadd(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SADD", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SADD", *args]
+            *[b"SADD", *args],
+            **kwargs
         )
 
-    def scard(self, *args):
+    def scard(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SCARD", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SCARD", *args]
+            *[b"SCARD", *args],
+            **kwargs
         )
 
-    def sdiff(self, *args):
+    def sdiff(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SDIFF", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SDIFF", *args]
+            *[b"SDIFF", *args],
+            **kwargs
         )
 
-    def sdiffstore(self, *args):
+    def sdiffstore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SDIFFSTORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SDIFFSTORE", *args]
+            *[b"SDIFFSTORE", *args],
+            **kwargs
         )
 
-    def sinter(self, *args):
+    def sinter(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SINTER", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SINTER", *args]
+            *[b"SINTER", *args],
+            **kwargs
         )
 
-    def sinterstore(self, *args):
+    def sinterstore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SINTERSTORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SINTERSTORE", *args]
+            *[b"SINTERSTORE", *args],
+            **kwargs
         )
 
-    def sismember(self, *args):
+    def sismember(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SISMEMBER", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SISMEMBER", *args]
+            *[b"SISMEMBER", *args],
+            **kwargs
         )
 
-    def smembers(self, *args):
+    def smembers(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SMEMBERS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SMEMBERS", *args]
+            *[b"SMEMBERS", *args],
+            **kwargs
         )
 
-    def smove(self, *args):
+    def smove(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SMOVE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SMOVE", *args]
+            *[b"SMOVE", *args],
+            **kwargs
         )
 
-    def spop(self, *args):
+    def spop(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SPOP", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SPOP", *args]
+            *[b"SPOP", *args],
+            **kwargs
         )
 
-    def srandmember(self, *args):
+    def srandmember(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SRANDMEMBER", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SRANDMEMBER", *args]
+            *[b"SRANDMEMBER", *args],
+            **kwargs
         )
 
-    def srem(self, *args):
+    def srem(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SREM", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SREM", *args]
+            *[b"SREM", *args],
+            **kwargs
         )
 
-    def sunion(self, *args):
+    def sunion(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SUNION", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SUNION", *args]
+            *[b"SUNION", *args],
+            **kwargs
         )
 
-    def sunoinstore(self, *args):
+    def sunoinstore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SUNIONSTORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SUNIONSTORE", *args]
+            *[b"SUNIONSTORE", *args],
+            **kwargs
         )
 
-    def sscan(self, *args):
+    def sscan(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SSCAN", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SSCAN", *args]
+            *[b"SSCAN", *args],
+            **kwargs
         )
@@ -7,212 +7,254 @@ class SSet(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def zadd(self, *args):
+    def zadd(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZADD", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZADD", *args]
+            *[b"ZADD", *args],
+            **kwargs
         )
 
-    def zcard(self, *args):
+    def zcard(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZCARD", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZCARD", *args]
+            *[b"ZCARD", *args],
+            **kwargs
         )
 
-    def zcount(self, *args):
+    def zcount(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZCOUNT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZCOUNT", *args]
+            *[b"ZCOUNT", *args],
+            **kwargs
         )
 
-    def zincrby(self, *args):
+    def zincrby(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZINCRBY", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZINCRBY", *args]
+            *[b"ZINCRBY", *args],
+            **kwargs
         )
 
-    def zinterstore(self, *args):
+    def zinterstore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZINTERSTORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZINTERSTORE", *args]
+            *[b"ZINTERSTORE", *args],
+            **kwargs
         )
 
-    def zlexcount(self, *args):
+    def zlexcount(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZLEXCOUNT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZLEXCOUNT", *args]
+            *[b"ZLEXCOUNT", *args],
+            **kwargs
         )
 
-    def zrange(self, *args):
+    def zrange(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZRANGE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZRANGE", *args]
+            *[b"ZRANGE", *args],
+            **kwargs
         )
 
-    def zrangebylex(self, *args):
+    def zrangebylex(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZRANGEBYLEX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZRANGEBYLEX", *args]
+            *[b"ZRANGEBYLEX", *args],
+            **kwargs
         )
 
-    def zrangebyscore(self, *args):
+    def zrangebyscore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZRANGEBYSCORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZRANGEBYSCORE", *args]
+            *[b"ZRANGEBYSCORE", *args],
+            **kwargs
         )
 
-    def zrank(self, *args):
+    def zrank(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZRANK", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZRANK", *args]
+            *[b"ZRANK", *args],
+            **kwargs
         )
 
-    def zrem(self, *args):
+    def zrem(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREM", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREM", *args]
+            *[b"ZREM", *args],
+            **kwargs
         )
 
-    def zremrangebylex(self, *args):
+    def zremrangebylex(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREMRANGEBYLEX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREMRANGEBYLEX", *args]
+            *[b"ZREMRANGEBYLEX", *args],
+            **kwargs
         )
 
-    def zremrangebyrank(self, *args):
+    def zremrangebyrank(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREMRANGEBYRANK", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREMRANGEBYRANK", *args]
+            *[b"ZREMRANGEBYRANK", *args],
+            **kwargs
         )
 
-    def zremrangebyscrore(self, *args):
+    def zremrangebyscrore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREMRANGEBYSCORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREMRANGEBYSCORE", *args]
+            *[b"ZREMRANGEBYSCORE", *args],
+            **kwargs
         )
 
-    def zrevrange(self, *args):
+    def zrevrange(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREVRANGE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREVRANGE", *args]
+            *[b"ZREVRANGE", *args],
+            **kwargs
         )
 
-    def zrevrangebylex(self, *args):
+    def zrevrangebylex(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREVRANGEBYLEX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREVRANGEBYLEX", *args]
+            *[b"ZREVRANGEBYLEX", *args],
+            **kwargs
         )
 
-    def zrevrangebyscore(self, *args):
+    def zrevrangebyscore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREVRANGEBYSCORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREVRANGEBYSCORE", *args]
+            *[b"ZREVRANGEBYSCORE", *args],
+            **kwargs
         )
 
-    def zrevrank(self, *args):
+    def zrevrank(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZREVRANK", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZREVRANK", *args]
+            *[b"ZREVRANK", *args],
+            **kwargs
         )
 
-    def zscore(self, *args):
+    def zscore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZSCORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZSCORE", *args]
+            *[b"ZSCORE", *args],
+            **kwargs
         )
 
-    def zunionstore(self, *args):
+    def zunionstore(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZUNIONSTORE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZUNIONSTORE", *args]
+            *[b"ZUNIONSTORE", *args],
+            **kwargs
         )
 
-    def zscan(self, *args):
+    def zscan(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"ZSCAN", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"ZSCAN", *args]
+            *[b"ZSCAN", *args],
+            **kwargs
         )
@@ -7,242 +7,290 @@ class String(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def append(self, *args):
+    def append(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"APPEND", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"APPEND", *args]
+            *[b"APPEND", *args],
+            **kwargs
         )
 
-    def bitcount(self, *args):
+    def bitcount(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"BITCOUNT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"BITCOUNT", *args]
+            *[b"BITCOUNT", *args],
+            **kwargs
         )
 
-    def bitfield(self, *args):
+    def bitfield(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"BITFIELD", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"BITFIELD", *args]
+            *[b"BITFIELD", *args],
+            **kwargs
         )
 
-    def bitop(self, *args):
+    def bitop(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"BITOP", *args],
-                shard_key=args[1]
+                shard_key=args[1],
+                **kwargs
             )
         return self.execute(
-            *[b"BITOP", *args]
+            *[b"BITOP", *args],
+            **kwargs
         )
 
-    def bitpos(self, *args):
+    def bitpos(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"BITPOS", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"BITPOS", *args]
+            *[b"BITPOS", *args],
+            **kwargs
         )
 
-    def decr(self, *args):
+    def decr(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"DECR", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"DECR", *args]
+            *[b"DECR", *args],
+            **kwargs
         )
 
-    def decrby(self, *args):
+    def decrby(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"DECRBY", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"DECRBY", *args]
+            *[b"DECRBY", *args],
+            **kwargs
         )
 
-    def get(self, *args):
+    def get(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GET", *args]
+            *[b"GET", *args],
+            **kwargs
         )
 
-    def getbit(self, *args):
+    def getbit(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GETBIT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GETBIT", *args]
+            *[b"GETBIT", *args],
+            **kwargs
         )
 
-    def getrange(self, *args):
+    def getrange(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GETRANGE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GETRANGE", *args]
+            *[b"GETRANGE", *args],
+            **kwargs
         )
 
-    def getset(self, *args):
+    def getset(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"GETSET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"GETSET", *args]
+            *[b"GETSET", *args],
+            **kwargs
         )
 
-    def incr(self, *args):
+    def incr(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"INCR", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"INCR", *args]
+            *[b"INCR", *args],
+            **kwargs
         )
 
-    def incrby(self, *args):
+    def incrby(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"INCRBY", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"INCRBY", *args]
+            *[b"INCRBY", *args],
+            **kwargs
         )
 
-    def incrbyfloat(self, *args):
+    def incrbyfloat(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"INCRBYFLOAT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"INCRBYFLOAT", *args]
+            *[b"INCRBYFLOAT", *args],
+            **kwargs
         )
 
-    def mget(self, *args):
+    def mget(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"MGET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"MGET", *args]
+            *[b"MGET", *args],
+            **kwargs
         )
 
-    def mset(self, *args):
+    def mset(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"MSET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"MSET", *args]
+            *[b"MSET", *args],
+            **kwargs
         )
 
-    def msetnx(self, *args):
+    def msetnx(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"MSETNX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"MSETNX", *args]
+            *[b"MSETNX", *args],
+            **kwargs
         )
 
-    def psetex(self, *args):
+    def psetex(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"PSETEX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"PSETEX", *args]
+            *[b"PSETEX", *args],
+            **kwargs
         )
 
-    def set(self, *args):
+    def set(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SET", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SET", *args]
+            *[b"SET", *args],
+            **kwargs
         )
 
-    def setbit(self, *args):
+    def setbit(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SETBIT", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SETBIT", *args]
+            *[b"SETBIT", *args],
+            **kwargs
         )
 
-    def setex(self, *args):
+    def setex(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SETEX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SETEX", *args]
+            *[b"SETEX", *args],
+            **kwargs
         )
 
-    def setnx(self, *args):
+    def setnx(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SETNX", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SETNX", *args]
+            *[b"SETNX", *args],
+            **kwargs
         )
 
-    def setrange(self, *args):
+    def setrange(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"SETRANGE", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"SETRANGE", *args]
+            *[b"SETRANGE", *args],
+            **kwargs
         )
 
-    def strlen(self, *args):
+    def strlen(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"STRLEN", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"STRLEN", *args]
+            *[b"STRLEN", *args],
+            **kwargs
         )
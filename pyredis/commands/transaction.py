@@ -7,56 +7,66 @@ class Transaction(BaseCommand):
     def __init__(self):
         super().__init__()
 
-    def discard(self, *args, shard_key=None, sock=None):
+    def discard(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"DISCARD", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"DISCARD", *args]
+            *[b"DISCARD", *args],
+            **kwargs
         )
 
-    def exec(self, *args, shard_key=None, sock=None):
+    def exec(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"EXEC", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"EXEC", *args]
+            *[b"EXEC", *args],
+            **kwargs
         )
 
-    def multi(self, *args, shard_key=None, sock=None):
+    def multi(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"MULTI", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"MULTI", *args]
+            *[b"MULTI", *args],
+            **kwargs
         )
 
-    def unwatch(self, *args, shard_key=None, sock=None):
+    def unwatch(self, *args, shard_key=None, sock=None, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"UNWATCH", *args],
                 shard_key=shard_key,
-                sock=sock
+                sock=sock,
+                **kwargs
             )
         return self.execute(
-            *[b"UNWATCH", *args]
+            *[b"UNWATCH", *args],
+            **kwargs
         )
 
-    def watch(self, *args):
+    def watch(self, *args, **kwargs):
         if self._cluster:
             return self.execute(
                 *[b"WATCH", *args],
-                shard_key=args[0]
+                shard_key=args[0],
+                **kwargs
             )
         return self.execute(
-            *[b"WATCH", *args]
+            *[b"WATCH", *args],
+            **kwargs
         )
@@ -1,9 +1,22 @@
 import asyncio
+import contextlib
+from collections import deque
+import math
+import time
 from pyredis.exceptions import PyRedisConnClosed
 from pyredis.exceptions import PyRedisConnError
 from pyredis.exceptions import PyRedisConnReadTimeout
+from pyredis.exceptions import PyRedisDeadlineExceeded
 from pyredis.exceptions import PyRedisError
-from pyredis.exceptions import ReplyError
+from pyredis.connection.async_protocol import AsyncProtocol
+from pyredis.connection.options import merge_socket_options
+from pyredis.connection.options import set_socket_options
+from pyredis.protocol import Push
+from pyredis.protocol import has_large_arg
+from pyredis.protocol import stream_length
+from pyredis.protocol import writer_args
+from pyredis.protocol import writer_iov
+from pyredis.protocol import writer_many
 import pyredis.connection
 
 
@@ -28,6 +41,18 @@ class AsyncConnection(object):
         read_timeout=2,
         sentinel=False,
         username=None,
+        protocol=None,
+        push_handler=None,
+        bulk_type=bytes,
+        read_buffer_size=16384,
+        max_read_buffer=1048576,
+        client_name=None,
+        socket_options=None,
+        transport="stream",
+        multiplex=False,
+        auto_pipeline=False,
+        pipeline_max_batch=None,
+        pipeline_delay=0,
     ):
         """
         Initialize asynchronous connection parameters.
@@ -44,20 +69,78 @@ class AsyncConnection(object):
             read_timeout: Async socket read timeout in seconds.
             sentinel: Flag indicating if this is a Sentinel connection.
             username: Username for ACL authentication.
+            protocol: RESP protocol version negotiated with HELLO (2 or 3).
+                None skips HELLO and talks RESP2 to any server version.
+            push_handler: Callable receiving RESP3 push messages. If not set,
+                push messages are returned by read() like regular replies.
+            bulk_type: Type of returned bulk strings, bytes, bytearray or
+                memoryview. bytearray and memoryview avoid the final copy of
+                large values. Only supported by the builtin Reader.
+            read_buffer_size: Initial number of bytes requested per read.
+            max_read_buffer: Number of bytes per read may grow to while
+                large replies are read.
+            client_name: Connection name set with CLIENT SETNAME.
+            socket_options: Dict of socket options, e.g. {"keepalive_idle":
+                60, "user_timeout": 10}. TCP_NODELAY is enabled unless
+                tcp_nodelay is set to False.
+            transport: "stream" talks to the server through asyncio
+                streams, "protocol" through an asyncio.Protocol feeding
+                received data straight into the reader, which has less
+                overhead per command.
+            multiplex: If True, any number of coroutines may issue
+                commands concurrently with request(), replies are matched
+                to callers by a single reader task.
+            auto_pipeline: If True, implies multiplex and coalesces all
+                commands issued within one event loop iteration into a
+                single write.
+            pipeline_max_batch: Number of queued commands that triggers a
+                write right away, None leaves batches unbounded.
+            pipeline_delay: Seconds to wait for more commands before a
+                batch is written, 0 writes once the current event loop
+                iteration is done.
         """
 
         if not bool(host) != bool(unix_sock):
             raise PyRedisError("Ether host or unix_sock has to be provided")
+        if transport not in ("stream", "protocol"):
+            raise PyRedisError(f"Invalid transport: {transport}")
+        self._use_protocol = transport == "protocol"
+        self._multiplex = multiplex or auto_pipeline
+        self._auto_pipeline = auto_pipeline
+        self._pipeline_max_batch = pipeline_max_batch
+        self._pipeline_delay = pipeline_delay
+        self._batch = bytearray()
+        self._batch_count = 0
+        self._flush_handle = None
+        self._pending = deque()
+        self._reader_task = None
+        self._connect_lock = None
+        self._drain_lock = None
+        self._ready = False
         self._closed = False
         self._conn_timeout = conn_timeout
+        self._protocol = protocol
+        self._client_name = client_name
+        self._socket_options = merge_socket_options(socket_options)
+        self._push_handler = push_handler
+        self._bulk_type = bulk_type
         self._read_only = read_only
         self._read_timeout = read_timeout
+        self._deadline = None
         self._encoding = encoding
         self._reader_parser = None
+        self._bulk_reader = False
+        self._read_buffer_size = read_buffer_size
+        self._max_read_buffer = max(max_read_buffer, read_buffer_size)
+        self._read_size = read_buffer_size
+        self._small_reads = 0
         self._sentinel = sentinel
         self._writer_func = pyredis.connection.writer
+        self._out = bytearray()
         self._reader = None
         self._writer = None
+        self._stream_remaining = 0
+        self._stream_token = None
         self.host = host
         self.port = port
         self.unix_sock = unix_sock
@@ -65,31 +148,56 @@ class AsyncConnection(object):
         self.username = username
         self.database = database
 
-    async def _authenticate(self):
-        if self.username and self.password:
-            await self.write(
-                *["AUTH", self.username, self.password]
-            )
-            try:
-                await self.read()
-            except ReplyError as err:
-                await self.close()
-                raise err
+    def _handshake_commands(self):
+        commands = list()
+        if self._protocol:
+            hello = ["HELLO", self._protocol]
+            if self.password:
+                hello.extend(("AUTH", self.username or "default", self.password))
+            if self._client_name:
+                hello.extend(("SETNAME", self._client_name))
+            commands.append(hello)
+        elif self.username and self.password:
+            commands.append(["AUTH", self.username, self.password])
         elif self.password:
-            await self.write(
-                *["AUTH", self.password]
-            )
-            try:
-                await self.read()
-            except ReplyError as err:
+            commands.append(["AUTH", self.password])
+        if self._client_name and not self._protocol:
+            commands.append(["CLIENT", "SETNAME", self._client_name])
+        if not self._sentinel:
+            if self.database is not None:
+                commands.append(["SELECT", self.database])
+            if self._read_only:
+                commands.append(["READONLY"])
+        return commands
+
+    async def _handshake(self):
+        # All handshake commands go out in one write and their replies are
+        # validated together, costing a single round trip.
+        commands = self._handshake_commands()
+        if not commands:
+            return
+        await self.write_many(commands)
+        for reply in await self.read_many(len(commands)):
+            if isinstance(reply, Exception):
                 await self.close()
-                raise err
+                raise reply
 
     async def _connect(self):
         if self._closed:
             raise PyRedisConnError("Connection Gone")
+        reader_kwargs = dict()
+        if self._encoding:
+            reader_kwargs["encoding"] = self._encoding
+        if self._bulk_type is not bytes:
+            reader_kwargs["bulk_type"] = self._bulk_type
+        parser = pyredis.connection.Reader(**reader_kwargs)
         try:
-            if self.host:
+            if self._use_protocol:
+                reader = writer = await asyncio.wait_for(
+                    self._open_protocol(parser),
+                    timeout=self._conn_timeout
+                )
+            elif self.host:
                 reader, writer = await asyncio.wait_for(
                     asyncio.open_connection(
                         host=self.host,
@@ -115,55 +223,136 @@ class AsyncConnection(object):
             raise PyRedisConnError(
                 f"Could not Connect to {self.host}:{self.port}: {err}"
             )
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            try:
+                set_socket_options(
+                    sock,
+                    self._socket_options,
+                    tcp=bool(self.host)
+                )
+            except OSError as err:
+                writer.close()
+                await self.close()
+                raise PyRedisConnError(
+                    f"Could not Connect to {self.host}:{self.port}: {err}"
+                )
         self._reader = reader
         self._writer = writer
-        if self._encoding:
-            self._reader_parser = pyredis.connection.Reader(
-                encoding=self._encoding
+        self._reader_parser = parser
+        self._bulk_reader = hasattr(self._reader_parser, "bulk_view")
+        try:
+            await self._handshake()
+        except BaseException:
+            # Unread handshake replies would be taken for replies of the
+            # next commands.
+            await self.close()
+            raise
+        self._ready = True
+
+    async def _open_protocol(self, parser):
+        loop = asyncio.get_running_loop()
+        if self.host:
+            _, protocol = await loop.create_connection(
+                lambda: AsyncProtocol(parser, self._max_read_buffer),
+                host=self.host,
+                port=self.port
             )
         else:
-            self._reader_parser = pyredis.connection.Reader()
-        await self._authenticate()
-        if not self._sentinel:
-            await self._setdb()
-            await self._set_read_only()
+            _, protocol = await loop.create_unix_connection(
+                lambda: AsyncProtocol(parser, self._max_read_buffer),
+                path=self.unix_sock
+            )
+        return protocol
 
-    async def _setdb(self):
-        if self._sentinel:
-            return
-        if self.database is None:
+    @contextlib.asynccontextmanager
+    async def deadline(self, deadline):
+        """
+        Bound all operations inside the block by an absolute deadline.
+
+        A single timer cancels the block once the deadline passes, reads
+        inside the block are no longer limited by read_timeout each.
+
+        Args:
+            deadline: time.monotonic() value, math.inf to wait forever or
+                None to keep the per read read_timeout.
+
+        Raises:
+            PyRedisDeadlineExceeded: If the deadline passed, the connection
+                is closed unless it is multiplexed.
+        """
+        if deadline is None:
+            yield
             return
-        await self.write(
-            *["SELECT", self.database]
-        )
-        try:
-            await self.read()
-        except ReplyError as err:
-            await self.close()
-            raise err
+        outer = self._deadline
+        limit = deadline if outer is None else min(deadline, outer)
+        if not self._multiplex:
+            # Callers of a multiplexed connection share the reader, only
+            # the expired caller is cancelled.
+            self._deadline = limit
+        task = asyncio.current_task()
+        expired = list()
+        handle = None
 
-    async def _set_read_only(self):
-        if self._read_only:
-            await self.write("READONLY")
-            try:
-                await self.read()
-            except ReplyError as err:
+        def expire():
+            expired.append(True)
+            task.cancel()
+
+        if limit != math.inf:
+            loop = asyncio.get_running_loop()
+            handle = loop.call_at(
+                loop.time() + limit - time.monotonic(),
+                expire
+            )
+        try:
+            yield
+        except asyncio.CancelledError:
+            if not expired:
+                raise
+            if hasattr(task, "uncancel"):
+                task.uncancel()
+            if not self._multiplex:
                 await self.close()
-                raise err
+            raise PyRedisDeadlineExceeded("Operation deadline exceeded")
+        finally:
+            if handle is not None:
+                handle.cancel()
+            if not self._multiplex:
+                self._deadline = outer
+
+    @property
+    def read_timeout(self):
+        """Async socket read timeout in seconds."""
+        return self._read_timeout
 
     async def close(self):
         """
         Asynchronously close the socket writer and clean up connection resources.
         """
+        self._closed = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._batch = bytearray()
+        self._batch_count = 0
+        self._out = bytearray()
+        self._fail_pending(PyRedisConnClosed("Connection closed"))
+        task = self._reader_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            self._reader_task = None
         if self._writer:
             self._writer.close()
             try:
                 await self._writer.wait_closed()
             except Exception:
                 pass
+        self._ready = False
         self._reader = None
         self._writer = None
         self._reader_parser = None
+        self._stream_remaining = 0
+        self._stream_token = None
         self._closed = True
 
     @property
@@ -176,7 +365,6 @@ class AsyncConnection(object):
         """
         return self._closed
 
-
     async def read(self, close_on_timeout=True, raise_on_result_err=True):
         """
         Asynchronously read and parse a reply from the Redis server.
@@ -194,28 +382,524 @@ class AsyncConnection(object):
         while True:
             result = self._reader_parser.gets()
             if result is not False:
+                if self._push_handler and isinstance(result, Push):
+                    self._push_handler(result)
+                    continue
                 if raise_on_result_err:
                     if isinstance(result, Exception):
                         raise result
                 return result
-            try:
+            await self._fill(close_on_timeout)
+
+    async def _fill(self, close_on_timeout):
+        if self._use_protocol:
+            # The protocol feeds the reader as data arrives.
+            await self._wait_data(close_on_timeout)
+            return
+        # StreamReader has no readinto(), a pending large bulk string
+        # is read in one piece that feed() copies straight into place.
+        size = self._read_size
+        if self._bulk_reader:
+            view = self._reader_parser.bulk_view()
+            if view is not None:
+                size = max(size, len(view))
+                view.release()
+        self._reader_parser.feed(await self._recv(size, close_on_timeout))
+
+    async def read_many(self, count, close_on_timeout=True):
+        """
+        Asynchronously read and parse count replies from the Redis server.
+
+        All replies already buffered are parsed in one pass, the stream is
+        only read when the buffer runs dry. Error replies are returned as
+        exception instances instead of being raised.
+
+        Args:
+            count: Number of replies to read.
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            List of parsed Redis replies.
+        """
+        if not self._writer:
+            await self._connect()
+        results = list()
+        while len(results) < count:
+            wanted = count - len(results)
+            gets_many = getattr(self._reader_parser, "gets_many", None)
+            if gets_many is not None:
+                batch = gets_many(wanted)
+            else:
+                batch = list()
+                while len(batch) < wanted:
+                    result = self._reader_parser.gets()
+                    if result is False:
+                        break
+                    batch.append(result)
+            for result in batch:
+                if self._push_handler and isinstance(result, Push):
+                    self._push_handler(result)
+                else:
+                    results.append(result)
+            if len(batch) < wanted:
+                await self._fill(close_on_timeout)
+        return results
+
+    async def skip_many(self, count, close_on_timeout=True):
+        """
+        Asynchronously read and discard count replies from the Redis server.
+
+        Replies are skipped by their framing without being parsed, only
+        error replies are counted. Push frames still go to the push
+        handler. Falls back to read_many() if the reader has no fast path.
+
+        Args:
+            count: Number of replies to skip.
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            Number of error replies among the skipped ones.
+        """
+        if not self._writer:
+            await self._connect()
+        skip_many = getattr(self._reader_parser, "skip_many", None)
+        if skip_many is None:
+            results = await self.read_many(
+                count, close_on_timeout=close_on_timeout
+            )
+            return sum(isinstance(result, Exception) for result in results)
+        errors = 0
+        while count:
+            skipped, failed = skip_many(
+                count, push_handler=self._push_handler
+            )
+            count -= skipped
+            errors += failed
+            if count:
+                await self._fill(close_on_timeout)
+        return errors
+
+    async def _recv(self, size, close_on_timeout):
+        try:
+            if self._deadline is not None:
+                # The timer of deadline() guards the whole operation.
+                data = await self._reader.read(size)
+            else:
                 data = await asyncio.wait_for(
-                    self._reader.read(1500),
+                    self._reader.read(size),
                     timeout=self._read_timeout
                 )
-            except asyncio.TimeoutError:
-                if close_on_timeout:
-                    await self.close()
-                raise PyRedisConnReadTimeout(
-                    "Connection timeout while reading"
+        except asyncio.TimeoutError:
+            if close_on_timeout:
+                await self.close()
+            raise PyRedisConnReadTimeout(
+                "Connection timeout while reading"
+            )
+        except ConnectionResetError:
+            await self.close()
+            raise PyRedisConnError("Connection reset by peer")
+        if not data:
+            await self.close()
+            raise PyRedisConnClosed("Connection went away while reading")
+        if size == self._read_size:
+            self._adapt_read_size(len(data))
+        return data
+
+    async def _wait_data(self, close_on_timeout):
+        try:
+            if self._deadline is not None:
+                # The timer of deadline() guards the whole operation.
+                received = await self._reader.wait()
+            else:
+                received = await self._reader.wait(self._read_timeout)
+        except asyncio.TimeoutError:
+            if close_on_timeout:
+                await self.close()
+            raise PyRedisConnReadTimeout(
+                "Connection timeout while reading"
+            )
+        except ConnectionResetError:
+            await self.close()
+            raise PyRedisConnError("Connection reset by peer")
+        if not received:
+            await self.close()
+            raise PyRedisConnClosed("Connection went away while reading")
+
+    def _adapt_read_size(self, nbytes):
+        # The read size starts at read_buffer_size, doubles whenever a read
+        # returns as much as was requested and shrinks again after a run of
+        # small reads.
+        size = self._read_size
+        if nbytes == size:
+            self._small_reads = 0
+            self._read_size = min(size * 2, self._max_read_buffer)
+        elif nbytes < size // 4 and size > self._read_buffer_size:
+            self._small_reads += 1
+            if self._small_reads >= 16:
+                self._small_reads = 0
+                self._read_size = max(size // 2, self._read_buffer_size)
+        else:
+            self._small_reads = 0
+
+    async def read_iter(self, close_on_timeout=True):
+        """
+        Asynchronously read an aggregate reply lazily, element by element.
+
+        Only the header is parsed up front, elements are parsed off the
+        stream while the returned async iterator is consumed. Map replies
+        yield (key, value) tuples, non aggregate replies yield the reply
+        itself. If the iterator is abandoned, the rest of the reply is
+        discarded by the next write on this connection.
+
+        Args:
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            Async iterator over the reply elements.
+        """
+        await self._discard_stream()
+        if not self._writer:
+            await self._connect()
+        if not hasattr(self._reader_parser, "gets_header"):
+            return self._iter_reply(
+                await self.read(close_on_timeout=close_on_timeout)
+            )
+        while True:
+            header = self._reader_parser.gets_header(bulk=False)
+            if header is False:
+                await self._fill(close_on_timeout)
+                continue
+            kind, size = header
+            if kind is None:
+                if self._push_handler and isinstance(size, Push):
+                    self._push_handler(size)
+                    continue
+                if isinstance(size, Exception):
+                    raise size
+                return self._iter_reply(size)
+            break
+        if size < 0:
+            return self._iter_reply(None)
+        pairs = kind == b"%"
+        self._stream_remaining = size * 2 if pairs else size
+        self._stream_token = token = object()
+        return self._read_elements(token, pairs)
+
+    async def _read_elements(self, token, pairs):
+        key = None
+        while True:
+            if self._stream_token is not token:
+                raise PyRedisError("Stream reply was discarded")
+            if not self._stream_remaining:
+                break
+            result = self._reader_parser.gets()
+            if result is False:
+                # Timeouts in the middle of a reply always close, the
+                # stream would be out of sync otherwise.
+                await self._fill(True)
+                continue
+            self._stream_remaining -= 1
+            if not pairs:
+                yield result
+            elif self._stream_remaining % 2:
+                key = result
+            else:
+                yield key, result
+        self._stream_token = None
+
+    async def _discard_stream(self):
+        self._stream_token = None
+        while self._stream_remaining:
+            result = self._reader_parser.gets()
+            if result is False:
+                await self._fill(True)
+                continue
+            self._stream_remaining -= 1
+
+    @staticmethod
+    async def _iter_reply(reply):
+        if reply is None:
+            return
+        if isinstance(reply, dict):
+            reply = reply.items()
+        elif not isinstance(reply, (list, set)):
+            reply = (reply,)
+        for item in reply:
+            yield item
+
+    async def read_into(self, target, close_on_timeout=True):
+        """
+        Asynchronously read a bulk string reply into a buffer or file.
+
+        The payload is copied to target chunk by chunk as it arrives, it is
+        never held in memory as a whole.
+
+        Args:
+            target: Writable buffer (bytearray, mmap, memoryview) large
+                enough for the value, or a file-like object with write().
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            Number of bytes written to target, or None if the key is nil.
+        """
+        if not self._writer:
+            await self._connect()
+        if not hasattr(self._reader_parser, "gets_header"):
+            return await self._read_into_fallback(target, close_on_timeout)
+        while True:
+            header = self._reader_parser.gets_header()
+            if header is False:
+                await self._fill(close_on_timeout)
+                continue
+            kind, size = header
+            if kind is None:
+                if self._push_handler and isinstance(size, Push):
+                    self._push_handler(size)
+                    continue
+                if isinstance(size, Exception):
+                    raise size
+                if size is None:
+                    return None
+                raise PyRedisError(
+                    f"Expected bulk string reply, got {type(size).__name__}"
                 )
-            except ConnectionResetError:
+            if kind != b"$":
                 await self.close()
-                raise PyRedisConnError("Connection reset by peer")
-            if not data:
+                raise PyRedisError(
+                    f"Expected bulk string reply, got {kind!r} header"
+                )
+            if size < 0:
+                return None
+            break
+        try:
+            view = memoryview(target).cast("B")
+        except TypeError:
+            view = None
+        if view is not None:
+            with view:
+                if view.readonly or len(view) < size:
+                    await self.close()
+                    raise PyRedisError(
+                        f"Target buffer too small for {size} bytes"
+                    )
+                pos = 0
+                while pos < size:
+                    data = await self._read_payload(size - pos)
+                    view[pos:pos + len(data)] = data
+                    pos += len(data)
+        else:
+            remaining = size
+            while remaining:
+                data = await self._read_payload(remaining)
+                target.write(data)
+                remaining -= len(data)
+        remaining = 2
+        while remaining:
+            remaining -= len(await self._read_payload(remaining))
+        return size
+
+    async def _read_payload(self, size):
+        # A timeout in the middle of a payload leaves the stream out of
+        # sync, so the connection is always closed.
+        data = self._reader_parser.take(min(size, 65536))
+        if data:
+            return data
+        if self._use_protocol:
+            await self._wait_data(True)
+            return self._reader_parser.take(min(size, 65536))
+        return await self._recv(min(size, 65536), True)
+
+    async def _read_into_fallback(self, target, close_on_timeout):
+        result = await self.read(close_on_timeout=close_on_timeout)
+        if result is None:
+            return None
+        try:
+            view = memoryview(target).cast("B")
+        except TypeError:
+            target.write(result)
+            return len(result)
+        with view:
+            if view.readonly or len(view) < len(result):
+                raise PyRedisError(
+                    f"Target buffer too small for {len(result)} bytes"
+                )
+            view[:len(result)] = result
+        return len(result)
+
+    async def request(self, *args):
+        """
+        Send a command and wait for its reply on a multiplexed connection.
+
+        Any number of coroutines may call request() concurrently. Commands
+        are written in call order and a single reader task hands the replies
+        to the callers in the same order. A cancelled caller's reply is
+        discarded, the stream stays in sync. Blocking commands hold up all
+        callers and should not be sent over a multiplexed connection.
+
+        With auto_pipeline the command is queued and written together with
+        all other commands of the current event loop iteration.
+
+        Args:
+            *args: Command name and positional arguments.
+
+        Returns:
+            Parsed Redis reply.
+
+        Raises:
+            PyRedisError: If the connection is not multiplexed.
+        """
+        waiters = await self._submit((args,), raw=False)
+        return await waiters[0]
+
+    async def request_many(self, commands):
+        """
+        Send many commands and wait for their replies on a multiplexed
+        connection.
+
+        The commands are written back to back, no command of another caller
+        is sent in between them.
+
+        Args:
+            commands: Iterable of argument tuples, e.g. [("GET", "key")].
+
+        Returns:
+            List of parsed Redis replies. Error replies are returned as
+            exception instances instead of being raised.
+
+        Raises:
+            PyRedisError: If the connection is not multiplexed.
+        """
+        commands = list(commands)
+        if not commands:
+            return list()
+        waiters = await self._submit(commands, raw=True)
+        return await asyncio.gather(*waiters)
+
+    async def _submit(self, commands, raw):
+        if not self._multiplex:
+            raise PyRedisError("request() requires multiplex=True")
+        if not self._ready:
+            # The writer is set while the handshake is still running, only
+            # callers after it may write.
+            if self._connect_lock is None:
+                self._connect_lock = asyncio.Lock()
+            async with self._connect_lock:
+                if not self._ready:
+                    await self._connect()
+            if not self._ready:
+                raise PyRedisConnError("Connection Gone")
+        if self._auto_pipeline:
+            # New commands wait while the transport is above its high-water
+            # mark, which bounds the batches queued meanwhile.
+            await self._drain()
+        loop = asyncio.get_running_loop()
+        waiters = [loop.create_future() for _ in commands]
+        # No await between queueing the waiters and writing the commands,
+        # the order of self._pending always matches the stream.
+        if self._auto_pipeline:
+            for args in commands:
+                self._queue(args)
+        else:
+            try:
+                if len(commands) != 1:
+                    self._writer.write(writer_many(commands))
+                elif has_large_arg(commands[0]):
+                    self._writer.writelines(writer_iov(*commands[0]))
+                else:
+                    self._writer.write(self._writer_func(*commands[0]))
+            except BrokenPipeError as err:
                 await self.close()
-                raise PyRedisConnClosed("Connection went away while reading")
-            self._reader_parser.feed(data)
+                raise PyRedisConnError(
+                    f"Connection lost while writing: {err}"
+                )
+        self._pending.extend((waiter, raw) for waiter in waiters)
+        if self._reader_task is None:
+            self._reader_task = asyncio.ensure_future(self._read_replies())
+        if not self._auto_pipeline:
+            await self._drain()
+        return waiters
+
+    async def _drain(self):
+        if self._drain_lock is None:
+            self._drain_lock = asyncio.Lock()
+        try:
+            async with self._drain_lock:
+                if not self._writer:
+                    raise PyRedisConnError("Connection Gone")
+                await self._writer.drain()
+        except (BrokenPipeError, ConnectionResetError) as err:
+            await self.close()
+            raise PyRedisConnError(
+                f"Connection lost while writing: {err}"
+            )
+
+    def _queue(self, args):
+        writer_many((args,), out=self._batch)
+        self._batch_count += 1
+        if (
+            self._pipeline_max_batch
+            and self._batch_count >= self._pipeline_max_batch
+        ):
+            self._flush_batch()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self._pipeline_delay:
+                self._flush_handle = loop.call_later(
+                    self._pipeline_delay,
+                    self._flush_batch
+                )
+            else:
+                self._flush_handle = loop.call_soon(self._flush_batch)
+
+    def _flush_batch(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._batch_count:
+            return
+        data = self._batch
+        self._batch = bytearray()
+        self._batch_count = 0
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            # Runs as a loop callback, nobody would see an exception here.
+            self._fail_pending(PyRedisConnClosed("Connection closed"))
+            asyncio.ensure_future(self.close())
+            return
+        try:
+            writer.write(data)
+        except OSError as err:
+            self._fail_pending(PyRedisConnError(
+                f"Connection lost while writing: {err}"
+            ))
+            asyncio.ensure_future(self.close())
+
+    async def _read_replies(self):
+        try:
+            while self._pending:
+                reply = await self.read(raise_on_result_err=False)
+                if isinstance(reply, Push):
+                    # Unhandled push messages belong to no caller.
+                    continue
+                waiter, raw = self._pending.popleft()
+                if waiter.done():
+                    continue
+                if isinstance(reply, Exception) and not raw:
+                    waiter.set_exception(reply)
+                else:
+                    waiter.set_result(reply)
+        except Exception as err:
+            self._fail_pending(err)
+            await self.close()
+        finally:
+            if self._reader_task is asyncio.current_task():
+                self._reader_task = None
+
+    def _fail_pending(self, err):
+        while self._pending:
+            waiter, _ = self._pending.popleft()
+            if not waiter.done():
+                waiter.set_exception(err)
 
     async def write(self, *args):
         """
@@ -225,9 +909,45 @@ class AsyncConnection(object):
             *args: Command name and positional arguments.
         """
 
+        await self._discard_stream()
         if not self._writer:
             await self._connect()
-        data = self._writer_func(*args)
+        try:
+            if has_large_arg(args):
+                # Large arguments are passed on as separate buffers
+                # instead of being copied into one joined command.
+                self._writer.writelines(writer_iov(*args))
+            else:
+                self._writer.write(self._writer_func(*args))
+            await self._writer.drain()
+        except BrokenPipeError as err:
+            await self.close()
+            raise PyRedisConnError(
+                f"Connection lost while writing: {err}"
+            )
+
+    def queue(self, *args):
+        """
+        Serialize a command into the output buffer without sending it.
+
+        Queued commands are sent with the next flush().
+
+        Args:
+            *args: Command name and positional arguments.
+        """
+        writer_many((args,), self._out)
+
+    async def flush(self):
+        """
+        Asynchronously send all queued commands with a single write.
+        """
+        if not self._out:
+            return
+        await self._discard_stream()
+        if not self._writer:
+            await self._connect()
+        data = self._out
+        self._out = bytearray()
         try:
             self._writer.write(data)
             await self._writer.drain()
@@ -236,3 +956,82 @@ class AsyncConnection(object):
             raise PyRedisConnError(
                 f"Connection lost while writing: {err}"
             )
+
+    async def write_many(self, commands):
+        """
+        Asynchronously serialize and send many commands at once.
+
+        Args:
+            commands: Iterable of argument tuples, e.g. [("GET", "key")].
+        """
+
+        await self._discard_stream()
+        if not self._writer:
+            await self._connect()
+        try:
+            self._writer.write(writer_many(commands))
+            await self._writer.drain()
+        except BrokenPipeError as err:
+            await self.close()
+            raise PyRedisConnError(
+                f"Connection lost while writing: {err}"
+            )
+
+    async def write_stream(self, head, source, tail=(), length=None):
+        """
+        Asynchronously send a command with one argument streamed from a
+        buffer or file.
+
+        The command is framed without building it in memory, the streamed
+        argument is written in chunks straight from source.
+
+        Args:
+            head: Arguments before the streamed one, e.g. (b"SET", key).
+            source: Buffer (bytes, bytearray, mmap) or readable file-like
+                object providing the value.
+            tail: Arguments following the streamed one.
+            length: Number of bytes to send. Required for unseekable
+                file-like objects.
+        """
+        if length is None:
+            length = stream_length(source)
+        await self._discard_stream()
+        if not self._writer:
+            await self._connect()
+        try:
+            self._writer.write(b"".join((
+                b"*", str(len(head) + len(tail) + 1).encode(), b"\r\n",
+                writer_args(*head),
+                b"$", str(length).encode(), b"\r\n",
+            )))
+            try:
+                view = memoryview(source).cast("B")
+            except TypeError:
+                view = None
+            if view is not None:
+                with view:
+                    if len(view) < length:
+                        await self.close()
+                        raise PyRedisError("Source shorter than length")
+                    for pos in range(0, length, 65536):
+                        self._writer.write(
+                            view[pos:min(pos + 65536, length)].tobytes()
+                        )
+                        await self._writer.drain()
+            else:
+                remaining = length
+                while remaining:
+                    data = source.read(min(remaining, 65536))
+                    if not data:
+                        await self.close()
+                        raise PyRedisError("Source shorter than length")
+                    self._writer.write(data)
+                    await self._writer.drain()
+                    remaining -= len(data)
+            self._writer.write(b"\r\n" + writer_args(*tail))
+            await self._writer.drain()
+        except BrokenPipeError as err:
+            await self.close()
+            raise PyRedisConnError(
+                f"Connection lost while writing: {err}"
+            )
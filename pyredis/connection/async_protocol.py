@@ -0,0 +1,160 @@
+import asyncio
+
+
+class AsyncProtocol(asyncio.Protocol):
+    """
+    asyncio.Protocol based transport of AsyncConnection.
+
+    Received data is fed straight into the RESP reader and wakes up the
+    coroutine waiting for a reply, no StreamReader buffer and no read task
+    sit in between. Writes go to the transport directly, drain() only waits
+    while the transport is above its high-water mark.
+
+    Reading is paused while more than high_water bytes are buffered in
+    the reader and resumed once a coroutine waits for more data, so large
+    replies consumed piecewise, like by read_into(), are never held in
+    memory as a whole.
+
+    Works with any event loop implementing the protocol API, like uvloop.
+    """
+
+    def __init__(self, parser, high_water=1048576):
+        """
+        Initialize the protocol.
+
+        Args:
+            parser: RESP reader received data is fed into.
+            high_water: Buffered bytes above which reading is paused.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._parser = parser
+        self._buffered = getattr(parser, "buffered", None)
+        self._high_water = high_water
+        self._reading_paused = False
+        self._transport = None
+        self._waiter = None
+        self._drain_waiter = None
+        self._paused = False
+        self._received = 0
+        self._eof = False
+        self._exc = None
+        self._closed = self._loop.create_future()
+
+    def connection_made(self, transport):
+        self._transport = transport
+
+    def data_received(self, data):
+        self._parser.feed(data)
+        self._received += 1
+        if (
+            self._buffered is not None
+            and self._buffered() > self._high_water
+        ):
+            self._transport.pause_reading()
+            self._reading_paused = True
+        self._wakeup()
+
+    def eof_received(self):
+        self._eof = True
+        self._wakeup()
+
+    def connection_lost(self, exc):
+        self._eof = True
+        self._exc = exc
+        self._wakeup()
+        waiter = self._drain_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(BrokenPipeError("Connection lost"))
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        waiter = self._drain_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _wakeup(self):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    @staticmethod
+    def _expire(waiter):
+        if not waiter.done():
+            waiter.set_exception(asyncio.TimeoutError())
+
+    async def wait(self, timeout=None):
+        """
+        Wait until more data has been fed into the reader.
+
+        Args:
+            timeout: Seconds to wait, None waits forever.
+
+        Returns:
+            True if data was received, False if the peer closed the
+            connection.
+
+        Raises:
+            asyncio.TimeoutError: If no data arrived within timeout.
+            ConnectionResetError: If the connection was reset.
+        """
+        received = self._received
+        if self._reading_paused:
+            self._reading_paused = False
+            self._transport.resume_reading()
+        if not self._eof:
+            self._waiter = waiter = self._loop.create_future()
+            handle = None
+            if timeout is not None:
+                handle = self._loop.call_later(timeout, self._expire, waiter)
+            try:
+                await waiter
+            finally:
+                self._waiter = None
+                if handle is not None:
+                    handle.cancel()
+        if self._received != received:
+            return True
+        if isinstance(self._exc, ConnectionResetError):
+            raise self._exc
+        return False
+
+    def write(self, data):
+        """Write data to the transport."""
+        self._transport.write(data)
+
+    def writelines(self, parts):
+        """Write a list of buffers to the transport."""
+        self._transport.writelines(parts)
+
+    async def drain(self):
+        """Wait until the transport is below its high-water mark."""
+        if self._closed.done():
+            raise BrokenPipeError("Connection lost")
+        if not self._paused:
+            return
+        self._drain_waiter = waiter = self._loop.create_future()
+        try:
+            await waiter
+        finally:
+            self._drain_waiter = None
+
+    def close(self):
+        """Close the transport."""
+        self._transport.close()
+
+    def is_closing(self):
+        """Return True if the transport is closing or closed."""
+        return self._transport.is_closing()
+
+    async def wait_closed(self):
+        """Wait until the connection is closed."""
+        await self._closed
+
+    def get_extra_info(self, name, default=None):
+        """Return transport information, like the underlying socket."""
+        return self._transport.get_extra_info(name, default)
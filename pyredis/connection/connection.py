@@ -1,9 +1,25 @@
+import contextlib
+import math
+import os
+import select
+import time
+
 import pyredis.connection
 from pyredis.exceptions import PyRedisConnClosed
 from pyredis.exceptions import PyRedisConnError
 from pyredis.exceptions import PyRedisConnReadTimeout
+from pyredis.exceptions import PyRedisDeadlineExceeded
 from pyredis.exceptions import PyRedisError
-from pyredis.exceptions import ReplyError
+from pyredis.connection.options import merge_socket_options
+from pyredis.connection.options import set_socket_options
+from pyredis.protocol import Push
+from pyredis.protocol import has_large_arg
+from pyredis.protocol import stream_length
+from pyredis.protocol import writer_args
+from pyredis.protocol import writer_iov
+from pyredis.protocol import writer_many
+
+IOV_MAX = 1024
 
 
 class Connection(object):
@@ -27,6 +43,13 @@ class Connection(object):
         read_timeout=2,
         sentinel=False,
         username=None,
+        protocol=None,
+        push_handler=None,
+        bulk_type=bytes,
+        read_buffer_size=16384,
+        max_read_buffer=1048576,
+        client_name=None,
+        socket_options=None,
     ):
         """
         Initialize connection parameters.
@@ -43,18 +66,46 @@ class Connection(object):
             read_timeout: Socket read timeout in seconds.
             sentinel: Flag indicating if this is a Sentinel connection.
             username: Username for ACL authentication.
+            protocol: RESP protocol version negotiated with HELLO (2 or 3).
+                None skips HELLO and talks RESP2 to any server version.
+            push_handler: Callable receiving RESP3 push messages. If not set,
+                push messages are returned by read() like regular replies.
+            bulk_type: Type of returned bulk strings, bytes, bytearray or
+                memoryview. bytearray and memoryview avoid the final copy of
+                large values. Only supported by the builtin Reader.
+            read_buffer_size: Initial size in bytes of the receive buffer.
+            max_read_buffer: Size in bytes the receive buffer may grow to
+                while large replies are read.
+            client_name: Connection name set with CLIENT SETNAME.
+            socket_options: Dict of socket options, e.g. {"keepalive_idle":
+                60, "user_timeout": 10}. TCP_NODELAY is enabled unless
+                tcp_nodelay is set to False.
         """
         if not bool(host) != bool(unix_sock):
             raise PyRedisError("Ether host or unix_sock has to be provided")
         self._closed = False
         self._conn_timeout = conn_timeout
+        self._protocol = protocol
+        self._client_name = client_name
+        self._socket_options = merge_socket_options(socket_options)
+        self._push_handler = push_handler
+        self._bulk_type = bulk_type
         self._read_only = read_only
         self._read_timeout = read_timeout
+        self._deadline = None
         self._encoding = encoding
         self._reader = None
+        self._bulk_reader = False
+        self._read_buffer_size = read_buffer_size
+        self._max_read_buffer = max(max_read_buffer, read_buffer_size)
+        self._read_view = None
+        self._small_reads = 0
         self._sentinel = sentinel
         self._writer = pyredis.connection.writer
+        self._out = bytearray()
         self._sock = None
+        self._stream_remaining = 0
+        self._stream_token = None
         self.host = host
         self.port = port
         self.unix_sock = unix_sock
@@ -62,25 +113,41 @@ class Connection(object):
         self.username = username
         self.database = database
 
-    def _authenticate(self):
-        if self.username and self.password:
-            self.write(
-                *["AUTH", self.username, self.password]
-            )
-            try:
-                self.read()
-            except ReplyError as err:
-                self.close()
-                raise err
+    def _handshake_commands(self):
+        commands = list()
+        if self._protocol:
+            hello = ["HELLO", self._protocol]
+            if self.password:
+                hello.extend(("AUTH", self.username or "default", self.password))
+            if self._client_name:
+                hello.extend(("SETNAME", self._client_name))
+            commands.append(hello)
+        elif self.username and self.password:
+            commands.append(["AUTH", self.username, self.password])
         elif self.password:
-            self.write(
-                *["AUTH", self.password]
-            )
-            try:
-                self.read()
-            except ReplyError as err:
+            commands.append(["AUTH", self.password])
+        if self._client_name and not self._protocol:
+            commands.append(["CLIENT", "SETNAME", self._client_name])
+        if not self._sentinel:
+            if self.database is not None:
+                commands.append(["SELECT", self.database])
+            if self._read_only:
+                commands.append(["READONLY"])
+        return commands
+
+    def _handshake(self):
+        # All handshake commands go out in one write and their replies are
+        # validated together, costing a single round trip.
+        # They bypass the output buffer, commands queued before connecting
+        # are sent after them.
+        commands = self._handshake_commands()
+        if not commands:
+            return
+        self._send(writer_many(commands))
+        for reply in self.read_many(len(commands)):
+            if isinstance(reply, Exception):
                 self.close()
-                raise err
+                raise reply
 
     def _connect(self):
         if self._closed:
@@ -90,22 +157,24 @@ class Connection(object):
         else:
             sock = self._connect_unix()
         self._sock = sock
+        reader_kwargs = dict()
         if self._encoding:
-            self._reader = pyredis.connection.Reader(encoding=self._encoding)
-        else:
-            self._reader = pyredis.connection.Reader()
-        self._authenticate()
-        if not self._sentinel:
-            self._setdb()
-            self._set_read_only()
+            reader_kwargs["encoding"] = self._encoding
+        if self._bulk_type is not bytes:
+            reader_kwargs["bulk_type"] = self._bulk_type
+        self._reader = pyredis.connection.Reader(**reader_kwargs)
+        self._bulk_reader = hasattr(self._reader, "bulk_view")
+        self._handshake()
         self._sock.settimeout(self._read_timeout)
 
     def _connect_inet46(self):
+        sock = None
         try:
             sock = pyredis.connection.socket.create_connection(
                 address=(self.host, self.port),
-                timeout=self._conn_timeout
+                timeout=self._connect_timeout()
             )
+            set_socket_options(sock, self._socket_options)
         except (
             ConnectionAbortedError,
             ConnectionRefusedError,
@@ -113,6 +182,8 @@ class Connection(object):
             pyredis.connection.socket.timeout,
             OSError,
         ) as err:
+            if sock is not None:
+                sock.close()
             self.close()
             raise PyRedisConnError(
                 f"Could not Connect to {self.host}:{self.port}: {err}"
@@ -120,13 +191,15 @@ class Connection(object):
         return sock
 
     def _connect_unix(self):
+        sock = None
         try:
             sock = pyredis.connection.socket.socket(
                 family=pyredis.connection.socket.AF_UNIX,
                 type=pyredis.connection.socket.SOCK_STREAM,
             )
-            sock.settimeout(self._conn_timeout)
+            sock.settimeout(self._connect_timeout())
             sock.connect(self.unix_sock)
+            set_socket_options(sock, self._socket_options, tcp=False)
         except (
             ConnectionAbortedError,
             ConnectionRefusedError,
@@ -134,35 +207,64 @@ class Connection(object):
             pyredis.connection.socket.timeout,
             OSError,
         ) as err:
+            if sock is not None:
+                sock.close()
             self.close()
             raise PyRedisConnError(
                 f"Could not Connect to {self.host}: {err}"
             )
         return sock
 
-    def _setdb(self):
-        if self._sentinel:
-            return
-        if self.database is None:
+    def _connect_timeout(self):
+        remaining = self._remaining()
+        if remaining is None:
+            return self._conn_timeout
+        return min(self._conn_timeout, remaining)
+
+    def _remaining(self, close_on_timeout=True):
+        # Seconds left until the operation deadline, None without deadline.
+        if self._deadline is None:
+            return None
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            if close_on_timeout:
+                self.close()
+            raise PyRedisDeadlineExceeded("Operation deadline exceeded")
+        return remaining
+
+    def _apply_deadline(self, close_on_timeout=True):
+        remaining = self._remaining(close_on_timeout)
+        if remaining is not None:
+            self._sock.settimeout(None if remaining == math.inf else remaining)
+
+    @contextlib.contextmanager
+    def deadline(self, deadline):
+        """
+        Bound all operations inside the block by an absolute deadline.
+
+        Connecting, writing and every read share the time left until the
+        deadline instead of read_timeout applying to each single recv.
+
+        Args:
+            deadline: time.monotonic() value, math.inf to wait forever or
+                None to keep the per recv read_timeout.
+        """
+        if deadline is None:
+            yield
             return
-        self._sock.settimeout(0.1)
-        self.write(
-            *["SELECT", self.database]
-        )
+        outer = self._deadline
+        self._deadline = deadline if outer is None else min(deadline, outer)
         try:
-            self.read()
-        except ReplyError as err:
-            self.close()
-            raise err
+            yield
+        finally:
+            self._deadline = outer
+            if outer is None and self._sock:
+                self._sock.settimeout(self._read_timeout)
 
-    def _set_read_only(self):
-        if self._read_only:
-            self.write("READONLY")
-            try:
-                self.read()
-            except ReplyError as err:
-                self.close()
-                raise err
+    @property
+    def read_timeout(self):
+        """Socket read timeout in seconds."""
+        return self._read_timeout
 
     def close(self):
         """
@@ -172,6 +274,10 @@ class Connection(object):
             self._sock.close()
         self._sock = None
         self._reader = None
+        self._read_view = None
+        del self._out[:]
+        self._stream_remaining = 0
+        self._stream_token = None
         self._closed = True
 
     @property
@@ -184,6 +290,52 @@ class Connection(object):
         """
         return self._closed
 
+    def _recv(self, close_on_timeout):
+        # The receive buffer starts at read_buffer_size, doubles whenever a
+        # read fills it completely and shrinks again after a run of small
+        # reads. The returned view is only valid until the next call.
+        view = self._read_view
+        if view is None:
+            view = self._read_view = memoryview(
+                bytearray(self._read_buffer_size)
+            )
+        nbytes = self._recv_into(view, close_on_timeout)
+        size = len(view)
+        if nbytes == size:
+            self._small_reads = 0
+            if size < self._max_read_buffer:
+                self._read_view = memoryview(
+                    bytearray(min(size * 2, self._max_read_buffer))
+                )
+        elif nbytes < size // 4 and size > self._read_buffer_size:
+            self._small_reads += 1
+            if self._small_reads >= 16:
+                self._small_reads = 0
+                self._read_view = memoryview(
+                    bytearray(max(size // 2, self._read_buffer_size))
+                )
+        else:
+            self._small_reads = 0
+        return view[:nbytes]
+
+    def _recv_into(self, view, close_on_timeout):
+        self._apply_deadline(close_on_timeout)
+        try:
+            nbytes = self._sock.recv_into(view)
+        except pyredis.connection.socket.timeout:
+            if close_on_timeout:
+                self.close()
+            if self._deadline is not None:
+                raise PyRedisDeadlineExceeded("Operation deadline exceeded")
+            raise PyRedisConnReadTimeout("Connection timeout while reading")
+        except ConnectionResetError:
+            self.close()
+            raise PyRedisConnError("Connection reset by peer")
+        if not nbytes:
+            self.close()
+            raise PyRedisConnClosed("Connection went away while reading")
+        return nbytes
+
     def read(self, close_on_timeout=True, raise_on_result_err=True):
         """
         Read and parse a reply from the Redis server.
@@ -200,25 +352,354 @@ class Connection(object):
         while True:
             result = self._reader.gets()
             if result is not False:
+                if self._push_handler and isinstance(result, Push):
+                    self._push_handler(result)
+                    continue
                 if raise_on_result_err:
                     if isinstance(result, Exception):
                         raise result
                 return result
-            try:
-                data = self._sock.recv(1500)
-            except pyredis.connection.socket.timeout:
-                if close_on_timeout:
-                    self.close()
-                raise PyRedisConnReadTimeout(
-                    "Connection timeout while reading"
+            self._fill(close_on_timeout)
+
+    def _fill(self, close_on_timeout):
+        view = self._reader.bulk_view() if self._bulk_reader else None
+        if view is not None:
+            with view:
+                nbytes = self._recv_into(view, close_on_timeout)
+            self._reader.bulk_advance(nbytes)
+        else:
+            self._reader.feed(self._recv(close_on_timeout))
+
+    def read_many(self, count, close_on_timeout=True):
+        """
+        Read and parse count replies from the Redis server.
+
+        All replies already buffered are parsed in one pass, the socket is
+        only read when the buffer runs dry. Error replies are returned as
+        exception instances instead of being raised.
+
+        Args:
+            count: Number of replies to read.
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            List of parsed Redis replies.
+        """
+        if not self._sock:
+            self._connect()
+        results = list()
+        while len(results) < count:
+            wanted = count - len(results)
+            batch = self._gets_many(wanted)
+            for result in batch:
+                if self._push_handler and isinstance(result, Push):
+                    self._push_handler(result)
+                else:
+                    results.append(result)
+            if len(batch) < wanted:
+                self._fill(close_on_timeout)
+        return results
+
+    def skip_many(self, count, close_on_timeout=True):
+        """
+        Read and discard count replies from the Redis server.
+
+        Replies are skipped by their framing without being parsed, only
+        error replies are counted. Push frames still go to the push
+        handler. Falls back to read_many() if the reader has no fast path.
+
+        Args:
+            count: Number of replies to skip.
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            Number of error replies among the skipped ones.
+        """
+        if not self._sock:
+            self._connect()
+        skip_many = getattr(self._reader, "skip_many", None)
+        if skip_many is None:
+            results = self.read_many(count, close_on_timeout=close_on_timeout)
+            return sum(isinstance(result, Exception) for result in results)
+        errors = 0
+        while count:
+            skipped, failed = skip_many(
+                count, push_handler=self._push_handler
+            )
+            count -= skipped
+            errors += failed
+            if count:
+                self._fill(close_on_timeout)
+        return errors
+
+    def skip_ready(self, count, close_on_timeout=True):
+        """
+        Skip up to count replies without waiting for the server.
+
+        The non-blocking counterpart of skip_many(), only replies that are
+        buffered or already waiting in the socket are skipped. A reply cut
+        off by the socket running dry is resumed by the next skip_ready()
+        or skip_many() call, it must not be mixed with read_ready().
+
+        Args:
+            count: Maximum number of replies to skip.
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            Tuple of the number of replies skipped and how many of them were
+            error replies.
+        """
+        if not self._sock:
+            self._connect()
+        skip_many = getattr(self._reader, "skip_many", None)
+        if skip_many is None:
+            results = self.read_ready(count, close_on_timeout=close_on_timeout)
+            return len(results), sum(
+                isinstance(result, Exception) for result in results
+            )
+        skipped = 0
+        errors = 0
+        while skipped < count:
+            done, failed = skip_many(
+                count - skipped, push_handler=self._push_handler
+            )
+            skipped += done
+            errors += failed
+            if skipped < count:
+                if not self._readable():
+                    break
+                self._fill(close_on_timeout)
+        return skipped, errors
+
+    def read_ready(self, count, close_on_timeout=True):
+        """
+        Read and parse up to count replies without waiting for the server.
+
+        Only replies that are buffered or already waiting in the socket are
+        returned, the socket is read while it has data. Error replies are
+        returned as exception instances instead of being raised.
+
+        Args:
+            count: Maximum number of replies to read.
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            List of parsed Redis replies, possibly empty.
+        """
+        if not self._sock:
+            self._connect()
+        results = list()
+        while len(results) < count:
+            wanted = count - len(results)
+            batch = self._gets_many(wanted)
+            for result in batch:
+                if self._push_handler and isinstance(result, Push):
+                    self._push_handler(result)
+                else:
+                    results.append(result)
+            if len(batch) < wanted:
+                if not self._readable():
+                    break
+                self._fill(close_on_timeout)
+        return results
+
+    def _gets_many(self, wanted):
+        gets_many = getattr(self._reader, "gets_many", None)
+        if gets_many is not None:
+            return gets_many(wanted)
+        batch = list()
+        while len(batch) < wanted:
+            result = self._reader.gets()
+            if result is False:
+                break
+            batch.append(result)
+        return batch
+
+    def _readable(self):
+        # poll() is not limited to descriptors below FD_SETSIZE, select()
+        # is the fallback for platforms without it.
+        if hasattr(select, "poll"):
+            poller = select.poll()
+            poller.register(self._sock, select.POLLIN)
+            return bool(poller.poll(0))
+        readable, _, _ = select.select((self._sock,), (), (), 0)
+        return bool(readable)
+
+    def read_iter(self, close_on_timeout=True):
+        """
+        Read an aggregate reply lazily, element by element.
+
+        Only the header is parsed up front, elements are parsed off the
+        socket while the returned iterator is consumed. Map replies yield
+        (key, value) tuples, non aggregate replies yield the reply itself.
+        If the iterator is abandoned, the rest of the reply is discarded by
+        the next write on this connection.
+
+        Args:
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            Iterator over the reply elements.
+        """
+        self._discard_stream()
+        if not self._sock:
+            self._connect()
+        if not hasattr(self._reader, "gets_header"):
+            return self._iter_reply(self.read(close_on_timeout=close_on_timeout))
+        while True:
+            header = self._reader.gets_header(bulk=False)
+            if header is False:
+                self._reader.feed(self._recv(close_on_timeout))
+                continue
+            kind, size = header
+            if kind is None:
+                if self._push_handler and isinstance(size, Push):
+                    self._push_handler(size)
+                    continue
+                if isinstance(size, Exception):
+                    raise size
+                return self._iter_reply(size)
+            break
+        if size < 0:
+            return iter(())
+        pairs = kind == b"%"
+        self._stream_remaining = size * 2 if pairs else size
+        self._stream_token = token = object()
+        return self._read_elements(token, pairs)
+
+    def _read_elements(self, token, pairs):
+        key = None
+        while True:
+            if self._stream_token is not token:
+                raise PyRedisError("Stream reply was discarded")
+            if not self._stream_remaining:
+                break
+            result = self._reader.gets()
+            if result is False:
+                # Timeouts in the middle of a reply always close, the
+                # stream would be out of sync otherwise.
+                self._reader.feed(self._recv(True))
+                continue
+            self._stream_remaining -= 1
+            if not pairs:
+                yield result
+            elif self._stream_remaining % 2:
+                key = result
+            else:
+                yield key, result
+        self._stream_token = None
+
+    def _discard_stream(self):
+        self._stream_token = None
+        while self._stream_remaining:
+            result = self._reader.gets()
+            if result is False:
+                self._reader.feed(self._recv(True))
+                continue
+            self._stream_remaining -= 1
+
+    @staticmethod
+    def _iter_reply(reply):
+        if reply is None:
+            return iter(())
+        if isinstance(reply, dict):
+            return iter(reply.items())
+        if isinstance(reply, (list, set)):
+            return iter(reply)
+        return iter((reply,))
+
+    def read_into(self, target, close_on_timeout=True):
+        """
+        Read a bulk string reply directly into a buffer or file.
+
+        The payload is copied to target chunk by chunk as it arrives, it is
+        never held in memory as a whole.
+
+        Args:
+            target: Writable buffer (bytearray, mmap, memoryview) large
+                enough for the value, or a file-like object with write().
+            close_on_timeout: If True, closes the connection on read timeout.
+
+        Returns:
+            Number of bytes written to target, or None if the key is nil.
+        """
+        if not self._sock:
+            self._connect()
+        if not hasattr(self._reader, "gets_header"):
+            return self._read_into_fallback(target, close_on_timeout)
+        while True:
+            header = self._reader.gets_header()
+            if header is False:
+                self._reader.feed(self._recv(close_on_timeout))
+                continue
+            kind, size = header
+            if kind is None:
+                if self._push_handler and isinstance(size, Push):
+                    self._push_handler(size)
+                    continue
+                if isinstance(size, Exception):
+                    raise size
+                if size is None:
+                    return None
+                raise PyRedisError(
+                    f"Expected bulk string reply, got {type(size).__name__}"
                 )
-            except ConnectionResetError:
-                self.close()
-                raise PyRedisConnError("Connection reset by peer")
-            if not data:
+            if kind != b"$":
                 self.close()
-                raise PyRedisConnClosed("Connection went away while reading")
-            self._reader.feed(data)
+                raise PyRedisError(
+                    f"Expected bulk string reply, got {kind!r} header"
+                )
+            if size < 0:
+                return None
+            break
+        try:
+            view = memoryview(target).cast("B")
+        except TypeError:
+            view = None
+        if view is not None:
+            with view:
+                if view.readonly or len(view) < size:
+                    self.close()
+                    raise PyRedisError(
+                        f"Target buffer too small for {size} bytes"
+                    )
+                self._read_payload(view[:size])
+        else:
+            with memoryview(bytearray(min(size, 65536))) as chunk:
+                remaining = size
+                while remaining:
+                    part = chunk[:min(remaining, len(chunk))]
+                    self._read_payload(part)
+                    target.write(part)
+                    remaining -= len(part)
+        self._read_payload(memoryview(bytearray(2)))
+        return size
+
+    def _read_payload(self, view):
+        # A timeout in the middle of a payload leaves the stream out of
+        # sync, so the connection is always closed.
+        data = self._reader.take(len(view))
+        pos = len(data)
+        view[:pos] = data
+        while pos < len(view):
+            pos += self._recv_into(view[pos:], True)
+
+    def _read_into_fallback(self, target, close_on_timeout):
+        result = self.read(close_on_timeout=close_on_timeout)
+        if result is None:
+            return None
+        try:
+            view = memoryview(target).cast("B")
+        except TypeError:
+            target.write(result)
+            return len(result)
+        with view:
+            if view.readonly or len(view) < len(result):
+                raise PyRedisError(
+                    f"Target buffer too small for {len(result)} bytes"
+                )
+            view[:len(result)] = result
+        return len(result)
 
     def write(self, *args):
         """
@@ -227,13 +708,180 @@ class Connection(object):
         Args:
             *args: Command name and positional arguments.
         """
+        self._discard_stream()
+        if not self._sock:
+            self._connect()
+        self._apply_deadline()
+        try:
+            if has_large_arg(args):
+                self._sendmsg(writer_iov(*args))
+            else:
+                self._sock.sendall(self._writer(*args))
+        except BrokenPipeError as err:
+            self.close()
+            raise PyRedisConnError(
+                f"Connection lost while writing: {err}"
+            )
+        except pyredis.connection.socket.timeout:
+            self._write_timeout()
+
+    def _sendmsg(self, parts):
+        # Large arguments are handed to the kernel as separate iovecs
+        # instead of being copied into one joined command first.
+        if not hasattr(self._sock, "sendmsg"):
+            for part in parts:
+                self._sock.sendall(part)
+            return
+        views = [memoryview(part) for part in parts if len(part)]
+        while views:
+            self._apply_deadline()
+            sent = self._sock.sendmsg(views[:IOV_MAX])
+            while sent:
+                size = views[0].nbytes
+                if sent < size:
+                    views[0] = views[0][sent:]
+                    break
+                sent -= size
+                del views[0]
+
+    def queue(self, *args):
+        """
+        Serialize a command into the output buffer without sending it.
+
+        Queued commands are sent with the next flush().
+
+        Args:
+            *args: Command name and positional arguments.
+        """
+        writer_many((args,), self._out)
+
+    def flush(self):
+        """
+        Send all queued commands with a single sendall().
+        """
+        if not self._out:
+            return
+        self._discard_stream()
         if not self._sock:
             self._connect()
-        data = self._writer(*args)
         try:
+            self._send(self._out)
+        finally:
+            del self._out[:]
+
+    def _send(self, data):
+        try:
+            self._apply_deadline()
             self._sock.sendall(data)
         except BrokenPipeError as err:
             self.close()
             raise PyRedisConnError(
                 f"Connection lost while writing: {err}"
             )
+        except pyredis.connection.socket.timeout:
+            self._write_timeout()
+
+    def sync(self, close_on_timeout=True):
+        """
+        Discard all outstanding replies.
+
+        Sends PING with a unique payload and drops every reply until it
+        comes back, which resynchronizes the connection after commands
+        with an unknown number of replies, e.g. after CLIENT REPLY OFF.
+
+        Args:
+            close_on_timeout: If True, closes the connection on read timeout.
+        """
+        token = os.urandom(8).hex()
+        self.queue("PING", token)
+        self.flush()
+        while True:
+            result = self.read(
+                close_on_timeout=close_on_timeout,
+                raise_on_result_err=False
+            )
+            if result == token or result == token.encode():
+                return
+
+    def write_many(self, commands):
+        """
+        Serialize and send many commands at once.
+
+        Args:
+            commands: Iterable of argument tuples, e.g. [("GET", "key")].
+        """
+        writer_many(commands, self._out)
+        self.flush()
+
+    def write_stream(self, head, source, tail=(), length=None):
+        """
+        Send a command with one argument streamed from a buffer or file.
+
+        The command is framed without building it in memory, the streamed
+        argument is sent in chunks straight from source.
+
+        Args:
+            head: Arguments before the streamed one, e.g. (b"SET", key).
+            source: Buffer (bytes, bytearray, mmap) or readable file-like
+                object providing the value.
+            tail: Arguments following the streamed one.
+            length: Number of bytes to send. Required for unseekable
+                file-like objects.
+        """
+        if length is None:
+            length = stream_length(source)
+        self._discard_stream()
+        if not self._sock:
+            self._connect()
+        self._apply_deadline()
+        try:
+            self._sock.sendall(b"".join((
+                b"*", str(len(head) + len(tail) + 1).encode(), b"\r\n",
+                writer_args(*head),
+                b"$", str(length).encode(), b"\r\n",
+            )))
+            try:
+                view = memoryview(source).cast("B")
+            except TypeError:
+                view = None
+            if view is not None:
+                with view:
+                    if len(view) < length:
+                        self.close()
+                        raise PyRedisError("Source shorter than length")
+                    self._sock.sendall(view[:length])
+            else:
+                self._write_file(source, length)
+            self._sock.sendall(b"\r\n" + writer_args(*tail))
+        except BrokenPipeError as err:
+            self.close()
+            raise PyRedisConnError(
+                f"Connection lost while writing: {err}"
+            )
+        except pyredis.connection.socket.timeout:
+            self._write_timeout()
+
+    def _write_timeout(self):
+        # Part of the command may have been sent, the connection is unusable.
+        self.close()
+        if self._deadline is not None:
+            raise PyRedisDeadlineExceeded("Operation deadline exceeded")
+        raise PyRedisConnReadTimeout("Connection timeout while writing")
+
+    def _write_file(self, source, length):
+        with memoryview(bytearray(min(length, 65536))) as chunk:
+            remaining = length
+            while remaining:
+                part = chunk[:min(remaining, len(chunk))]
+                if hasattr(source, "readinto"):
+                    nbytes = source.readinto(part)
+                else:
+                    data = source.read(len(part))
+                    nbytes = len(data)
+                    part[:nbytes] = data
+                if not nbytes:
+                    self.close()
+                    raise PyRedisError("Source shorter than length")
+                self._apply_deadline()
+                self._sock.sendall(part[:nbytes])
+                remaining -= nbytes
@@ -0,0 +1,101 @@
+import socket
+
+from pyredis.exceptions import PyRedisError
+
+DEFAULT_SOCKET_OPTIONS = {
+    "tcp_nodelay": True,
+}
+
+SOCKET_OPTIONS = (
+    "tcp_nodelay",
+    "keepalive",
+    "keepalive_idle",
+    "keepalive_interval",
+    "keepalive_count",
+    "send_buffer",
+    "recv_buffer",
+    "user_timeout",
+)
+
+# Platform specific TCP options, missing constants are skipped. macOS names
+# the keepalive idle time TCP_KEEPALIVE.
+TCP_KEEPALIVE_OPTIONS = (
+    (
+        "keepalive_idle",
+        getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+    ),
+    ("keepalive_interval", getattr(socket, "TCP_KEEPINTVL", None)),
+    ("keepalive_count", getattr(socket, "TCP_KEEPCNT", None)),
+)
+TCP_USER_TIMEOUT = getattr(socket, "TCP_USER_TIMEOUT", None)
+
+
+def merge_socket_options(options=None):
+    """
+    Merge socket options with the defaults.
+
+    Args:
+        options: Dict of socket options, see set_socket_options.
+
+    Returns:
+        Dict of socket options with defaults applied.
+
+    Raises:
+        PyRedisError: If an unknown option is passed.
+    """
+    merged = dict(DEFAULT_SOCKET_OPTIONS)
+    if options:
+        unknown = set(options) - set(SOCKET_OPTIONS)
+        if unknown:
+            raise PyRedisError(
+                f"Unknown socket options: {', '.join(sorted(unknown))}"
+            )
+        merged.update(options)
+    return merged
+
+
+def set_socket_options(sock, options, tcp=True):
+    """
+    Apply socket options to a connected socket.
+
+    Supported options:
+        tcp_nodelay: Disable Nagle's algorithm.
+        keepalive: Enable TCP keepalive probes.
+        keepalive_idle: Idle seconds before the first keepalive probe.
+        keepalive_interval: Seconds between keepalive probes.
+        keepalive_count: Unanswered probes before the peer is considered dead.
+        send_buffer: SO_SNDBUF size in bytes.
+        recv_buffer: SO_RCVBUF size in bytes.
+        user_timeout: Seconds transmitted data may stay unacknowledged
+            before the connection is dropped (TCP_USER_TIMEOUT).
+
+    Setting any keepalive_* option enables keepalive. Options not supported
+    by the platform are ignored.
+
+    Args:
+        sock: The socket to configure.
+        options: Dict of socket options.
+        tcp: If False, only the options valid for Unix sockets are applied.
+    """
+    if options.get("send_buffer"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, options["send_buffer"])
+    if options.get("recv_buffer"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, options["recv_buffer"])
+    if not tcp:
+        return
+    if options.get("tcp_nodelay"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    keepalive = options.get("keepalive") or any(
+        options.get(key) is not None for key, _ in TCP_KEEPALIVE_OPTIONS
+    )
+    if keepalive:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for key, opt in TCP_KEEPALIVE_OPTIONS:
+            if options.get(key) is not None and opt is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, opt, int(options[key]))
+    if options.get("user_timeout") is not None and TCP_USER_TIMEOUT is not None:
+        sock.setsockopt(
+            socket.IPPROTO_TCP,
+            TCP_USER_TIMEOUT,
+            int(options["user_timeout"] * 1000)
+        )
@@ -7,6 +7,7 @@ __all__ = [
     "PyRedisConnError",
     "PyRedisConnClosed",
     "PyRedisConnReadTimeout",
+    "PyRedisDeadlineExceeded",
     "ProtocolError",
     "ReplyError",
 ]
@@ -28,6 +29,10 @@ class PyRedisConnReadTimeout(PyRedisError):
     pass
 
 
+class PyRedisDeadlineExceeded(PyRedisConnReadTimeout):
+    pass
+
+
 class PyRedisConnClosed(PyRedisError):
     pass
 
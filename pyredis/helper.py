@@ -1,18 +1,61 @@
 import binascii
+import math
 import random
+import time
+from array import array
 from collections import deque
 from threading import Lock
+from threading import Timer
 from uuid import uuid4
 
 from pyredis.connection import Connection
 from pyredis.exceptions import PyRedisError
+from pyredis.exceptions import ReplyError
 from pyredis.protocol import to_bytes
 
+SLOTS = 16384
+# Slot table entry of slots no node serves.
+NO_NODE = 0xFFFF
+
 
 def dict_from_list(source):
+    if isinstance(source, dict):
+        return source
     return dict(zip(*[iter(source)] * 2))
 
 
+def get_deadline(timeout=None, deadline=None, block=None, read_timeout=None):
+    """
+    Calculate the absolute deadline of an operation.
+
+    Args:
+        timeout: Seconds the whole operation may take.
+        deadline: time.monotonic() value the operation has to finish by.
+            If timeout is set as well, the earlier of both wins.
+        block: Seconds a blocking command may block server side, 0 blocks
+            forever. Extends the deadline, or read_timeout if neither
+            timeout nor deadline is set.
+        read_timeout: Read timeout of the connection.
+
+    Returns:
+        time.monotonic() based deadline, math.inf if the operation may block
+        forever, or None if the operation has no deadline.
+    """
+    if timeout is not None:
+        timeout = time.monotonic() + timeout
+        deadline = timeout if deadline is None else min(deadline, timeout)
+    if block is None:
+        return deadline
+    block = float(block)
+    if not block:
+        return math.inf
+    if deadline is None:
+        if read_timeout is None:
+            return math.inf
+        deadline = time.monotonic() + read_timeout
+    return deadline + block
+
+
 def tag_from_key(key):
     """return tag from key
 
@@ -34,26 +77,146 @@ def tag_from_key(key):
 
 
 def slot_from_key(key):
-    return binascii.crc_hqx(tag_from_key(key), 0) % 16384
+    return binascii.crc_hqx(tag_from_key(key), 0) % SLOTS
+
+
+# Multi key commands split by slot or bucket: arguments per key and how the
+# replies of the parts are merged.
+MULTI_KEY_COMMANDS = {
+    b"DEL": (1, "sum"),
+    b"EXISTS": (1, "sum"),
+    b"MGET": (1, "list"),
+    b"MSET": (2, "ok"),
+    b"TOUCH": (1, "sum"),
+    b"UNLINK": (1, "sum"),
+}
 
 
-class ClusterMap(object):
+def split_multi_key(args, route=None):
+    """
+    Split a multi key command by the slot or bucket of its keys.
+
+    The slot of every key is calculated in a single pass, route is called
+    once per distinct slot.
+
+    Args:
+        args: Command name and arguments.
+        route: Callable mapping a slot to a bucket, None keeps the slots.
+
+    Returns:
+        None if args is no multi key command or all keys share one target,
+        otherwise a list of (target, args, positions) tuples, positions
+        holds the index of each key of the part in the original command.
+    """
+    try:
+        step = MULTI_KEY_COMMANDS[to_bytes(args[0]).upper()][0]
+    except KeyError:
+        return None
+    keys = args[1::step]
+    if len(keys) < 2 or (len(args) - 1) % step:
+        return None
+    targets = dict()
+    parts = dict()
+    for position, key in enumerate(keys):
+        slot = slot_from_key(key)
+        target = targets.get(slot)
+        if target is None:
+            target = slot if route is None else route(slot)
+            targets[slot] = target
+        part = parts.get(target)
+        if part is None:
+            part = parts[target] = ([args[0]], [])
+        offset = 1 + position * step
+        part[0].extend(args[offset:offset + step])
+        part[1].append(position)
+    if len(parts) < 2:
+        return None
+    return [
+        (target, tuple(part_args), positions)
+        for target, (part_args, positions) in parts.items()
+    ]
+
+
+def parse_redirect(error):
+    """
+    Parse the slot and node of a MOVED or ASK error.
+
+    Args:
+        error: Error message, e.g. "MOVED 3999 127.0.0.1:6381".
+
+    Returns:
+        Tuple of the slot and the node as "host_port".
+    """
+    _, slot, endpoint = error.split()
+    host, port = endpoint.rsplit(":", 1)
+    return int(slot), host + "_" + port
+
+
+def merge_multi_key(parts, replies):
+    """
+    Merge the replies of a multi key command split by split_multi_key().
+
+    Counts are summed, MGET values are put back into the key order of the
+    original command.
+
+    Args:
+        parts: List of (target, args, positions) tuples.
+        replies: List of the replies of the parts, in the same order.
+
+    Returns:
+        The merged reply.
+
+    Raises:
+        ReplyError: The first error reply of a part.
+    """
+    for reply in replies:
+        if isinstance(reply, Exception):
+            raise reply
+    merge = MULTI_KEY_COMMANDS[to_bytes(parts[0][1][0]).upper()][1]
+    if merge == "sum":
+        return sum(replies)
+    if merge == "ok":
+        return replies[0]
+    result = [None] * sum(len(positions) for _, _, positions in parts)
+    for (_, _, positions), reply in zip(parts, replies):
+        for position, value in zip(positions, reply):
+            result[position] = value
+    return result
+
+
+class BaseClusterMap(object):
+    """
+    Slot table of a Redis cluster, shared by ClusterMap and AsyncClusterMap.
+
+    Every slot holds the index of its master and of its replica in a small
+    node table, stored in two array("H") of 16384 entries. Unmapped slots
+    hold NO_NODE. A refresh fills whole slot ranges at once and swaps the
+    new table in with a single assignment, readers never see a partially
+    updated table.
+
+    MOVED replies only repoint their slot and schedule a refresh in the
+    background. Refresh requests arriving within refresh_delay are served
+    by a single refresh, and refreshes are at least refresh_interval
+    seconds apart.
+    """
+
     def __init__(
         self,
         seeds,
         password=None,
-        lock=None,
         username=None,
+        refresh_delay=0.1,
+        refresh_interval=1,
     ):
         self._id = uuid4()
-        if not lock:
-            self._lock = Lock()
-        else:
-            self._lock = lock
-        self._map = {}
+        self._table = self._build(())
         self._seeds = deque(seeds)
         self._password = password
         self._username = username
+        self._refresh_delay = refresh_delay
+        self._refresh_interval = refresh_interval
+        self._refreshed = -math.inf
+        self._shards = True
 
     @property
     def id(self):
@@ -63,16 +226,177 @@ class ClusterMap(object):
     def _make_str(endpoint):
         return str(endpoint[0]) + "_" + str(endpoint[1])
 
-    def _fetch_map(self):
+    @classmethod
+    def _build(cls, slots):
+        # slots are CLUSTER SLOTS entries: [start, end, master, *replicas].
+        # One replica is picked per range, the master serves reads of
+        # ranges without replicas.
+        nodes = list()
+        indexes = dict()
+        masters = array("H", (NO_NODE,)) * SLOTS
+        slaves = array("H", (NO_NODE,)) * SLOTS
+        master_hosts = set()
+        slave_hosts = set()
+        for entry in slots:
+            start = entry[0]
+            end = entry[1] + 1
+            endpoints = [entry[2]]
+            if len(entry) > 3:
+                endpoints.append(random.choice(entry[3:]))
+            else:
+                endpoints.append(entry[2])
+            index = list()
+            for endpoint in endpoints:
+                name = cls._make_str(endpoint)
+                if name not in indexes:
+                    indexes[name] = len(nodes)
+                    nodes.append(name)
+                index.append(indexes[name])
+            masters[start:end] = array("H", (index[0],)) * (end - start)
+            slaves[start:end] = array("H", (index[1],)) * (end - start)
+            master_hosts.add(nodes[index[0]])
+            slave_hosts.add(nodes[index[1]])
+        return nodes, masters, slaves, master_hosts, slave_hosts
+
+    @staticmethod
+    def _slots_from_shards(shards):
+        # Turns a CLUSTER SHARDS reply into CLUSTER SLOTS entries, replicas
+        # that are not online are left out.
+        slots = list()
+        for shard in shards:
+            shard = dict_from_list(shard)
+            master = None
+            replicas = list()
+            for node in shard["nodes"]:
+                node = dict_from_list(node)
+                host = node.get("endpoint")
+                if not host or host == "?":
+                    host = node["ip"]
+                endpoint = [host, node.get("port") or node.get("tls-port")]
+                if node.get("role") == "master":
+                    master = endpoint
+                elif node.get("health", "online") == "online":
+                    replicas.append(endpoint)
+            if master is None:
+                continue
+            ranges = shard["slots"]
+            for pos in range(0, len(ranges), 2):
+                slots.append(
+                    [int(ranges[pos]), int(ranges[pos + 1]), master, *replicas]
+                )
+        return slots
+
+    @staticmethod
+    def _unknown_command(err):
+        message = str(err).lower()
+        return "unknown subcommand" in message or "unknown command" in message
+
+    def _endpoints(self):
+        # Nodes of the current table are asked first, the seeds are the
+        # fallback if none of them answers.
+        endpoints = list()
+        for node in self._table[0]:
+            host, port = node.rsplit("_", 1)
+            endpoints.append((host, int(port)))
         for seed in self._seeds:
+            if (seed[0], seed[1]) not in endpoints:
+                endpoints.append(seed)
+        return endpoints
+
+    def _refresh_wait(self):
+        return max(
+            self._refresh_delay,
+            self._refreshed + self._refresh_interval - time.monotonic()
+        )
+
+    def get_slot(self, shard_key, slave=None):
+        nodes, masters, slaves, _, _ = self._table
+        if not slave:
+            index = masters[slot_from_key(shard_key)]
+        else:
+            index = slaves[slot_from_key(shard_key)]
+        if index == NO_NODE:
+            raise KeyError(shard_key)
+        return nodes[index]
+
+    def hosts(self, slave=None):
+        _, _, _, master_hosts, slave_hosts = self._table
+        if not slave:
+            return set(master_hosts)
+        return set(slave_hosts)
+
+    def moved(self, slot, node):
+        """
+        Point a slot at the node named by a MOVED reply.
+
+        Only the slot is updated right away, the map keeps its id. A full
+        refresh is scheduled in the background to pick up the rest of the
+        resharding.
+
+        Args:
+            slot: Slot of the MOVED reply.
+            node: Node now serving the slot, as "host_port".
+        """
+        nodes, masters, slaves, master_hosts, slave_hosts = self._table
+        try:
+            index = nodes.index(node)
+        except ValueError:
+            nodes.append(node)
+            index = len(nodes) - 1
+        master_hosts.add(node)
+        slave_hosts.add(node)
+        masters[slot] = index
+        slaves[slot] = index
+        self.refresh()
+
+    def refresh(self):
+        raise NotImplementedError
+
+
+class ClusterMap(BaseClusterMap):
+    def __init__(
+        self,
+        seeds,
+        password=None,
+        lock=None,
+        username=None,
+        refresh_delay=0.1,
+        refresh_interval=1,
+    ):
+        super().__init__(
+            seeds=seeds,
+            password=password,
+            username=username,
+            refresh_delay=refresh_delay,
+            refresh_interval=refresh_interval,
+        )
+        if not lock:
+            self._lock = Lock()
+        else:
+            self._lock = lock
+        self._refresh_lock = Lock()
+        self._refresh_timer = None
+
+    def _fetch_map(self):
+        for endpoint in self._endpoints():
             conn = Connection(
-                host=seed[0],
-                port=seed[1],
+                host=endpoint[0],
+                port=endpoint[1],
                 encoding="utf-8",
                 password=self._password,
                 username=self._username,
             )
             try:
+                if self._shards:
+                    conn.write(b"CLUSTER", b"SHARDS")
+                    try:
+                        return self._slots_from_shards(conn.read())
+                    except ReplyError as err:
+                        # Servers before Redis 7 only know CLUSTER SLOTS,
+                        # other errors move on to the next node.
+                        if not self._unknown_command(err):
+                            raise
+                        self._shards = False
                 conn.write(b"CLUSTER", b"SLOTS")
                 return conn.read()
             except PyRedisError:
@@ -84,34 +408,33 @@ class ClusterMap(object):
             "{0}".format(self._seeds)
         )
 
-    def _update_slot(self, slot, master, slaves):
-        self._map[slot] = {
-            "master": self._make_str(master),
-            "slave": self._make_str(random.choice(slaves)),
-        }
+    def _refresh(self):
+        try:
+            self.update(self.id)
+        except PyRedisError:
+            # Failed refreshes are spaced out the same way.
+            self._refreshed = time.monotonic()
 
-    def get_slot(self, shard_key, slave=None):
-        if not slave:
-            return self._map[slot_from_key(shard_key)]["master"]
-        else:
-            return self._map[slot_from_key(shard_key)]["slave"]
+    def refresh(self):
+        """
+        Schedule a refresh of the whole map in a background thread.
 
-    def hosts(self, slave=None):
-        result = set()
-        if not slave:
-            selector = "master"
-        else:
-            selector = "slave"
-        for host in self._map.values():
-            result.add(host[selector])
-        return result
+        Does nothing if a refresh is already scheduled.
+        """
+        with self._refresh_lock:
+            timer = self._refresh_timer
+            if timer is not None and timer.is_alive():
+                return
+            timer = Timer(self._refresh_wait(), self._refresh)
+            timer.daemon = True
+            timer.start()
+            self._refresh_timer = timer
 
     def update(self, map_id):
         with self._lock:
             if map_id != self.id:
                 return self.id
-            for entry in self._fetch_map():
-                for slot in range(entry[0], entry[1] + 1):
-                    self._update_slot(slot, entry[2], entry[3:])
+            self._table = self._build(self._fetch_map())
             self._id = uuid4()
+            self._refreshed = time.monotonic()
             return self.id
@@ -1,7 +1,48 @@
 import asyncio
+import contextlib
 from pyredis.exceptions import PyRedisError
 
 
+class AsyncPooledStream(object):
+    """
+    Async iterator over a streamed reply holding on to its pool connection.
+
+    The connection is released back to the pool once the reply is drained,
+    the iterator is closed, or it is garbage collected.
+    """
+
+    def __init__(self, pool, conn, stream):
+        self._pool = pool
+        self._conn = conn
+        self._stream = stream
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self._stream.__anext__()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    def __del__(self):
+        if self._conn is None:
+            return
+        try:
+            asyncio.get_running_loop().create_task(self.aclose())
+        except RuntimeError:
+            pass
+
+    async def aclose(self):
+        """Stop iterating and release the connection."""
+        conn = self._conn
+        if conn is None:
+            return
+        self._conn = None
+        await self._pool.release(conn)
+
+
 class AsyncBasePool(object):
     """
     Base connection pool for asynchronous Redis clients.
@@ -20,6 +61,10 @@ class AsyncBasePool(object):
         pool_size=16,
         lock=None,
         username=None,
+        read_buffer_size=16384,
+        max_read_buffer=1048576,
+        socket_options=None,
+        transport="stream",
     ):
         """
         Initialize asynchronous connection pool parameters.
@@ -33,6 +78,12 @@ class AsyncBasePool(object):
             pool_size: Maximum number of connections allowed in the pool.
             lock: Asyncio lock for synchronization.
             username: Username for ACL authentication.
+            read_buffer_size: Initial receive buffer size of connections.
+            max_read_buffer: Size the receive buffer of connections may
+                grow to while large replies are read.
+            socket_options: Dict of socket options applied to connections,
+                e.g. {"keepalive_idle": 60, "user_timeout": 10}.
+            transport: Transport of connections, "stream" or "protocol".
         """
 
         self._conn_timeout = conn_timeout
@@ -50,6 +101,15 @@ class AsyncBasePool(object):
         self._close_on_err = False
         self._cluster = False
         self._username = username
+        self._read_buffer_size = read_buffer_size
+        self._max_read_buffer = max_read_buffer
+        self._socket_options = socket_options
+        self._transport = transport
+        self._auto_pipeline = False
+        self._pipeline_max_batch = None
+        self._pipeline_delay = 0
+        self._shared = None
+        self._shared_lock = asyncio.Lock()
 
     @property
     def conn_timeout(self):
@@ -105,9 +165,58 @@ class AsyncBasePool(object):
         """ACL authentication username."""
         return self._username
 
+    @property
+    def read_buffer_size(self):
+        """Initial receive buffer size of connections in bytes."""
+        return self._read_buffer_size
+
+    @property
+    def max_read_buffer(self):
+        """Maximum receive buffer size of connections in bytes."""
+        return self._max_read_buffer
+
+    @property
+    def socket_options(self):
+        """Socket options applied to connections."""
+        return self._socket_options
+
+    @property
+    def transport(self):
+        """Transport of connections, "stream" or "protocol"."""
+        return self._transport
+
+    @property
+    def auto_pipeline(self):
+        """Whether commands share one automatically pipelined client."""
+        return self._auto_pipeline
+
+    @property
+    def pipeline_max_batch(self):
+        """Number of queued commands that triggers a write right away."""
+        return self._pipeline_max_batch
+
+    @property
+    def pipeline_delay(self):
+        """Seconds to wait for more commands before a batch is written."""
+        return self._pipeline_delay
+
     def _connect(self):
         raise NotImplementedError
 
+    async def _shared_client(self):
+        client = self._shared
+        if client is None or client.closed:
+            # Connecting may await, concurrent first callers must not
+            # create a client each.
+            async with self._shared_lock:
+                client = self._shared
+                if client is None or client.closed:
+                    client = self._connect()
+                    if asyncio.iscoroutine(client):
+                        client = await client
+                    self._shared = client
+        return client
+
     async def acquire(self):
         """
         Asynchronously acquire a connection from the pool.
@@ -174,21 +283,54 @@ class AsyncBasePool(object):
         """
         Asynchronously acquire a connection, execute a command, and release it.
 
+        With auto_pipeline all commands go through one shared client
+        instead, coalescing the commands of an event loop iteration into
+        a single write.
+
         Args:
             *args: Command name and positional arguments.
-            **kwargs: Execution options (e.g. shard_key, sock).
+            **kwargs: Execution options (e.g. shard_key, sock, stream).
 
         Returns:
-            Parsed Redis reply.
+            Parsed Redis reply. With stream=True an async iterator that keeps
+            the connection until it is drained or closed.
         """
+        if self._auto_pipeline:
+            client = await self._shared_client()
+            return await client.execute(*args, **kwargs)
         conn = await self.acquire()
         try:
-            return await conn.execute(
+            result = await conn.execute(
                 *args,
                 **kwargs
             )
-        finally:
+        except BaseException:
             await self.release(
                 conn=conn
             )
+            raise
+        if kwargs.get("stream"):
+            return AsyncPooledStream(self, conn, result)
+        await self.release(
+            conn=conn
+        )
+        return result
+
+    @contextlib.asynccontextmanager
+    async def pipeline(self, **kwargs):
+        """
+        Lease a client for the duration of a pipeline block.
+
+        Args:
+            **kwargs: Pipeline options (e.g. transaction, bulk_size).
 
+        Yields:
+            AsyncPipeline, its result holds the replies once the block
+            exited.
+        """
+        conn = await self.acquire()
+        try:
+            async with conn.pipeline(**kwargs) as pipe:
+                yield pipe
+        finally:
+            await self.release(conn)
@@ -29,6 +29,9 @@ class AsyncClusterPool(
         slave_ok=False,
         password=None,
         username=None,
+        auto_pipeline=False,
+        pipeline_max_batch=None,
+        pipeline_delay=0,
         **kwargs
     ):
         """
@@ -39,6 +42,13 @@ class AsyncClusterPool(
             slave_ok: Flag indicating if reading from replica nodes is allowed.
             password: Password for authentication.
             username: Username for ACL authentication.
+            auto_pipeline: If True, execute() shares one client between
+                all callers and coalesces the commands issued within one
+                event loop iteration into a single write per node.
+            pipeline_max_batch: Number of queued commands per node that
+                triggers a write right away.
+            pipeline_delay: Seconds to wait for more commands before a
+                batch is written.
             **kwargs: Additional options forwarded to AsyncBasePool.
         """
         super().__init__(
@@ -52,6 +62,9 @@ class AsyncClusterPool(
         )
         self._slave_ok = slave_ok
         self._cluster = True
+        self._auto_pipeline = auto_pipeline
+        self._pipeline_max_batch = pipeline_max_batch
+        self._pipeline_delay = pipeline_delay
 
     @property
     def slave_ok(self):
@@ -68,4 +81,11 @@ class AsyncClusterPool(
             read_timeout=self.read_timeout,
             cluster_map=self._map,
             username=self.username,
+            read_buffer_size=self.read_buffer_size,
+            max_read_buffer=self.max_read_buffer,
+            socket_options=self.socket_options,
+            transport=self.transport,
+            auto_pipeline=self.auto_pipeline,
+            pipeline_max_batch=self.pipeline_max_batch,
+            pipeline_delay=self.pipeline_delay,
         )
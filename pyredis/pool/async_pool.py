@@ -30,6 +30,9 @@ class AsyncPool(
         host=None,
         port=6379,
         unix_sock=None,
+        auto_pipeline=False,
+        pipeline_max_batch=None,
+        pipeline_delay=0,
         **kwargs
     ):
         """
@@ -39,6 +42,13 @@ class AsyncPool(
             host: Redis server hostname or IP.
             port: Redis server port number.
             unix_sock: Path to Unix domain socket.
+            auto_pipeline: If True, execute() shares one client between
+                all callers and coalesces the commands issued within one
+                event loop iteration into a single write.
+            pipeline_max_batch: Number of queued commands that triggers a
+                write right away, None leaves batches unbounded.
+            pipeline_delay: Seconds to wait for more commands before a
+                batch is written.
             **kwargs: Additional options forwarded to AsyncBasePool.
         """
         if not bool(host) != bool(unix_sock):
@@ -47,6 +57,9 @@ class AsyncPool(
         self._host = host
         self._port = port
         self._unix_sock = unix_sock
+        self._auto_pipeline = auto_pipeline
+        self._pipeline_max_batch = pipeline_max_batch
+        self._pipeline_delay = pipeline_delay
 
     @property
     def host(self):
@@ -74,4 +87,11 @@ class AsyncPool(
             conn_timeout=self.conn_timeout,
             read_timeout=self.read_timeout,
             username=self.username,
+            read_buffer_size=self.read_buffer_size,
+            max_read_buffer=self.max_read_buffer,
+            socket_options=self.socket_options,
+            transport=self.transport,
+            auto_pipeline=self.auto_pipeline,
+            pipeline_max_batch=self.pipeline_max_batch,
+            pipeline_delay=self.pipeline_delay,
         )
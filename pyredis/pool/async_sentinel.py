@@ -51,7 +51,8 @@ class AsyncSentinelPool(
         self._sentinel = pyredis.pool.AsyncSentinelClient(
             sentinels=sentinels,
             password=sentinel_password,
-            username=sentinel_username
+            username=sentinel_username,
+            socket_options=self.socket_options,
         )
         self._name = name
         self._slave_ok = slave_ok
@@ -97,6 +98,10 @@ class AsyncSentinelPool(
             conn_timeout=self.conn_timeout,
             read_timeout=self.read_timeout,
             username=self.username,
+            read_buffer_size=self.read_buffer_size,
+            max_read_buffer=self.max_read_buffer,
+            socket_options=self.socket_options,
+            transport=self.transport,
         )
 
     async def _get_master(self):
@@ -51,7 +51,8 @@ class AsyncSentinelHashPool(
         self._sentinel = pyredis.pool.AsyncSentinelClient(
             sentinels=sentinels,
             password=sentinel_password,
-            username=sentinel_username
+            username=sentinel_username,
+            socket_options=self.socket_options,
         )
         self._buckets = buckets
         self._slave_ok = slave_ok
@@ -95,6 +96,10 @@ class AsyncSentinelHashPool(
             conn_timeout=self.conn_timeout,
             read_timeout=self.read_timeout,
             username=self.username,
+            read_buffer_size=self.read_buffer_size,
+            max_read_buffer=self.max_read_buffer,
+            socket_options=self.socket_options,
+            transport=self.transport,
         )
 
     async def _get_master(self, bucket):
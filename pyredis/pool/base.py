@@ -1,7 +1,53 @@
+import collections
+import contextlib
 import threading
 from pyredis.exceptions import PyRedisError
 
 
+class PooledStream(object):
+    """
+    Iterator over a streamed reply holding on to its pool connection.
+
+    The connection is released back to the pool once the reply is drained
+    or the iterator is closed. A stream garbage collected before that closes
+    its connection instead, the pool forgets it on its next acquire() or
+    release().
+    """
+
+    def __init__(self, pool, conn, stream):
+        self._pool = pool
+        self._conn = conn
+        self._stream = stream
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._stream)
+        except BaseException:
+            self.close()
+            raise
+
+    def __del__(self):
+        # Finalizers may run while this thread holds the pool lock, so the
+        # half read connection is closed and handed over without taking it.
+        conn = self._conn
+        if conn is None:
+            return
+        self._conn = None
+        conn.close()
+        self._pool._dropped.append(conn)
+
+    def close(self):
+        """Stop iterating and release the connection."""
+        conn = self._conn
+        if conn is None:
+            return
+        self._conn = None
+        self._pool.release(conn)
+
+
 class BasePool(object):
     """
     Base connection pool for synchronous Redis clients.
@@ -20,6 +66,9 @@ class BasePool(object):
         pool_size=16,
         lock=None,
         username=None,
+        read_buffer_size=16384,
+        max_read_buffer=1048576,
+        socket_options=None,
     ):
         """
         Initialize connection pool parameters.
@@ -33,6 +82,11 @@ class BasePool(object):
             pool_size: Maximum number of connections allowed in the pool.
             lock: Threading lock for synchronization.
             username: Username for ACL authentication.
+            read_buffer_size: Initial receive buffer size of connections.
+            max_read_buffer: Size the receive buffer of connections may
+                grow to while large replies are read.
+            socket_options: Dict of socket options applied to connections,
+                e.g. {"keepalive_idle": 60, "user_timeout": 10}.
         """
 
         self._conn_timeout = conn_timeout
@@ -43,6 +97,7 @@ class BasePool(object):
             self._lock = lock
         self._pool_free = set()
         self._pool_used = set()
+        self._dropped = collections.deque()
         self._database = database
         self._password = password
         self._encoding = encoding
@@ -50,6 +105,9 @@ class BasePool(object):
         self._close_on_err = False
         self._cluster = False
         self._username = username
+        self._read_buffer_size = read_buffer_size
+        self._max_read_buffer = max_read_buffer
+        self._socket_options = socket_options
 
     @property
     def conn_timeout(self):
@@ -107,9 +165,30 @@ class BasePool(object):
         """ACL authentication username."""
         return self._username
 
+    @property
+    def read_buffer_size(self):
+        """Initial receive buffer size of connections in bytes."""
+        return self._read_buffer_size
+
+    @property
+    def max_read_buffer(self):
+        """Maximum receive buffer size of connections in bytes."""
+        return self._max_read_buffer
+
+    @property
+    def socket_options(self):
+        """Socket options applied to connections."""
+        return self._socket_options
+
     def _connect(self):
         raise NotImplementedError
 
+    def _reap(self):
+        # Called with the lock held, drops connections of streams that
+        # were garbage collected, see PooledStream.__del__().
+        while self._dropped:
+            self._pool_used.discard(self._dropped.popleft())
+
     def acquire(self):
         """
         Acquire a connection from the pool.
@@ -125,6 +204,7 @@ class BasePool(object):
         """
         try:
             self._lock.acquire()
+            self._reap()
             client = self._pool_free.pop()
             self._pool_used.add(client)
         except KeyError:
@@ -149,6 +229,7 @@ class BasePool(object):
         """
         try:
             self._lock.acquire()
+            self._reap()
             current_size = len(self._pool_free) + len(self._pool_used)
             self._pool_used.remove(conn)
             if conn.closed and self.close_on_err:
@@ -173,17 +254,58 @@ class BasePool(object):
 
         Args:
             *args: Command name and positional arguments.
-            **kwargs: Execution options (e.g. shard_key, sock).
+            **kwargs: Execution options (e.g. shard_key, sock, stream).
 
         Returns:
-            Parsed Redis reply.
+            Parsed Redis reply. With stream=True an iterator that keeps the
+            connection until it is drained or closed.
         """
         conn = self.acquire()
         try:
-            return conn.execute(
+            result = conn.execute(
                 *args,
                 **kwargs
             )
+        except BaseException:
+            self.release(conn)
+            raise
+        if kwargs.get("stream"):
+            return PooledStream(self, conn, result)
+        self.release(conn)
+        return result
+
+    @contextlib.contextmanager
+    def pipeline(self, **kwargs):
+        """
+        Lease a client for the duration of a pipeline block.
+
+        Args:
+            **kwargs: Pipeline options (e.g. transaction, bulk_size).
+
+        Yields:
+            Pipeline, its result holds the replies once the block exited.
+        """
+        conn = self.acquire()
+        try:
+            with conn.pipeline(**kwargs) as pipe:
+                yield pipe
         finally:
             self.release(conn)
 
+    @contextlib.contextmanager
+    def noreply(self, **kwargs):
+        """
+        Lease a client for the duration of a noreply block.
+
+        Args:
+            **kwargs: noreply options (e.g. bulk_size).
+
+        Yields:
+            The leased client, its commands return None inside the block.
+        """
+        conn = self.acquire()
+        try:
+            with conn.noreply(**kwargs) as client:
+                yield client
+        finally:
+            self.release(conn)
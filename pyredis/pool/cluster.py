@@ -1,5 +1,6 @@
 import pyredis.pool
 from pyredis import commands
+from pyredis.exceptions import PyRedisError
 from pyredis.pool.base import BasePool
 
 
@@ -68,4 +69,11 @@ class ClusterPool(
             read_timeout=self.read_timeout,
             cluster_map=self._map,
             username=self.username,
+            read_buffer_size=self.read_buffer_size,
+            max_read_buffer=self.max_read_buffer,
+            socket_options=self.socket_options,
         )
+
+    def noreply(self, **kwargs):
+        """noreply mode is not supported by ClusterPool."""
+        raise PyRedisError("noreply mode is not supported by ClusterPool")
@@ -50,4 +50,7 @@ class HashPool(
             conn_timeout=self.conn_timeout,
             read_timeout=self.read_timeout,
             username=self.username,
+            read_buffer_size=self.read_buffer_size,
+            max_read_buffer=self.max_read_buffer,
+            socket_options=self.socket_options,
         )
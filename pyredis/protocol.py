@@ -1,17 +1,78 @@
 import sys
-from io import BytesIO
 from pyredis.exceptions import ProtocolError, ReplyError
 
 SYM_CRLF = b"\r\n"
 SYM_EMPTY = b""
 
+COMPACT_THRESHOLD = 65536
+PREALLOC_THRESHOLD = 65536
+IOV_THRESHOLD = 65536
+
+NOTHING = object()
+
 TYPE_SIMPLE = b"+"
 TYPE_ERROR = b"-"
 TYPE_INT = b":"
 TYPE_BULK = b"$"
 TYPE_ARRAY = b"*"
+TYPE_NULL = b"_"
+TYPE_BOOLEAN = b"#"
+TYPE_DOUBLE = b","
+TYPE_BIG_NUMBER = b"("
+TYPE_BLOB_ERROR = b"!"
+TYPE_VERBATIM = b"="
+TYPE_MAP = b"%"
+TYPE_SET = b"~"
+TYPE_ATTRIBUTE = b"|"
+TYPE_PUSH = b">"
+
+ORD_SIMPLE = ord(TYPE_SIMPLE)
+ORD_ERROR = ord(TYPE_ERROR)
+ORD_INT = ord(TYPE_INT)
+ORD_BULK = ord(TYPE_BULK)
+ORD_ARRAY = ord(TYPE_ARRAY)
+ORD_NULL = ord(TYPE_NULL)
+ORD_BOOLEAN = ord(TYPE_BOOLEAN)
+ORD_DOUBLE = ord(TYPE_DOUBLE)
+ORD_BIG_NUMBER = ord(TYPE_BIG_NUMBER)
+ORD_BLOB_ERROR = ord(TYPE_BLOB_ERROR)
+ORD_VERBATIM = ord(TYPE_VERBATIM)
+ORD_MAP = ord(TYPE_MAP)
+ORD_SET = ord(TYPE_SET)
+ORD_ATTRIBUTE = ord(TYPE_ATTRIBUTE)
+ORD_PUSH = ord(TYPE_PUSH)
+
+TYPES = frozenset((
+    ORD_SIMPLE, ORD_ERROR, ORD_INT, ORD_BULK, ORD_ARRAY,
+    ORD_NULL, ORD_BOOLEAN, ORD_DOUBLE, ORD_BIG_NUMBER, ORD_BLOB_ERROR,
+    ORD_VERBATIM, ORD_MAP, ORD_SET, ORD_ATTRIBUTE, ORD_PUSH,
+))
+TYPES_BLOB = frozenset((ORD_BULK, ORD_BLOB_ERROR, ORD_VERBATIM))
+TYPES_AGGREGATE = frozenset((
+    ORD_ARRAY, ORD_MAP, ORD_SET, ORD_ATTRIBUTE, ORD_PUSH
+))
+# Replies gets_header() can stream, push frames are always parsed whole so
+# they reach the push handler.
+TYPES_HEADER = frozenset((ORD_BULK, ORD_ARRAY, ORD_MAP, ORD_SET))
 
-__all__ = ["to_bytes", "Reader", "writer"]
+# Encoded "$<len>\r\n" and "*<len>\r\n" headers for small sizes, and encoded
+# command names, shared by all writer_many() calls.
+BULK_HEADERS = tuple(b"$%d\r\n" % size for size in range(1024))
+ARRAY_HEADERS = tuple(b"*%d\r\n" % size for size in range(64))
+COMMAND_CACHE = dict()
+COMMAND_CACHE_SIZE = 512
+
+__all__ = [
+    "to_bytes",
+    "stream_length",
+    "has_large_arg",
+    "Push",
+    "Reader",
+    "writer",
+    "writer_args",
+    "writer_iov",
+    "writer_many",
+]
 
 
 def is_exception(inst, classinfo):
@@ -33,153 +94,265 @@ def is_exception(inst, classinfo):
     )
 
 
+class Push(list):
+    """
+    RESP3 out of band push message (pubsub messages, invalidations).
+
+    Behaves like the list of the push frame elements, the distinct type lets
+    a connection tell pushes apart from regular replies.
+    """
+
+
+class Buffer(object):
+    """
+    Growable receive buffer with a read offset.
+
+    Consumed bytes are not removed on every read, the buffer is only compacted
+    once the consumed part is large enough to be worth moving the rest.
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+        self.pos = 0
+
+    def __len__(self):
+        return len(self.data) - self.pos
+
+    def compact(self):
+        if self.pos == len(self.data):
+            self.data.clear()
+            self.pos = 0
+        elif self.pos >= COMPACT_THRESHOLD and self.pos * 2 >= len(self.data):
+            del self.data[:self.pos]
+            self.pos = 0
+
+    def write(self, data):
+        self.data += data
+
+
 class ReplyParser(object):
+    """
+    Iterative RESP parser working directly on a Buffer.
+
+    Understands RESP2 and the RESP3 types, maps, sets, doubles, big numbers,
+    booleans, nulls, verbatim strings, attributes and push frames are
+    returned as native Python types. Attributes are parsed and dropped.
+
+    Nested aggregates are tracked on an explicit stack of
+    [remaining, items, type] frames instead of one parser object per level, so
+    runs of complete elements are parsed in a single loop. Elements that
+    are complete are consumed from the buffer right away, a reply split
+    across several feed() calls resumes at the first incomplete element.
+
+    Bulk strings of at least PREALLOC_THRESHOLD bytes that are not fully
+    buffered yet are assembled in a bytearray of their announced size, the
+    connection can receive the rest straight into it, see Reader.bulk_view().
+    """
+
     def __init__(
         self,
         encoding,
         source,
         protocol_error=ProtocolError,
-        reply_error=ReplyError
+        reply_error=ReplyError,
+        bulk_type=bytes,
     ):
-        self._len = 0
-        self._nested_parser = None
         self._encoding = encoding
         self._protocol_error = protocol_error
         self._reply_error = reply_error
-        self._todo = self.header
+        self._bulk_type = bulk_type
         self._source = source
-        self.complete = False
-        self.result = b""
+        self._stack = []
+        self.bulk = None
+        self.result = None
 
-    def decode(self, data):
+    def _bulk_value(self, data):
+        if self._bulk_type is bytes:
+            value = bytes(data)
+        elif self._bulk_type is bytearray:
+            value = data if isinstance(data, bytearray) else bytearray(data)
+        else:
+            value = memoryview(
+                data if isinstance(data, bytearray) else bytearray(data)
+            )
         if self._encoding:
             try:
-                return data.decode(self._encoding)
+                return str(value, self._encoding)
             except UnicodeDecodeError:
-                return data
-        else:
-            return data
-
-    def header(self):
-        byte = self._source.read(1)
-        if byte == TYPE_ARRAY:
-            return self.parse_array
-        elif byte == TYPE_BULK:
-            return self.parse_bulk
-        elif byte == TYPE_SIMPLE:
-            return self.parse_str
-        elif byte == TYPE_INT:
-            return self.parse_int
-        elif byte == TYPE_ERROR:
-            return self.parse_error
-        elif byte == SYM_EMPTY:
-            return None
-        else:
-            raise self._protocol_error(
-                "Protocol error, got {0} as reply type byte".format(byte)
-            )
+                pass
+        return value
+
+    def bulk_fill(self, view, pos, size):
+        target, filled = self.bulk
+        count = min(size - pos, len(target) - filled)
+        if count:
+            target[filled:filled + count] = view[pos:pos + count]
+            self.bulk[1] = filled + count
+        return pos + count
 
     def parse(self):
-        while not self.complete:
-            result = self._todo()
-            if not result:
-                return
-            else:
-                self._todo = result
-        return True
-
-    def parse_array(self):
-        if not self._len:
-            array_len = self.readline()
-            if array_len:
-                self._len = int(array_len)
-                if int(array_len) >= 0:
-                    self.result = []
-                else:
-                    self.result = None
-            else:
-                return
+        source = self._source
+        data = source.data
+        pos = source.pos
+        size = len(data)
+        stack = self._stack
+        encoding = self._encoding
+        as_bytes = self._bulk_type is bytes
+        find = data.find
+        view = memoryview(data)
+        value = NOTHING
         try:
-            while len(self.result) < self._len:
-                if not self._nested_parser:
-                    self._nested_parser = ReplyParser(
-                        self._encoding,
-                        self._source,
-                        self._protocol_error,
-                        self._reply_error,
-                    )
-                result = self._nested_parser.parse()
-                if result:
-                    self.result.append(self._nested_parser.result)
-                    self._nested_parser.reset()
+            if self.bulk is not None:
+                pos = self.bulk_fill(view, pos, size)
+                target, filled = self.bulk
+                if filled < len(target) or size - pos < 2:
+                    source.pos = pos
+                    return False
+                pos += 2
+                self.bulk = None
+                value = self._bulk_value(target)
+            while True:
+                if value is NOTHING:
+                    if pos >= size:
+                        break
+                    kind = data[pos]
+                    if kind not in TYPES:
+                        raise self._protocol_error(
+                            "Protocol error, got {0} as reply type byte".format(
+                                bytes((kind,))
+                            )
+                        )
+                    end = find(SYM_CRLF, pos + 1)
+                    if end < 0:
+                        break
+                    if kind in TYPES_BLOB:
+                        length = int(data[pos + 1:end])
+                        if length < 0:
+                            value = None
+                            pos = end + 2
+                        else:
+                            start = end + 2
+                            if start + length + 2 > size:
+                                if (
+                                    kind == ORD_BULK
+                                    and length >= PREALLOC_THRESHOLD
+                                ):
+                                    self.bulk = [bytearray(length), 0]
+                                    pos = self.bulk_fill(view, start, size)
+                                break
+                            pos = start + length + 2
+                            if kind == ORD_BLOB_ERROR:
+                                value = self._reply_error(
+                                    view[start:start + length].tobytes().decode(
+                                        sys.getdefaultencoding()
+                                    )
+                                )
+                            else:
+                                if kind == ORD_VERBATIM:
+                                    start += 4
+                                    length -= 4
+                                if not as_bytes:
+                                    value = self._bulk_value(
+                                        view[start:start + length]
+                                    )
+                                else:
+                                    value = view[start:start + length].tobytes()
+                                    if encoding:
+                                        try:
+                                            value = value.decode(encoding)
+                                        except UnicodeDecodeError:
+                                            pass
+                    elif kind in TYPES_AGGREGATE:
+                        length = int(data[pos + 1:end])
+                        pos = end + 2
+                        if kind == ORD_MAP or kind == ORD_ATTRIBUTE:
+                            length *= 2
+                        if length > 0:
+                            stack.append([length, [], kind])
+                            continue
+                        if length < 0:
+                            value = None
+                        elif kind == ORD_ATTRIBUTE:
+                            continue
+                        else:
+                            value = self._aggregate(kind, [])
+                    elif kind == ORD_INT or kind == ORD_BIG_NUMBER:
+                        value = int(data[pos + 1:end])
+                        pos = end + 2
+                    elif kind == ORD_SIMPLE:
+                        value = view[pos + 1:end].tobytes()
+                        pos = end + 2
+                    elif kind == ORD_ERROR:
+                        value = self._reply_error(
+                            view[pos + 1:end].tobytes().decode(
+                                sys.getdefaultencoding()
+                            )
+                        )
+                        pos = end + 2
+                    elif kind == ORD_NULL:
+                        value = None
+                        pos = end + 2
+                    elif kind == ORD_BOOLEAN:
+                        value = data[pos + 1:end] == b"t"
+                        pos = end + 2
+                    else:
+                        value = float(data[pos + 1:end])
+                        pos = end + 2
+                while stack:
+                    frame = stack[-1]
+                    frame[1].append(value)
+                    frame[0] -= 1
+                    if frame[0]:
+                        break
+                    stack.pop()
+                    if frame[2] == ORD_ATTRIBUTE:
+                        break
+                    value = self._aggregate(frame[2], frame[1])
                 else:
-                    return
-        except TypeError:
-            pass
-        self.complete = True
-        return True
-
-    def parse_bulk(self):
-        if not self._len:
-            bulk_len = self.readline()
-            if bulk_len == b"-1":
-                self.complete = True
-                self.result = None
-                return True
-            elif bulk_len:
-                self._len = int(bulk_len) + 2
-            else:
-                return
-        self.result += self._source.read(self._len - len(self.result))
-        if len(self.result) == self._len:
-            self.complete = True
-            self.result = self.decode(self.result.rstrip(SYM_CRLF))
-            return True
-
-    def parse_error(self):
-        result = self.readline()
-        if result:
-            self.complete = True
-            self.result = self._reply_error(
-                result.decode(sys.getdefaultencoding())
-            )
-            return True
-
-    def parse_int(self):
-        result = self.readline()
-        if result:
-            self.complete = True
-            self.result = int(result)
-            return True
+                    source.pos = pos
+                    self.result = value
+                    return True
+                value = NOTHING
+            source.pos = pos
+            return False
+        finally:
+            view.release()
 
-    def parse_str(self):
-        result = self.readline()
-        if result:
-            self.complete = True
-            self.result = result
-            return True
-
-    def readline(self):
-        self.result += self._source.readline()
-        if self.result.endswith(SYM_CRLF):
-            result = self.result.rstrip(SYM_CRLF)
-            self.result = b""
-            return result
+    @staticmethod
+    def _aggregate(kind, items):
+        if kind == ORD_ARRAY:
+            return items
+        elif kind == ORD_MAP:
+            try:
+                return dict(zip(items[::2], items[1::2]))
+            except TypeError:
+                return items
+        elif kind == ORD_SET:
+            try:
+                return set(items)
+            except TypeError:
+                return items
+        return Push(items)
 
     def reset(self):
-        self._len = None
-        self._todo = self.header
-        self._nested_parser = None
-        self.complete = False
-        self.result = b""
+        self._stack = []
+        self.bulk = None
+        self.result = None
 
 
 class Reader(object):
     def __init__(
-        self, encoding=None, protocolError=ProtocolError, replyError=ReplyError
+        self,
+        encoding=None,
+        protocolError=ProtocolError,
+        replyError=ReplyError,
+        bulk_type=bytes,
     ):
-        self._buffer = BytesIO()
-        self._buffer_pos = 0
+        if bulk_type not in (bytes, bytearray, memoryview):
+            raise TypeError(
+                "bulk_type has to be bytes, bytearray or memoryview"
+            )
+        self._buffer = Buffer()
         self._encoding = encoding
         if is_exception(protocolError, Exception):
             self._protocol_error = protocolError
@@ -190,65 +363,306 @@ class Reader(object):
             source=self._buffer,
             protocol_error=self._protocol_error,
             reply_error=self._reply_error,
+            bulk_type=bulk_type,
         )
+        # [elements, payload bytes, error, push] still to skip of a reply
+        # skip_many() stopped in the middle of.
+        self._skip = [0, 0, False, False]
+
+    def buffered(self):
+        """
+        Number of fed bytes that have not been consumed yet.
+        """
+        return len(self._buffer)
 
-    def _truncate(self):
-        remain = BytesIO()
-        self._buffer.seek(self._buffer_pos)
-        remain.write(self._buffer.read())
-        self._buffer = remain
-        self._replyparser._source = self._buffer
-        self._buffer_pos = 0
-        self._buffer.seek(0)
+    def bulk_advance(self, nbytes):
+        """
+        Account for nbytes received into the view returned by bulk_view().
+        """
+        self._replyparser.bulk[1] += nbytes
+
+    def bulk_view(self):
+        """
+        Writable view on the missing part of a preallocated bulk string.
+
+        Returns None unless a large bulk string is being assembled and all
+        buffered data has been consumed, so the caller can recv_into() the
+        returned memoryview and report the count with bulk_advance().
+        """
+        bulk = self._replyparser.bulk
+        if bulk is None or len(self._buffer):
+            return None
+        target, filled = bulk
+        if filled == len(target):
+            return None
+        return memoryview(target)[filled:]
 
     def feed(self, data, offset=None, length=None):
-        if offset and length:
-            if (offset + length > len(data)) or (offset or length) < 0:
-                raise ValueError("offset+length bigger then available date")
-            data = data[offset:][:length]
-        elif offset:
-            if (offset > len(data)) or (offset < 0):
-                raise ValueError("offset bigger then available data")
-            data = data[offset:]
-        elif length:
-            if (length > len(data)) or (length < 0):
-                raise ValueError("length bigger then available data")
-            data = data[:length]
-        self._buffer.seek(0, 2)
-        self._buffer.write(data)
+        with memoryview(data) as view, view.cast("B") as view:
+            if offset is None:
+                offset = 0
+            if length is None:
+                length = len(view) - offset
+            if offset < 0 or length < 0 or offset + length > len(view):
+                raise ValueError("offset+length bigger then available data")
+            if self._replyparser.bulk is not None and not len(self._buffer):
+                end = offset + length
+                offset = self._replyparser.bulk_fill(view, offset, end)
+                length = end - offset
+            self._buffer.write(view[offset:offset + length])
+
+    def gets_header(self, bulk=True):
+        """
+        Parse only the header of the next reply.
+
+        For bulk strings and aggregates the header line is consumed and
+        (type, length) is returned, the payload is then read with take()
+        or, for aggregates, element by element with gets(). Any other reply
+        is parsed completely and returned as (None, reply).
+
+        Args:
+            bulk: If False, bulk strings are parsed completely like any
+                other non aggregate reply.
+
+        Returns:
+            The header tuple, or False if more data is needed.
+        """
+        data = self._buffer.data
+        pos = self._buffer.pos
+        if pos >= len(data):
+            return False
+        kind = data[pos]
+        if kind in TYPES_HEADER and (bulk or kind != ORD_BULK):
+            end = data.find(SYM_CRLF, pos + 1)
+            if end < 0:
+                return False
+            length = int(data[pos + 1:end])
+            self._buffer.pos = end + 2
+            self._buffer.compact()
+            return bytes((kind,)), length
+        result = self.gets()
+        if result is False:
+            return False
+        return None, result
+
+    def take(self, size):
+        """
+        Consume up to size raw bytes from the buffer.
+
+        Used after gets_header() to stream a bulk payload.
+
+        Returns:
+            The consumed bytes, empty if nothing is buffered.
+        """
+        buffer = self._buffer
+        with memoryview(buffer.data) as view:
+            data = view[buffer.pos:buffer.pos + size].tobytes()
+        buffer.pos += len(data)
+        buffer.compact()
+        return data
+
+    def gets_many(self, count):
+        """
+        Parse up to count complete replies from the buffer in one pass.
+
+        Returns:
+            List of replies, shorter than count or empty if the buffer
+            runs dry.
+        """
+        results = list()
+        parser = self._replyparser
+        while len(results) < count and parser.parse():
+            results.append(parser.result)
+            parser.reset()
+        self._buffer.compact()
+        return results
+
+    def skip_many(self, count, push_handler=None):
+        """
+        Skip up to count complete replies from the buffer without parsing them.
+
+        Replies are stepped over by their RESP framing, payloads are never
+        copied or decoded and no Python objects are built for them. A reply
+        split across several feed() calls is resumed where the previous call
+        stopped. Top level push frames are not counted as replies, they are
+        parsed and passed to push_handler, or skipped if it is None.
+
+        Args:
+            count: Maximum number of replies to skip.
+            push_handler: Callable receiving top level push frames.
+
+        Returns:
+            Tuple of the number of replies skipped and how many of them were
+            error replies.
+        """
+        buffer = self._buffer
+        parser = self._replyparser
+        data = buffer.data
+        size = len(data)
+        find = data.find
+        pos = buffer.pos
+        pending, remaining, error, push = self._skip
+        skipped = 0
+        errors = 0
+        while True:
+            if pending < 0:
+                buffer.pos = pos
+                done = parser.parse()
+                pos = buffer.pos
+                if not done:
+                    break
+                result = parser.result
+                parser.reset()
+                pending = 0
+                if push_handler is not None:
+                    push_handler(result)
+                continue
+            if remaining:
+                step = min(remaining, size - pos)
+                pos += step
+                remaining -= step
+                if remaining:
+                    break
+            elif pending:
+                if pos >= size:
+                    break
+                kind = data[pos]
+                if kind not in TYPES:
+                    raise self._protocol_error(
+                        "Protocol error, got {0} as reply type byte".format(
+                            bytes((kind,))
+                        )
+                    )
+                end = find(SYM_CRLF, pos + 1)
+                if end < 0:
+                    break
+                pending -= 1
+                if kind in TYPES_BLOB:
+                    length = int(data[pos + 1:end])
+                    if length >= 0:
+                        remaining = length + 2
+                elif kind in TYPES_AGGREGATE:
+                    length = int(data[pos + 1:end])
+                    if kind == ORD_MAP or kind == ORD_ATTRIBUTE:
+                        length *= 2
+                    if length > 0:
+                        pending += length
+                    if kind == ORD_ATTRIBUTE:
+                        pending += 1
+                pos = end + 2
+                if remaining:
+                    continue
+            else:
+                if skipped == count or pos >= size:
+                    break
+                kind = data[pos]
+                if kind == ORD_PUSH and push_handler is not None:
+                    pending = -1
+                else:
+                    pending = 1
+                    error = kind == ORD_ERROR or kind == ORD_BLOB_ERROR
+                    push = kind == ORD_PUSH
+                continue
+            if not pending and not push:
+                skipped += 1
+                errors += error
+        buffer.pos = pos
+        self._skip = [pending, remaining, error, push]
+        buffer.compact()
+        return skipped, errors
 
     def gets(self):
-        self._buffer.seek(self._buffer_pos)
         result = self._replyparser.parse()
-        self._buffer_pos = self._buffer.tell()
+        self._buffer.compact()
         if result:
             result = self._replyparser.result
-            self._truncate()
             self._replyparser.reset()
             return result
         return False
 
 
 def to_bytes(value):
+    """
+    Convert a command argument to bytes.
+
+    bytes-like objects (bytearray, memoryview, mmap and anything else
+    supporting the buffer protocol) are passed through as a flat byte view
+    without copying.
+
+    Raises:
+        ValueError: If the value can not be converted.
+    """
     if isinstance(value, bytes):
         return value
     elif isinstance(value, str):
         return value.encode()
     elif isinstance(value, (int, float)):
         return str(value).encode()
+    elif isinstance(value, bytearray):
+        return value
+    elif isinstance(value, memoryview):
+        view = value
     else:
+        try:
+            view = memoryview(value)
+        except TypeError:
+            raise ValueError(
+                "Unsupported value, has to be a instance of "
+                "bytes, str, int, float or support the buffer protocol"
+            )
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+
+def has_large_arg(args):
+    """
+    Check if any argument is large enough to be sent without copying.
+
+    Returns:
+        True if an argument has at least IOV_THRESHOLD bytes.
+    """
+    for arg in args:
+        if isinstance(arg, (bytes, str, bytearray)):
+            if len(arg) >= IOV_THRESHOLD:
+                return True
+        elif not isinstance(arg, (int, float)):
+            try:
+                with memoryview(arg) as view:
+                    if view.nbytes >= IOV_THRESHOLD:
+                        return True
+            except TypeError:
+                pass
+    return False
+
+
+def stream_length(source):
+    """
+    Number of bytes left in a buffer or seekable file-like object.
+
+    Raises:
+        ValueError: If the length can not be determined.
+    """
+    try:
+        with memoryview(source) as view:
+            return view.nbytes
+    except TypeError:
+        pass
+    try:
+        pos = source.tell()
+        end = source.seek(0, 2)
+        source.seek(pos)
+    except (AttributeError, OSError) as err:
         raise ValueError(
-            "Unsupported value, has to be a instance of "
-            "bytes, str, int or float"
+            "Could not determine length of stream, pass length: {0}".format(err)
         )
+    return end - pos
 
 
-def writer(*args):
+def writer_args(*args):
     buf = list()
     extend = buf.extend
 
-    extend((TYPE_ARRAY, str(len(args)).encode(), SYM_CRLF))
-
     for member in map(to_bytes, args):
         extend(
             (
@@ -261,3 +675,90 @@ def writer(*args):
         )
 
     return b"".join(buf)
+
+
+def writer_iov(*args):
+    """
+    Serialize a command into a list of buffers for scatter-gather writes.
+
+    Arguments of at least IOV_THRESHOLD bytes are referenced as they are,
+    the small framing and arguments in between are joined.
+
+    Returns:
+        List of bytes-like objects, sent in order they form the command.
+    """
+    parts = list()
+    buf = [TYPE_ARRAY, str(len(args)).encode(), SYM_CRLF]
+    for member in map(to_bytes, args):
+        size = len(member)
+        buf.extend((TYPE_BULK, str(size).encode(), SYM_CRLF))
+        if size >= IOV_THRESHOLD:
+            parts.append(b"".join(buf))
+            parts.append(member)
+            buf = [SYM_CRLF]
+        else:
+            buf.extend((member, SYM_CRLF))
+    parts.append(b"".join(buf))
+    return parts
+
+
+def writer(*args):
+    return b"".join(
+        (TYPE_ARRAY, str(len(args)).encode(), SYM_CRLF, writer_args(*args))
+    )
+
+
+def _encode_command(command):
+    cacheable = isinstance(command, (bytes, str))
+    if cacheable:
+        encoded = COMMAND_CACHE.get(command)
+        if encoded is not None:
+            return encoded
+    member = to_bytes(command)
+    encoded = b"".join((b"$%d\r\n" % len(member), member, SYM_CRLF))
+    if (
+        cacheable
+        and len(member) <= 32
+        and len(COMMAND_CACHE) < COMMAND_CACHE_SIZE
+    ):
+        COMMAND_CACHE[command] = encoded
+    return encoded
+
+
+def writer_many(commands, out=None):
+    """
+    Serialize many commands into one buffer.
+
+    Length headers of small sizes and command names are taken from caches,
+    so a batch costs no per argument list and join like writer() does.
+
+    Args:
+        commands: Iterable of argument tuples, e.g. [("SET", "k", "v")].
+        out: bytearray to append to, a new one is created if not given.
+
+    Returns:
+        The bytearray holding the serialized commands.
+    """
+    if out is None:
+        out = bytearray()
+    bulk_headers = BULK_HEADERS
+    bulk_cached = len(bulk_headers)
+    array_cached = len(ARRAY_HEADERS)
+    for args in commands:
+        count = len(args)
+        if count < array_cached:
+            out += ARRAY_HEADERS[count]
+        else:
+            out += b"*%d\r\n" % count
+        if not count:
+            continue
+        out += _encode_command(args[0])
+        for member in map(to_bytes, args[1:]):
+            size = len(member)
+            if size < bulk_cached:
+                out += bulk_headers[size]
+            else:
+                out += b"$%d\r\n" % size
+            out += member
+            out += SYM_CRLF
+    return out
@@ -1,8 +1,13 @@
 import asyncio
+import io
+import math
+import time
+import socket
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import Mock
+from unittest.mock import call
 from unittest.mock import patch
 
 from pyredis import get_by_url
@@ -15,12 +20,20 @@ from pyredis.connection import AsyncConnection
 from pyredis.exceptions import PyRedisConnClosed
 from pyredis.exceptions import PyRedisConnError
 from pyredis.exceptions import PyRedisConnReadTimeout
+from pyredis.exceptions import PyRedisDeadlineExceeded
 from pyredis.exceptions import PyRedisError
+from pyredis.exceptions import ReplyError
 from pyredis.pool import AsyncPool
 from pyredis.pool import AsyncClusterPool
 from pyredis.pool import AsyncHashPool
 from pyredis.pool import AsyncSentinelPool
 from pyredis.pool import AsyncSentinelHashPool
+from pyredis.async_helper import AsyncClusterMap
+from pyredis.helper import slot_from_key
+from pyredis.protocol import Reader
+from pyredis.protocol import writer
+import pyredis.connection
+import pyredis.connection.async_protocol
 
 
 class TestAsyncConnection(IsolatedAsyncioTestCase):
@@ -83,9 +96,9 @@ class TestAsyncConnection(IsolatedAsyncioTestCase):
             host="127.0.0.1",
             password="testpass"
         )
-        self.mock_reader_parser.gets.side_effect = [
-            False,
-            b"OK"
+        self.mock_reader_parser.gets_many.side_effect = [
+            [],
+            [b"OK"]
         ]
         self.mock_reader.read.return_value = b"+OK\r\n"
 
@@ -101,29 +114,929 @@ class TestAsyncConnection(IsolatedAsyncioTestCase):
             }
         )
 
+    async def test_connect_hello_3(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            protocol=3
+        )
+        self.mock_reader_parser.gets_many.side_effect = [
+            [{b"proto": 3}]
+        ]
+
+        await conn.write(
+            *["PING"]
+        )
+
+        self.assertEqual(
+            first=self.mock_writer.write.call_args_list[0][0],
+            second=(
+                writer("HELLO", 3),
+            )
+        )
+
+    async def test_connect_handshake_single_write(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            password="testpass",
+            database=1,
+            read_only=True,
+            client_name="worker"
+        )
+        self.mock_reader_parser.gets_many.side_effect = [
+            [b"OK", b"OK", b"OK", b"OK"]
+        ]
+
+        await conn.write(
+            *["PING"]
+        )
+
+        self.assertEqual(
+            first=self.mock_writer.write.call_args_list[0][0],
+            second=(
+                writer("AUTH", "testpass")
+                + writer("CLIENT", "SETNAME", "worker")
+                + writer("SELECT", 1)
+                + writer("READONLY"),
+            )
+        )
+        self.mock_reader_parser.gets_many.assert_called_once_with(4)
+
+    async def test_connect_handshake_error(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            database=23234
+        )
+        self.mock_reader_parser.gets_many.side_effect = [
+            [ReplyError("ERR DB index is out of range")]
+        ]
+
+        with self.assertRaises(
+            expected_exception=ReplyError
+        ):
+            await conn.write(
+                *["PING"]
+            )
+        self.assertTrue(
+            expr=conn.closed
+        )
+
+    async def test_connect_socket_options(self):
+        sock = Mock()
+        self.mock_writer.get_extra_info.return_value = sock
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            socket_options={"keepalive": True}
+        )
+
+        await conn.write(
+            *["PING"]
+        )
+
+        self.mock_writer.get_extra_info.assert_called_with("socket")
+        sock.setsockopt.assert_any_call(
+            socket.IPPROTO_TCP,
+            socket.TCP_NODELAY,
+            1
+        )
+        sock.setsockopt.assert_any_call(
+            socket.SOL_SOCKET,
+            socket.SO_KEEPALIVE,
+            1
+        )
+
+    async def test_connect_socket_options_error(self):
+        sock = Mock()
+        sock.setsockopt.side_effect = OSError
+        self.mock_writer.get_extra_info.return_value = sock
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        with self.assertRaises(
+            expected_exception=PyRedisConnError
+        ):
+            await conn.write(
+                *["PING"]
+            )
+        self.mock_writer.close.assert_called_with()
+        self.assertIsNone(
+            obj=conn._writer
+        )
+
+    async def test_deadline_exceeded(self):
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        await conn._connect()
+
+        async def slow_read(size):
+            await asyncio.sleep(1)
+            return b"+OK\r\n"
+
+        self.mock_reader.read.side_effect = slow_read
+        self.mock_reader_parser.gets.return_value = False
+        with self.assertRaises(
+            expected_exception=PyRedisDeadlineExceeded
+        ):
+            async with conn.deadline(time.monotonic() + 0.05):
+                await conn.read()
+        self.assertTrue(
+            expr=conn.closed
+        )
+
+    async def test_deadline_outlives_read_timeout(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            read_timeout=0.01
+        )
+        await conn._connect()
+
+        async def slow_read(size):
+            await asyncio.sleep(0.05)
+            return b"+OK\r\n"
+
+        self.mock_reader.read.side_effect = slow_read
+        self.mock_reader_parser.gets.side_effect = [False, b"OK"]
+        async with conn.deadline(math.inf):
+            result = await conn.read()
+        self.assertEqual(
+            first=result,
+            second=b"OK"
+        )
+
+    async def test_execute_timeout(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        await client._conn._connect()
+
+        async def slow_read(size):
+            await asyncio.sleep(1)
+            return b"+OK\r\n"
+
+        self.mock_reader.read.side_effect = slow_read
+        self.mock_reader_parser.gets.return_value = False
+        with self.assertRaises(
+            expected_exception=PyRedisDeadlineExceeded
+        ):
+            await client.execute("PING", timeout=0.05)
+
+    async def test_write_large_arg_writelines(self):
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        conn._writer = self.mock_writer
+        value = b"x" * 100000
+
+        await conn.write(
+            *["SET", "key", value]
+        )
+
+        parts = self.mock_writer.writelines.call_args[0][0]
+        self.assertIs(
+            parts[1],
+            value
+        )
+        self.assertEqual(
+            first=b"".join(parts),
+            second=writer("SET", "key", value)
+        )
+
     async def test_read_timeout(self):
         conn = AsyncConnection(
             host="127.0.0.1"
         )
-        self.mock_reader_parser.gets.return_value = False
-        self.mock_reader.read.side_effect = asyncio.TimeoutError
+        self.mock_reader_parser.gets.return_value = False
+        self.mock_reader.read.side_effect = asyncio.TimeoutError
+
+        with self.assertRaises(
+            expected_exception=PyRedisConnReadTimeout
+        ):
+            await conn.read()
+
+    async def test_read_closed(self):
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        self.mock_reader_parser.gets.return_value = False
+        self.mock_reader.read.return_value = b""
+
+        with self.assertRaises(
+            expected_exception=PyRedisConnClosed
+        ):
+            await conn.read()
+
+
+    async def test_read_into(self):
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        pyredis.connection.Reader = Reader
+        self.mock_reader.read.side_effect = [
+            b"$10\r\n01234",
+            b"56789",
+            b"\r\n",
+        ]
+        target = bytearray(10)
+
+        res = await conn.read_into(target)
+
+        self.assertEqual(
+            first=res,
+            second=10
+        )
+        self.assertEqual(
+            first=target,
+            second=b"0123456789"
+        )
+
+    async def test_read_iter(self):
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        pyredis.connection.Reader = Reader
+        self.mock_reader.read.side_effect = [
+            b"*2\r\n$1\r\na\r\n",
+            b"$1\r\nb\r\n",
+        ]
+
+        res = await conn.read_iter()
+
+        self.assertEqual(
+            first=[item async for item in res],
+            second=[b"a", b"b"]
+        )
+
+    async def test_read_iter_push_handler(self):
+        pushes = []
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            push_handler=pushes.append
+        )
+        pyredis.connection.Reader = Reader
+        self.mock_reader.read.side_effect = [
+            b">2\r\n$7\r\nmessage\r\n$2\r\nhi\r\n",
+            b"*2\r\n$1\r\na\r\n$1\r\nb\r\n",
+        ]
+
+        res = await conn.read_iter()
+
+        self.assertEqual(
+            first=[item async for item in res],
+            second=[b"a", b"b"]
+        )
+        self.assertEqual(
+            first=pushes,
+            second=[[b"message", b"hi"]]
+        )
+
+    async def test_read_size_adapts(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            read_buffer_size=1024,
+            max_read_buffer=4096
+        )
+        await conn._connect()
+        self.mock_reader.read.side_effect = [
+            b"x" * 1024,
+            b"x" * 2048,
+            b"x" * 4096,
+            b"x" * 4096,
+        ] + [b"x"] * 32
+        for size in (1024, 2048, 4096, 4096):
+            self.mock_reader.read.reset_mock()
+            await conn._recv(conn._read_size, True)
+            self.mock_reader.read.assert_called_with(size)
+        for _ in range(32):
+            await conn._recv(conn._read_size, True)
+        self.assertEqual(
+            first=conn._read_size,
+            second=1024
+        )
+
+    async def test_read_many(self):
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        pyredis.connection.Reader = Reader
+        self.mock_reader.read.side_effect = [
+            b"+OK\r\n:1",
+            b"\r\n:2\r\n",
+        ]
+
+        res = await conn.read_many(3)
+
+        self.assertEqual(
+            first=res,
+            second=[b"OK", 1, 2]
+        )
+
+    async def test_write_stream(self):
+        conn = AsyncConnection(
+            host="127.0.0.1"
+        )
+        self.mock_reader_parser.gets.return_value = None
+        source = io.BytesIO(b"value")
+
+        await conn.write_stream((b"SET", b"key"), source)
+
+        self.assertEqual(
+            first=b"".join(
+                c[0][0] for c in self.mock_writer.write.call_args_list
+            ),
+            second=writer(b"SET", b"key", b"value")
+        )
+
+
+class TestAsyncProtocol(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.values = {b"big": b"x" * 300000, b"huge": b"y" * 4194304}
+
+        async def handle(reader, writer):
+            parser = Reader()
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                parser.feed(data)
+                while True:
+                    command = parser.gets()
+                    if command is False:
+                        break
+                    if command[0] == b"PING":
+                        writer.write(b"+PONG\r\n")
+                    elif command[0] == b"ECHO":
+                        writer.write(writer_bulk(command[1]))
+                    elif command[0] == b"GET":
+                        writer.write(writer_bulk(self.values[command[1]]))
+                    elif command[0] == b"SELECT":
+                        if command[1] == b"1":
+                            await asyncio.sleep(0.1)
+                        writer.write(b"+OK\r\n")
+                    elif command[0] == b"SLOW":
+                        await asyncio.sleep(float(command[1]))
+                        writer.write(b"+OK\r\n")
+                    elif command[0] == b"QUIT":
+                        writer.close()
+                        return
+                await writer.drain()
+            writer.close()
+
+        def writer_bulk(value):
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+
+        self.server = await asyncio.start_server(
+            handle,
+            host="127.0.0.1",
+            port=0
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def test_invalid_transport(self):
+        with self.assertRaises(
+            expected_exception=PyRedisError
+        ):
+            AsyncConnection(
+                host="127.0.0.1",
+                transport="blarg"
+            )
+
+    async def test_execute(self):
+        client = AsyncClient(
+            host="127.0.0.1",
+            port=self.port,
+            transport="protocol"
+        )
+        self.assertEqual(
+            first=await client.ping(),
+            second=b"PONG"
+        )
+        self.assertEqual(
+            first=await client.execute("ECHO", "x" * 100000),
+            second=b"x" * 100000
+        )
+        self.assertIsInstance(
+            obj=client._conn._reader,
+            cls=pyredis.connection.async_protocol.AsyncProtocol
+        )
+        await client.close()
+
+    async def test_read_many(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port,
+            transport="protocol"
+        )
+        await conn.write_many([("PING",), ("ECHO", "hello"), ("PING",)])
+        self.assertEqual(
+            first=await conn.read_many(3),
+            second=[b"PONG", b"hello", b"PONG"]
+        )
+        await conn.close()
+
+    async def test_read_into(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port,
+            transport="protocol"
+        )
+        target = bytearray(300000)
+        await conn.write("GET", "big")
+        self.assertEqual(
+            first=await conn.read_into(target),
+            second=300000
+        )
+        self.assertEqual(
+            first=target,
+            second=self.values[b"big"]
+        )
+        await conn.close()
+
+    async def test_read_into_bounded_buffer(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port,
+            transport="protocol",
+            max_read_buffer=65536
+        )
+        await conn._connect()
+        protocol = conn._reader
+        parser = protocol._parser
+        transport = protocol._transport
+        feed = parser.feed
+        pause_reading = transport.pause_reading
+        peak = []
+        pauses = []
+
+        def tracked_feed(data):
+            feed(data)
+            peak.append(parser.buffered())
+
+        def tracked_pause_reading():
+            pauses.append(parser.buffered())
+            pause_reading()
+
+        parser.feed = tracked_feed
+        transport.pause_reading = tracked_pause_reading
+        target = bytearray(4194304)
+        await conn.write("GET", "huge")
+        self.assertEqual(
+            first=await conn.read_into(target),
+            second=4194304
+        )
+        self.assertEqual(
+            first=target,
+            second=self.values[b"huge"]
+        )
+        self.assertTrue(
+            expr=pauses
+        )
+        self.assertLess(
+            a=max(peak),
+            b=1048576
+        )
+        await conn.close()
+
+    async def test_read_flow_control(self):
+        transport = Mock()
+        parser = Reader()
+        protocol = pyredis.connection.async_protocol.AsyncProtocol(
+            parser, high_water=10
+        )
+        protocol.connection_made(transport)
+        protocol.data_received(b"+OK\r\n")
+        transport.pause_reading.assert_not_called()
+        protocol.data_received(b"$8\r\nabcdefgh\r\n")
+        transport.pause_reading.assert_called_once_with()
+        self.assertEqual(
+            first=parser.gets(),
+            second=b"OK"
+        )
+        self.assertEqual(
+            first=parser.gets(),
+            second=b"abcdefgh"
+        )
+        wait = asyncio.ensure_future(protocol.wait())
+        await asyncio.sleep(0)
+        transport.resume_reading.assert_called_once_with()
+        protocol.data_received(b"+OK\r\n")
+        self.assertTrue(
+            expr=await wait
+        )
+
+    async def test_connection_closed(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port,
+            transport="protocol"
+        )
+        await conn.write("QUIT")
+        with self.assertRaises(
+            expected_exception=PyRedisConnClosed
+        ):
+            await conn.read()
+        self.assertTrue(
+            expr=conn.closed
+        )
+
+    async def test_read_timeout(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port,
+            transport="protocol",
+            read_timeout=0.05
+        )
+        await conn._connect()
+        with self.assertRaises(
+            expected_exception=PyRedisConnReadTimeout
+        ):
+            await conn.read()
+
+    async def test_drain_flow_control(self):
+        protocol = pyredis.connection.async_protocol.AsyncProtocol(Reader())
+        protocol.connection_made(Mock())
+        await protocol.drain()
+        protocol.pause_writing()
+        drain = asyncio.ensure_future(protocol.drain())
+        await asyncio.sleep(0)
+        self.assertFalse(
+            expr=drain.done()
+        )
+        protocol.resume_writing()
+        await drain
+        protocol.connection_lost(None)
+        with self.assertRaises(
+            expected_exception=BrokenPipeError
+        ):
+            await protocol.drain()
+
+    async def test_multiplex_concurrent(self):
+        for transport in ("stream", "protocol"):
+            client = AsyncClient(
+                host="127.0.0.1",
+                port=self.port,
+                transport=transport,
+                multiplex=True
+            )
+            results = await asyncio.gather(*(
+                client.execute("ECHO", str(i) * (i * 1000 + 1))
+                for i in range(50)
+            ))
+            self.assertEqual(
+                first=results,
+                second=[(str(i) * (i * 1000 + 1)).encode() for i in range(50)]
+            )
+            self.assertFalse(
+                expr=client._conn._pending
+            )
+            await client.close()
+
+    async def test_multiplex_late_caller_during_handshake(self):
+        for transport in ("stream", "protocol"):
+            conn = AsyncConnection(
+                host="127.0.0.1",
+                port=self.port,
+                transport=transport,
+                database=1,
+                multiplex=True
+            )
+
+            async def late():
+                await asyncio.sleep(0.02)
+                return await conn.request("ECHO", "late")
+
+            self.assertEqual(
+                first=await asyncio.gather(conn.request("PING"), late()),
+                second=[b"PONG", b"late"]
+            )
+            await conn.close()
+
+    async def test_multiplex_cancel_during_handshake(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port,
+            database=1,
+            multiplex=True
+        )
+        first = asyncio.ensure_future(conn.request("PING"))
+        await asyncio.sleep(0.02)
+        first.cancel()
+        with self.assertRaises(
+            expected_exception=asyncio.CancelledError
+        ):
+            await first
+        self.assertTrue(
+            expr=conn.closed
+        )
+
+    async def test_multiplex_cancel(self):
+        client = AsyncClient(
+            host="127.0.0.1",
+            port=self.port,
+            multiplex=True
+        )
+        await client.ping()
+        slow = asyncio.ensure_future(client.execute("SLOW", "0.05"))
+        echo = asyncio.ensure_future(client.execute("ECHO", "after"))
+        await asyncio.sleep(0.01)
+        slow.cancel()
+        self.assertEqual(
+            first=await echo,
+            second=b"after"
+        )
+        with self.assertRaises(
+            expected_exception=asyncio.CancelledError
+        ):
+            await slow
+        self.assertEqual(
+            first=await client.ping(),
+            second=b"PONG"
+        )
+        await client.close()
+
+    async def test_multiplex_deadline(self):
+        client = AsyncClient(
+            host="127.0.0.1",
+            port=self.port,
+            multiplex=True
+        )
+        await client.ping()
+        with self.assertRaises(
+            expected_exception=PyRedisDeadlineExceeded
+        ):
+            await client.execute("SLOW", "0.2", timeout=0.05)
+        self.assertFalse(
+            expr=client.closed
+        )
+        self.assertEqual(
+            first=await client.execute("ECHO", "next"),
+            second=b"next"
+        )
+        await client.close()
+
+    async def test_multiplex_close_fails_pending(self):
+        client = AsyncClient(
+            host="127.0.0.1",
+            port=self.port,
+            multiplex=True
+        )
+        await client.ping()
+        slow = asyncio.ensure_future(client.execute("SLOW", "1"))
+        await asyncio.sleep(0.01)
+        await client.close()
+        with self.assertRaises(
+            expected_exception=PyRedisConnClosed
+        ):
+            await slow
+
+    async def test_auto_pipeline_single_write(self):
+        for transport in ("stream", "protocol"):
+            client = AsyncClient(
+                host="127.0.0.1",
+                port=self.port,
+                transport=transport,
+                auto_pipeline=True
+            )
+            await client.ping()
+            write = Mock(wraps=client._conn._writer.write)
+            client._conn._writer.write = write
+            results = await asyncio.gather(*(
+                client.execute("ECHO", str(i)) for i in range(100)
+            ))
+            self.assertEqual(
+                first=results,
+                second=[str(i).encode() for i in range(100)]
+            )
+            self.assertEqual(
+                first=write.call_count,
+                second=1
+            )
+            await client.close()
+
+    async def test_auto_pipeline_max_batch(self):
+        client = AsyncClient(
+            host="127.0.0.1",
+            port=self.port,
+            auto_pipeline=True,
+            pipeline_max_batch=10,
+            pipeline_delay=0.01
+        )
+        await client.ping()
+        write = Mock(wraps=client._conn._writer.write)
+        client._conn._writer.write = write
+        results = await asyncio.gather(*(
+            client.execute("ECHO", str(i)) for i in range(25)
+        ))
+        self.assertEqual(
+            first=results,
+            second=[str(i).encode() for i in range(25)]
+        )
+        self.assertEqual(
+            first=write.call_count,
+            second=3
+        )
+        await client.close()
+
+    async def test_auto_pipeline_writer_gone(self):
+        for transport in ("stream", "protocol"):
+            client = AsyncClient(
+                host="127.0.0.1",
+                port=self.port,
+                transport=transport,
+                auto_pipeline=True,
+                pipeline_delay=0.05
+            )
+            await client.ping()
+            task = asyncio.ensure_future(client.execute("ECHO", "a"))
+            await asyncio.sleep(0.01)
+            self.assertTrue(
+                expr=client._conn._batch_count
+            )
+            writer = client._conn._writer
+            client._conn._writer = None
+            with self.assertRaises(
+                expected_exception=PyRedisConnClosed
+            ):
+                await asyncio.wait_for(task, 1)
+            writer.close()
+            await asyncio.sleep(0)
+            self.assertTrue(
+                expr=client._conn.closed
+            )
+            await client.close()
+
+    async def test_auto_pipeline_pool(self):
+        pool = AsyncPool(
+            host="127.0.0.1",
+            port=self.port,
+            auto_pipeline=True
+        )
+        results = await asyncio.gather(*(
+            pool.execute("ECHO", str(i)) for i in range(20)
+        ))
+        self.assertEqual(
+            first=results,
+            second=[str(i).encode() for i in range(20)]
+        )
+        self.assertFalse(
+            expr=pool._pool_used
+        )
+        self.assertFalse(
+            expr=pool._pool_free
+        )
+        await pool._shared.close()
+
+    async def test_auto_pipeline_pool_single_shared_client(self):
+        pool = AsyncPool(
+            host="127.0.0.1",
+            port=self.port,
+            auto_pipeline=True
+        )
+
+        async def connect():
+            await asyncio.sleep(0)
+            client = AsyncMock()
+            client.closed = False
+            return client
+
+        pool._connect = Mock(side_effect=connect)
+        clients = await asyncio.gather(*(
+            pool._shared_client() for _ in range(5)
+        ))
+        self.assertEqual(
+            first=pool._connect.call_count,
+            second=1
+        )
+        self.assertEqual(
+            first=len(set(map(id, clients))),
+            second=1
+        )
+
+    async def test_request_many(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port,
+            multiplex=True
+        )
+        results = await asyncio.gather(
+            conn.request_many([("ECHO", "a"), ("PING",), ("ECHO", "b")]),
+            conn.request("ECHO", "c")
+        )
+        self.assertEqual(
+            first=results,
+            second=[[b"a", b"PONG", b"b"], b"c"]
+        )
+        self.assertEqual(
+            first=await conn.request_many([]),
+            second=[]
+        )
+        await conn.close()
+
+    async def test_pipeline(self):
+        for transport in ("stream", "protocol"):
+            client = AsyncClient(
+                host="127.0.0.1",
+                port=self.port,
+                transport=transport
+            )
+            async with client.pipeline(bulk_size=7) as pipe:
+                for i in range(20):
+                    self.assertEqual(
+                        first=await pipe.echo(str(i)),
+                        second=i
+                    )
+            self.assertEqual(
+                first=list(pipe.result),
+                second=[str(i).encode() for i in range(20)]
+            )
+            self.assertFalse(
+                expr=client.bulk
+            )
+            self.assertEqual(
+                first=await client.ping(),
+                second=b"PONG"
+            )
+            await client.close()
+
+    async def test_pipeline_multiplex(self):
+        client = AsyncClient(
+            host="127.0.0.1",
+            port=self.port,
+            auto_pipeline=True
+        )
+
+        async def run_pipeline():
+            async with client.pipeline(bulk_size=3) as pipe:
+                for i in range(10):
+                    await pipe.echo(str(i))
+                    await asyncio.sleep(0)
+            return list(pipe.result)
+
+        results = await asyncio.gather(
+            run_pipeline(),
+            *(client.execute("ECHO", f"other{i}") for i in range(10))
+        )
+        self.assertEqual(
+            first=results[0],
+            second=[str(i).encode() for i in range(10)]
+        )
+        self.assertEqual(
+            first=results[1:],
+            second=[f"other{i}".encode() for i in range(10)]
+        )
+        with self.assertRaises(
+            expected_exception=PyRedisError
+        ):
+            client.bulk_start()
+        await client.close()
+
+    async def test_pipeline_pool(self):
+        pool = AsyncPool(
+            host="127.0.0.1",
+            port=self.port
+        )
+        async with pool.pipeline() as pipe:
+            await pipe.echo("a")
+            await pipe.ping()
+        self.assertEqual(
+            first=pipe.result.values,
+            second=[b"a", b"PONG"]
+        )
+        self.assertFalse(
+            expr=pool._pool_used
+        )
+        self.assertEqual(
+            first=len(pool._pool_free),
+            second=1
+        )
+        for client in pool._pool_free:
+            await client.close()
 
+    async def test_multiplex_unsupported(self):
+        conn = AsyncConnection(
+            host="127.0.0.1",
+            port=self.port
+        )
         with self.assertRaises(
-            expected_exception=PyRedisConnReadTimeout
+            expected_exception=PyRedisError
         ):
-            await conn.read()
-
-    async def test_read_closed(self):
-        conn = AsyncConnection(
-            host="127.0.0.1"
+            await conn.request("PING")
+        client = AsyncClient(
+            host="127.0.0.1",
+            port=self.port,
+            multiplex=True
         )
-        self.mock_reader_parser.gets.return_value = False
-        self.mock_reader.read.return_value = b""
-
         with self.assertRaises(
-            expected_exception=PyRedisConnClosed
+            expected_exception=PyRedisError
         ):
-            await conn.read()
+            await client.execute("KEYS", "*", stream=True)
+        with self.assertRaises(
+            expected_exception=PyRedisError
+        ):
+            await client.get_into("big", bytearray(10))
 
 
 class TestAsyncClient(IsolatedAsyncioTestCase):
@@ -149,6 +1062,170 @@ class TestAsyncClient(IsolatedAsyncioTestCase):
             )
         )
 
+    async def test_bulk(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.queue = Mock()
+        client._conn.read_many.side_effect = [[b"OK", b"OK"], [b"OK"]]
+        client.bulk_start(bulk_size=2)
+        with self.assertRaises(
+            expected_exception=PyRedisError
+        ):
+            client.bulk_start()
+        for i in range(3):
+            self.assertIsNone(
+                obj=await client.set(f"key{i}", "value")
+            )
+        self.assertEqual(
+            first=client._conn.flush.await_count,
+            second=1
+        )
+        self.assertEqual(
+            first=await client.bulk_stop(),
+            second=[b"OK", b"OK", b"OK"]
+        )
+        self.assertFalse(
+            expr=client.bulk
+        )
+        client._conn.write.assert_not_called()
+
+    async def test_bulk_count_errors(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.queue = Mock()
+        client._conn.skip_many.side_effect = [2, 1]
+        client.bulk_start(bulk_size=2, keep_results=False, count_errors=True)
+        for i in range(3):
+            await client.set(f"key{i}", "value")
+        self.assertEqual(
+            first=await client.bulk_stop(),
+            second=3
+        )
+        client._conn.read_many.assert_not_awaited()
+
+    async def test_pipeline_transaction(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.queue = Mock()
+        client._conn.read_many.return_value = [
+            b"OK", b"QUEUED", b"QUEUED", [b"OK", ReplyError("WRONGTYPE")]
+        ]
+        async with client.pipeline(transaction=True) as pipe:
+            await pipe.set("key", "value")
+            index = await pipe.lpush("key", "value")
+        self.assertEqual(
+            first=[c[0] for c in client._conn.queue.call_args_list],
+            second=[
+                ("MULTI",),
+                (b"SET", "key", "value"),
+                (b"LPUSH", "key", "value"),
+                ("EXEC",)
+            ]
+        )
+        self.assertEqual(
+            first=pipe.result[0],
+            second=b"OK"
+        )
+        with self.assertRaises(
+            expected_exception=ReplyError
+        ):
+            pipe.result.get(index)
+
+    async def test_pipeline_error_discards_transaction(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.queue = Mock()
+        client._conn.read_many.return_value = [b"OK", b"QUEUED", b"OK"]
+        with self.assertRaises(
+            expected_exception=ValueError
+        ):
+            async with client.pipeline(transaction=True) as pipe:
+                await pipe.set("key", "value")
+                raise ValueError()
+        client._conn.queue.assert_called_with("DISCARD")
+        client._conn.read_many.assert_awaited_once_with(3)
+        self.assertFalse(
+            expr=client.bulk
+        )
+
+    async def test_execute_stream(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.read_iter.return_value = [b"a"]
+
+        res = await client.execute(
+            *["KEYS", "*"],
+            stream=True
+        )
+
+        self.assertEqual(
+            first=res,
+            second=[b"a"]
+        )
+        client._conn.read.assert_not_called()
+
+    async def test_execute_stream_timeout(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.read_timeout = None
+
+        with self.assertRaises(
+            expected_exception=PyRedisError
+        ):
+            await client.execute(
+                *["KEYS", "*"],
+                stream=True,
+                timeout=5
+            )
+        client._conn.write.assert_not_called()
+
+    async def test_get_into(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.read_into.return_value = 5
+        target = bytearray(5)
+
+        res = await client.get_into("key", target)
+
+        self.assertEqual(
+            first=res,
+            second=5
+        )
+        client._conn.write.assert_called_with(b"GET", "key")
+        client._conn.read_into.assert_called_with(target)
+
+    async def test_set_from(self):
+        client = AsyncClient(
+            host="127.0.0.1"
+        )
+        client._conn = AsyncMock()
+        client._conn.read.return_value = b"OK"
+        source = b"value"
+
+        res = await client.set_from("key", source)
+
+        self.assertEqual(
+            first=res,
+            second=b"OK"
+        )
+        client._conn.write_stream.assert_called_with(
+            (b"SET", "key"), source, tail=(), length=None
+        )
+
     async def test_close(self):
         client = AsyncClient(
             host="127.0.0.1"
@@ -194,6 +1271,38 @@ class TestAsyncPool(IsolatedAsyncioTestCase):
             second=1
         )
 
+    async def test_pool_execute_stream(self):
+        pool = AsyncPool(
+            host="127.0.0.1"
+        )
+        mock_client = AsyncMock()
+        mock_client.closed = False
+
+        async def stream():
+            yield b"a"
+            yield b"b"
+
+        mock_client.execute.return_value = stream()
+        pool._connect = Mock()
+        pool._connect.return_value = mock_client
+
+        res = await pool.execute(
+            *["KEYS", "*"],
+            stream=True
+        )
+        self.assertEqual(
+            first=len(pool._pool_used),
+            second=1
+        )
+        self.assertEqual(
+            first=[item async for item in res],
+            second=[b"a", b"b"]
+        )
+        self.assertEqual(
+            first=len(pool._pool_free),
+            second=1
+        )
+
     async def test_pool_execute(self):
         pool = AsyncPool(
             host="127.0.0.1"
@@ -238,6 +1347,172 @@ class TestAsyncClusterClient(IsolatedAsyncioTestCase):
                 second=b"OK"
             )
 
+    async def test_async_cluster_client_auto_pipeline(self):
+        with patch(
+            target="pyredis.client.AsyncClusterMap",
+            autospec=True
+        ) as mock_map_class:
+            mock_map = mock_map_class.return_value
+            mock_map.id = "mapid"
+            mock_map.get_slot.return_value = "127.0.0.1_6379"
+
+            client = AsyncClusterClient(
+                seeds=[("127.0.0.1", 6379)],
+                auto_pipeline=True,
+                pipeline_max_batch=100
+            )
+            await client._connect("127.0.0.1_6379")
+            conn = client._conns["127.0.0.1_6379"]
+            self.assertTrue(
+                expr=conn._auto_pipeline
+            )
+            self.assertEqual(
+                first=conn._pipeline_max_batch,
+                second=100
+            )
+            client._conns["127.0.0.1_6379"] = AsyncMock()
+            client._conns["127.0.0.1_6379"].request.return_value = b"OK"
+
+            res = await client.execute(
+                *["SET", "foo", "bar"],
+                shard_key="foo"
+            )
+            self.assertEqual(
+                first=res,
+                second=b"OK"
+            )
+            client._conns["127.0.0.1_6379"].request.assert_awaited_once_with(
+                "SET", "foo", "bar"
+            )
+
+    async def test_pipeline(self):
+        with patch(
+            target="pyredis.client.AsyncClusterMap",
+            autospec=True
+        ) as mock_map_class:
+            mock_map = mock_map_class.return_value
+            mock_map.id = "mapid"
+            mock_map.get_slot.side_effect = lambda shard_key, slave: {
+                "a": "host1_6379", "b": "host2_6379"
+            }[shard_key]
+
+            client = AsyncClusterClient(
+                seeds=[("127.0.0.1", 6379)]
+            )
+            conn1 = AsyncMock()
+            conn1.queue = Mock()
+            conn1.read_many.return_value = [b"1", ReplyError("ASK 1 host2:6379")]
+            conn2 = AsyncMock()
+            conn2.queue = Mock()
+            conn2.read_many.side_effect = [[b"2"], [b"OK", b"3"]]
+            client._conns["host1_6379"] = conn1
+            client._conns["host2_6379"] = conn2
+            async with client.pipeline() as pipe:
+                await pipe.get("a")
+                await pipe.get("b")
+                await pipe.get("a")
+            self.assertEqual(
+                first=pipe.result.values,
+                second=[b"1", b"2", b"3"]
+            )
+            conn2.queue.assert_has_calls([
+                call(b"GET", "b"),
+                call("ASKING"),
+                call(b"GET", "a"),
+            ])
+            mock_map.update.assert_not_awaited()
+
+    async def test_pipeline_auto_pipeline(self):
+        with patch(
+            target="pyredis.client.AsyncClusterMap",
+            autospec=True
+        ) as mock_map_class:
+            mock_map = mock_map_class.return_value
+            mock_map.id = "mapid"
+            mock_map.hosts.return_value = ["host1_6379", "host2_6379"]
+            mock_map.get_slot.side_effect = [
+                "host1_6379", "host2_6379", "host2_6379"
+            ]
+
+            client = AsyncClusterClient(
+                seeds=[("127.0.0.1", 6379)],
+                auto_pipeline=True
+            )
+            conn1 = AsyncMock()
+            conn1.request_many.return_value = [ReplyError("MOVED 1 host2:6379")]
+            conn2 = AsyncMock()
+            conn2.request_many.side_effect = [[b"2"], [b"1"]]
+            client._conns["host1_6379"] = conn1
+            client._conns["host2_6379"] = conn2
+            async with client.pipeline() as pipe:
+                await pipe.get("a")
+                await pipe.get("b")
+            self.assertEqual(
+                first=pipe.result.values,
+                second=[b"1", b"2"]
+            )
+            conn2.request_many.assert_awaited_with([(b"GET", "a")])
+            mock_map.moved.assert_called_once_with(1, "host2_6379")
+            mock_map.update.assert_not_awaited()
+
+    async def test_async_cluster_map_update(self):
+        cluster_map = AsyncClusterMap(
+            seeds=[("127.0.0.1", 7000)]
+        )
+        cluster_map._fetch_map = AsyncMock()
+        cluster_map._fetch_map.return_value = [
+            [0, 8191, ["127.0.0.1", 7000], ["127.0.0.1", 7002]],
+            [8192, 16383, ["127.0.0.1", 7001]],
+        ]
+        map_id = await cluster_map.update(cluster_map.id)
+        self.assertEqual(
+            first=cluster_map.get_slot("a"),
+            second="127.0.0.1_7001"
+        )
+        self.assertEqual(
+            first=cluster_map.get_slot("b", slave=True),
+            second="127.0.0.1_7002"
+        )
+        self.assertEqual(
+            first=cluster_map.hosts(),
+            second={"127.0.0.1_7000", "127.0.0.1_7001"}
+        )
+        self.assertEqual(
+            first=await cluster_map.update("outdated"),
+            second=map_id
+        )
+
+    async def test_async_cluster_map_moved_refresh(self):
+        cluster_map = AsyncClusterMap(
+            seeds=[("127.0.0.1", 7000)],
+            refresh_delay=0.01
+        )
+        cluster_map._fetch_map = AsyncMock()
+        cluster_map._fetch_map.return_value = [
+            [0, 16383, ["127.0.0.1", 7001]],
+        ]
+        map_id = cluster_map.id
+        cluster_map.moved(15495, "127.0.0.1_7000")
+        cluster_map.moved(15495, "127.0.0.1_7000")
+        self.assertEqual(
+            first=cluster_map.get_slot("a"),
+            second="127.0.0.1_7000"
+        )
+        self.assertEqual(
+            first=cluster_map.id,
+            second=map_id
+        )
+        await cluster_map._refresh_task
+        cluster_map._fetch_map.assert_awaited_once_with()
+        self.assertNotEqual(
+            first=cluster_map.id,
+            second=map_id
+        )
+        self.assertEqual(
+            first=cluster_map.get_slot("a"),
+            second="127.0.0.1_7001"
+        )
+
     async def test_async_cluster_pool(self):
         with patch(
             target="pyredis.pool.AsyncClusterMap",
@@ -282,6 +1557,28 @@ class TestAsyncHashClient(IsolatedAsyncioTestCase):
             expr=mock_conn.write.called
         )
 
+    async def test_async_hash_client_cross_bucket(self):
+        client = AsyncHashClient(
+            buckets=[("127.0.0.1", 6379), ("127.0.0.1", 6380)]
+        )
+        buckets = [client._map[slot_from_key(key)] for key in ("a", "b")]
+        self.assertNotEqual(
+            first=buckets[0],
+            second=buckets[1]
+        )
+        for bucket, reply in zip(buckets, (2, 1)):
+            client._conns[bucket] = AsyncMock()
+            client._conns[bucket].read.return_value = reply
+
+        res = await client.delete("a", "b", "{a}1")
+        self.assertEqual(
+            first=res,
+            second=3
+        )
+        client._conns[buckets[0]].write.assert_awaited_once_with(
+            b"DEL", "a", "{a}1"
+        )
+
     async def test_async_hash_pool(self):
         pool = AsyncHashPool(
             buckets=[("127.0.0.1", 6379)]
@@ -300,6 +1597,46 @@ class TestAsyncHashClient(IsolatedAsyncioTestCase):
             second=b"OK"
         )
 
+    async def test_async_hash_client_pipeline(self):
+        client = AsyncHashClient(
+            buckets=[("127.0.0.1", 6379), ("127.0.0.1", 6380)]
+        )
+        for name in list(client._conns):
+            mock_conn = AsyncMock()
+            mock_conn.queue = Mock()
+            mock_conn.read_timeout = None
+            mock_conn.read_many.side_effect = (
+                lambda count, name=name: [name.encode()] * count
+            )
+            client._conns[name] = mock_conn
+        async with client.pipeline(bulk_size=4) as pipe:
+            for i in range(10):
+                await pipe.get(f"key{i}")
+        expected = [
+            client._map[slot_from_key(f"key{i}")].encode() for i in range(10)
+        ]
+        self.assertEqual(
+            first=pipe.result.values,
+            second=expected
+        )
+        self.assertFalse(
+            expr=client.bulk
+        )
+        with self.assertRaises(
+            expected_exception=PyRedisError
+        ):
+            async with client.pipeline(transaction=True):
+                pass
+        for mock_conn in client._conns.values():
+            mock_conn.reset_mock()
+        with self.assertRaises(
+            expected_exception=PyRedisError
+        ):
+            async with client.pipeline() as pipe:
+                await pipe.delete("a", "b")
+        for mock_conn in client._conns.values():
+            mock_conn.queue.assert_not_called()
+
 
 class TestAsyncPubSubClient(IsolatedAsyncioTestCase):
     async def test_async_pubsub_client(self):
@@ -466,3 +1803,48 @@ class TestGetByUrl(IsolatedAsyncioTestCase):
             )
 
 
+
+    def test_get_by_url_read_buffer(self):
+        pool = get_by_url(
+            url="redis://127.0.0.1:6379?read_buffer_size=4096&max_read_buffer=65536",
+            async_client=True
+        )
+        self.assertEqual(
+            first=pool.read_buffer_size,
+            second=4096
+        )
+        self.assertEqual(
+            first=pool.max_read_buffer,
+            second=65536
+        )
+
+    def test_get_by_url_socket_options(self):
+        pool = get_by_url(
+            url="redis://127.0.0.1:6379?socket_options=tcp_nodelay:false,keepalive_idle:60,user_timeout:2.5",
+            async_client=True
+        )
+        self.assertEqual(
+            first=pool.socket_options,
+            second={
+                "tcp_nodelay": False,
+                "keepalive_idle": 60,
+                "user_timeout": 2.5
+            }
+        )
+
+    def test_get_by_url_auto_pipeline(self):
+        pool = get_by_url(
+            url="redis://127.0.0.1:6379?auto_pipeline=true&pipeline_max_batch=64&pipeline_delay=0.001",
+            async_client=True
+        )
+        self.assertTrue(
+            expr=pool.auto_pipeline
+        )
+        self.assertEqual(
+            first=pool.pipeline_max_batch,
+            second=64
+        )
+        self.assertEqual(
+            first=pool.pipeline_delay,
+            second=0.001
+        )
@@ -32,7 +32,7 @@ class TestClientUnit(TestCase):
 
     def test__bulk_fetch(self):
         conn_mock = Mock()
-        conn_mock.read.return_value = b'PONG'
+        conn_mock.read_many.return_value = [b'PONG', b'PONG', b'PONG']
         self.connection_mock.return_value = conn_mock
 
         client = pyredis.client.Client(host='127.0.0.1')
@@ -41,12 +41,56 @@ class TestClientUnit(TestCase):
         client._bulk_size_current = 3
 
         client._bulk_fetch()
-        conn_mock.read.assert_has_calls([
-            call(raise_on_result_err=False),
-            call(raise_on_result_err=False),
-            call(raise_on_result_err=False)
-        ])
+        conn_mock.flush.assert_called_once_with()
+        conn_mock.read_many.assert_called_once_with(3)
+        conn_mock.read.assert_not_called()
         self.assertEqual(client._bulk_results, [b'PONG', b'PONG', b'PONG'])
+        self.assertEqual(client._bulk_size_current, 0)
+
+    @patch('pyredis.helper.time.monotonic', Mock(return_value=100.0))
+    def test_execute_timeout(self):
+        conn_mock = MagicMock()
+        conn_mock.read.return_value = b'PONG'
+        conn_mock.read_timeout = 2
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        self.assertEqual(client.execute('PING', timeout=5), b'PONG')
+        conn_mock.deadline.assert_called_once_with(105.0)
+        conn_mock.deadline.return_value.__enter__.assert_called_once_with()
+
+    def test_execute_no_deadline(self):
+        conn_mock = Mock()
+        conn_mock.read.return_value = b'PONG'
+        conn_mock.read_timeout = 2
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        self.assertEqual(client.execute('PING'), b'PONG')
+        conn_mock.deadline.assert_not_called()
+
+    @patch('pyredis.helper.time.monotonic', Mock(return_value=100.0))
+    def test_blpop_extends_deadline(self):
+        conn_mock = MagicMock()
+        conn_mock.read_timeout = 2
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        client.blpop('queue', 30)
+        conn_mock.write.assert_called_once_with(b'BLPOP', 'queue', 30)
+        conn_mock.deadline.assert_called_once_with(132.0)
+
+    def test_blpop_no_args(self):
+        conn_mock = Mock()
+        conn_mock.read.side_effect = ReplyError(
+            "ERR wrong number of arguments for 'blpop' command"
+        )
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        self.assertRaises(ReplyError, client.blpop)
+        conn_mock.write.assert_called_once_with(b'BLPOP')
+        conn_mock.deadline.assert_not_called()
 
     def test__execute_basic(self):
         conn_mock = Mock()
@@ -66,12 +110,14 @@ class TestClientUnit(TestCase):
         client = pyredis.client.Client(host='127.0.0.1')
         client.bulk_start()
         result = client._execute_bulk('Ping')
-        conn_mock.write.assert_called_with('Ping')
+        conn_mock.queue.assert_called_with('Ping')
+        conn_mock.write.assert_not_called()
+        conn_mock.flush.assert_not_called()
         self.assertIsNone(result)
 
     def test__execute_bulk_bulk_size_reached(self):
         conn_mock = Mock()
-        conn_mock.read.return_value = b'PONG'
+        conn_mock.read_many.return_value = [b'PONG', b'PONG', b'PONG']
         self.connection_mock.return_value = conn_mock
 
         client = pyredis.client.Client(host='127.0.0.1')
@@ -88,6 +134,8 @@ class TestClientUnit(TestCase):
         self.assertIsNone(result)
         self.assertEqual(client._bulk_size_current, 0)
         self.assertEqual(client._bulk_results, [b'PONG', b'PONG', b'PONG'])
+        self.assertEqual(conn_mock.queue.call_count, 3)
+        conn_mock.flush.assert_called_once_with()
 
     def test_execute_non_bulk(self):
         client = pyredis.client.Client(host='127.0.0.1')
@@ -120,6 +168,31 @@ class TestClientUnit(TestCase):
         self.assertIsNone(client._bulk_results)
         self.assertFalse(client._bulk_keep)
 
+    def test_bulk_count_errors(self):
+        conn_mock = Mock()
+        conn_mock.skip_many.side_effect = [1, 0]
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        client.bulk_start(bulk_size=2, keep_results=False, count_errors=True)
+        for _ in range(3):
+            client.incr('key')
+        self.assertEqual(client.bulk_stop(), 1)
+        conn_mock.skip_many.assert_has_calls([call(2), call(1)])
+        conn_mock.read_many.assert_not_called()
+        self.assertIsNone(client._bulk_errors)
+
+    def test_bulk_no_keep_results_skips(self):
+        conn_mock = Mock()
+        conn_mock.skip_many.return_value = 1
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        client.bulk_start(keep_results=False)
+        client.incr('key')
+        self.assertIsNone(client.bulk_stop())
+        conn_mock.skip_many.assert_called_once_with(1)
+
     def test_bulk_start_bulk_size_42(self):
         client = pyredis.client.Client(host='127.0.0.1')
         client.bulk_start(bulk_size=42)
@@ -150,6 +223,172 @@ class TestClientUnit(TestCase):
         client = pyredis.client.Client(host='127.0.0.1')
         self.assertRaises(PyRedisError, client.bulk_stop)
 
+    def test_bulk_window(self):
+        conn_mock = Mock()
+        conn_mock.read_ready.side_effect = [[], [b'1'], []]
+        conn_mock.read_many.side_effect = [[b'2'], [b'3', b'4', b'5', b'6', b'7']]
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        client.bulk_start(bulk_size=2, window=4)
+        for _ in range(2):
+            client._execute_bulk('INCR', 'key')
+        conn_mock.flush.assert_called_once_with()
+        conn_mock.read_ready.assert_called_with(2)
+        conn_mock.read_many.assert_not_called()
+        for _ in range(2):
+            client._execute_bulk('INCR', 'key')
+        conn_mock.read_ready.assert_called_with(4)
+        self.assertEqual(client._bulk_outstanding, 3)
+        for _ in range(2):
+            client._execute_bulk('INCR', 'key')
+        conn_mock.read_ready.assert_called_with(5)
+        conn_mock.read_many.assert_called_once_with(1)
+        self.assertEqual(client._bulk_outstanding, 4)
+        client._execute_bulk('INCR', 'key')
+        self.assertEqual(conn_mock.flush.call_count, 3)
+        self.assertEqual(
+            client.bulk_stop(),
+            [b'1', b'2', b'3', b'4', b'5', b'6', b'7']
+        )
+        conn_mock.read_many.assert_called_with(5)
+        self.assertEqual(conn_mock.flush.call_count, 4)
+
+    def test_bulk_window_smaller_than_bulk_size(self):
+        client = pyredis.client.Client(host='127.0.0.1')
+        self.assertRaises(PyRedisError, client.bulk_start, bulk_size=10, window=5)
+
+    def test_pipeline(self):
+        conn_mock = Mock()
+        conn_mock.read_many.return_value = [b'OK', ReplyError('WRONGTYPE'), b'value']
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with client.pipeline() as pipe:
+            self.assertEqual(pipe.set('key', 'value'), 0)
+            self.assertEqual(pipe.lpush('key', 'value'), 1)
+            self.assertEqual(pipe.get('key'), 2)
+        conn_mock.queue.assert_has_calls([
+            call(b'SET', 'key', 'value'),
+            call(b'LPUSH', 'key', 'value'),
+            call(b'GET', 'key'),
+        ])
+        conn_mock.flush.assert_called_once_with()
+        conn_mock.read_many.assert_called_once_with(3)
+        self.assertEqual(pipe.result.get(0), b'OK')
+        self.assertRaises(ReplyError, pipe.result.get, 1)
+        self.assertEqual(pipe.result[2], b'value')
+        self.assertEqual([i for i, _ in pipe.result.errors], [1])
+        self.assertFalse(pipe.result.ok)
+        self.assertFalse(client.bulk)
+        self.assertRaises(PyRedisError, pipe.get, 'key')
+
+    def test_pipeline_bulk_size(self):
+        conn_mock = Mock()
+        conn_mock.read_many.side_effect = [[b'1', b'2'], [b'3']]
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with client.pipeline(bulk_size=2) as pipe:
+            for _ in range(3):
+                pipe.incr('key')
+        self.assertEqual(conn_mock.flush.call_count, 2)
+        self.assertEqual(list(pipe.result), [b'1', b'2', b'3'])
+
+    def test_pipeline_transaction(self):
+        conn_mock = Mock()
+        conn_mock.read_many.return_value = [b'OK', b'QUEUED', b'QUEUED', [b'OK', 1]]
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with client.pipeline(transaction=True) as pipe:
+            pipe.set('key', 'value')
+            pipe.exists('key')
+        conn_mock.queue.assert_has_calls([
+            call('MULTI'),
+            call(b'SET', 'key', 'value'),
+            call(b'EXISTS', 'key'),
+            call('EXEC'),
+        ])
+        conn_mock.read_many.assert_called_once_with(4)
+        self.assertEqual(pipe.result.values, [b'OK', 1])
+        self.assertTrue(pipe.result.ok)
+
+    def test_pipeline_transaction_execabort(self):
+        conn_mock = Mock()
+        conn_mock.read_many.return_value = [
+            b'OK', b'QUEUED', ReplyError('ERR syntax'), ReplyError('EXECABORT')
+        ]
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with client.pipeline(transaction=True) as pipe:
+            pipe.set('key', 'value')
+            pipe.execute(b'SET')
+        self.assertEqual(str(pipe.result[0]), 'EXECABORT')
+        self.assertEqual(str(pipe.result[1]), 'ERR syntax')
+
+    def test_pipeline_error_discards_transaction(self):
+        conn_mock = Mock()
+        conn_mock.read_many.return_value = [b'OK', b'QUEUED', b'OK']
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with self.assertRaises(ValueError):
+            with client.pipeline(transaction=True) as pipe:
+                pipe.set('key', 'value')
+                raise ValueError()
+        conn_mock.queue.assert_called_with('DISCARD')
+        conn_mock.read_many.assert_called_once_with(3)
+        self.assertFalse(client.bulk)
+        self.assertRaises(PyRedisError, lambda: pipe.result)
+
+    def test_noreply(self):
+        conn_mock = Mock()
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with client.noreply(bulk_size=2) as noreply:
+            self.assertIs(noreply, client)
+            for _ in range(3):
+                self.assertIsNone(client.incr('key'))
+            self.assertRaises(PyRedisError, client.bulk_stop)
+        conn_mock.queue.assert_has_calls([
+            call('CLIENT', 'REPLY', 'OFF'),
+            call(b'INCR', 'key'),
+            call(b'INCR', 'key'),
+            call(b'INCR', 'key'),
+            call('CLIENT', 'REPLY', 'ON'),
+        ])
+        self.assertEqual(conn_mock.flush.call_count, 1)
+        conn_mock.sync.assert_called_once_with()
+        conn_mock.read_many.assert_not_called()
+        self.assertFalse(client.bulk)
+
+    def test_noreply_error(self):
+        conn_mock = Mock()
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with self.assertRaises(ValueError):
+            with client.noreply():
+                raise ValueError()
+        conn_mock.queue.assert_called_with('CLIENT', 'REPLY', 'ON')
+        conn_mock.sync.assert_called_once_with()
+        self.assertFalse(client.bulk)
+
+    def test_noreply_sync_error_closes(self):
+        conn_mock = Mock()
+        conn_mock.sync.side_effect = PyRedisConnReadTimeout()
+        self.connection_mock.return_value = conn_mock
+
+        client = pyredis.client.Client(host='127.0.0.1')
+        with self.assertRaises(PyRedisConnReadTimeout):
+            with client.noreply():
+                client.set('key', 'value')
+        conn_mock.close.assert_called_once_with()
+        self.assertFalse(client.bulk)
+
     def test_closed(self):
         client = pyredis.client.Client(host='127.0.0.1')
         self.assertEqual(client.closed, client._conn.closed)
@@ -169,6 +408,51 @@ class TestClientUnit(TestCase):
         client.execute(b'PING')
         client._execute_bulk.assert_called_with(b'PING')
 
+    def test_execute_stream(self):
+        client = pyredis.client.Client(host='127.0.0.1')
+        client._conn.read_iter.return_value = iter([b'a', b'b'])
+        result = client.execute(b'LRANGE', b'list', 0, -1, stream=True)
+        client._conn.write.assert_called_with(b'LRANGE', b'list', 0, -1)
+        self.assertEqual(list(result), [b'a', b'b'])
+
+    def test_execute_stream_timeout(self):
+        client = pyredis.client.Client(host='127.0.0.1')
+        client._conn.read_timeout = None
+        self.assertRaises(
+            PyRedisError, client.execute, b'KEYS', b'*', stream=True, timeout=5
+        )
+        self.assertRaises(
+            PyRedisError, client.execute, b'KEYS', b'*', stream=True, block=1
+        )
+        client._conn.write.assert_not_called()
+
+    def test_execute_stream_bulk(self):
+        client = pyredis.client.Client(host='127.0.0.1')
+        client._bulk = True
+        self.assertRaises(PyRedisError, client.execute, b'KEYS', b'*', stream=True)
+
+    def test_get_into(self):
+        client = pyredis.client.Client(host='127.0.0.1')
+        client._conn.read_into.return_value = 5
+        target = bytearray(5)
+        self.assertEqual(client.get_into('key', target), 5)
+        client._conn.write.assert_called_with(b'GET', 'key')
+        client._conn.read_into.assert_called_with(target)
+
+    def test_get_into_bulk(self):
+        client = pyredis.client.Client(host='127.0.0.1')
+        client._bulk = True
+        self.assertRaises(PyRedisError, client.get_into, 'key', bytearray(5))
+
+    def test_set_from(self):
+        client = pyredis.client.Client(host='127.0.0.1')
+        client._conn.read.return_value = b'OK'
+        source = bytearray(b'value')
+        self.assertEqual(client.set_from('key', source, 'EX', 10), b'OK')
+        client._conn.write_stream.assert_called_with(
+            (b'SET', 'key'), source, tail=('EX', 10), length=None
+        )
+
     def test_geo_commands(self):
         client = pyredis.client.Client(host='127.0.0.1')
         client.execute = Mock(return_value=b'OK')
@@ -229,7 +513,10 @@ class TestHashClientUnit(TestCase):
                 encoding=None,
                 password=None,
                 read_timeout=2,
-                username=None
+                username=None,
+                read_buffer_size=16384,
+                max_read_buffer=1048576,
+                socket_options=None
             ),
             call(
                 host='localhost',
@@ -239,7 +526,10 @@ class TestHashClientUnit(TestCase):
                 encoding=None,
                 password=None,
                 read_timeout=2,
-                username=None
+                username=None,
+                read_buffer_size=16384,
+                max_read_buffer=1048576,
+                socket_options=None
             ),
             call(
                 host='localhost',
@@ -249,7 +539,10 @@ class TestHashClientUnit(TestCase):
                 encoding=None,
                 password=None,
                 read_timeout=2,
-                username=None
+                username=None,
+                read_buffer_size=16384,
+                max_read_buffer=1048576,
+                socket_options=None
             ),
         ])
         self.assertEqual(client._map[0], 'localhost_7001')
@@ -261,32 +554,30 @@ class TestHashClientUnit(TestCase):
 
     def test__bulk_fetch(self):
         conn_mock_1 = Mock()
-        conn_mock_1.read.return_value = b'PONG1'
+        conn_mock_1.read_many.return_value = [b'PONG1', b'PONG1']
         conn_mock_2 = Mock()
-        conn_mock_2.read.return_value = b'PONG2'
+        conn_mock_2.read_many.return_value = [b'PONG2']
         conn_mock_3 = Mock()
-        conn_mock_3.read.return_value = b'PONG3'
+        conn_mock_3.read_many.return_value = [b'PONG3']
         self.connection_mock.side_effect = [conn_mock_1, conn_mock_2, conn_mock_3]
 
         client = pyredis.client.HashClient(buckets=self.buckets)
         client._bulk_keep = True
         client._bulk_results = []
-        client._bulk_size_current = 3
+        client._bulk_size_current = 4
         client._bulk_bucket_order.append(conn_mock_1)
         client._bulk_bucket_order.append(conn_mock_2)
         client._bulk_bucket_order.append(conn_mock_3)
 
+        client._bulk_bucket_order.append(conn_mock_1)
+
         client._bulk_fetch()
-        conn_mock_1.read.assert_has_calls([
-            call(raise_on_result_err=False),
-        ])
-        conn_mock_2.read.assert_has_calls([
-            call(raise_on_result_err=False),
-        ])
-        conn_mock_3.read.assert_has_calls([
-            call(raise_on_result_err=False),
-        ])
-        self.assertEqual(client._bulk_results, [b'PONG1', b'PONG2', b'PONG3'])
+        conn_mock_1.flush.assert_called_once_with()
+        conn_mock_2.flush.assert_called_once_with()
+        conn_mock_1.read_many.assert_called_once_with(2)
+        conn_mock_2.read_many.assert_called_once_with(1)
+        conn_mock_3.read_many.assert_called_once_with(1)
+        self.assertEqual(client._bulk_results, [b'PONG1', b'PONG2', b'PONG3', b'PONG1'])
         self.assertEqual(client._bulk_size_current, 0)
         self.assertEqual(client._bulk_bucket_order, [])
 
@@ -315,16 +606,18 @@ class TestHashClientUnit(TestCase):
         client = pyredis.client.HashClient(buckets=self.buckets)
         client.bulk_start()
         result = client._execute_bulk('Ping', conn=conn_mock_1)
-        conn_mock_1.write.assert_called_with('Ping')
+        conn_mock_1.queue.assert_called_with('Ping')
+        conn_mock_1.write.assert_not_called()
+        conn_mock_1.flush.assert_not_called()
         self.assertIsNone(result)
 
     def test__execute_bulk_bulk_size_reached(self):
         conn_mock_1 = Mock()
-        conn_mock_1.read.return_value = b'PONG1'
+        conn_mock_1.read_many.return_value = [b'PONG1']
         conn_mock_2 = Mock()
-        conn_mock_2.read.return_value = b'PONG2'
+        conn_mock_2.read_many.return_value = [b'PONG2']
         conn_mock_3 = Mock()
-        conn_mock_3.read.return_value = b'PONG3'
+        conn_mock_3.read_many.return_value = [b'PONG3']
         self.connection_mock.side_effect = [conn_mock_1, conn_mock_2, conn_mock_3]
 
         client = pyredis.client.HashClient(buckets=self.buckets)
@@ -443,6 +736,117 @@ class TestHashClientUnit(TestCase):
         client = pyredis.client.HashClient(buckets=self.buckets)
         self.assertRaises(PyRedisError, client.bulk_stop)
 
+    def test_pipeline(self):
+        conn_mocks = [Mock(), Mock(), Mock()]
+        for conn_mock in conn_mocks:
+            conn_mock.read_timeout = None
+            conn_mock.read_many.side_effect = lambda count: [b'OK'] * count
+        self.connection_mock.side_effect = conn_mocks
+
+        client = pyredis.client.HashClient(buckets=self.buckets)
+        with client.pipeline() as pipe:
+            for i in range(10):
+                pipe.set(f'key{i}', 'value')
+        self.assertEqual(list(pipe.result), [b'OK'] * 10)
+        self.assertEqual(
+            sum(conn_mock.queue.call_count for conn_mock in conn_mocks), 10
+        )
+        self.assertFalse(client.bulk)
+
+    def test_pipeline_cross_bucket(self):
+        conn_mocks = [Mock(), Mock(), Mock()]
+        for conn_mock in conn_mocks:
+            conn_mock.read_timeout = None
+        self.connection_mock.side_effect = conn_mocks
+
+        client = pyredis.client.HashClient(buckets=self.buckets)
+        with self.assertRaises(PyRedisError):
+            with client.pipeline() as pipe:
+                pipe.mget('key1', 'key3')
+        for conn_mock in conn_mocks:
+            conn_mock.queue.assert_not_called()
+        self.assertFalse(client.bulk)
+
+    def test_pipeline_transaction(self):
+        conn_mock_1 = Mock()
+        conn_mock_2 = Mock()
+        conn_mock_3 = Mock()
+        self.connection_mock.side_effect = [conn_mock_1, conn_mock_2, conn_mock_3]
+
+        client = pyredis.client.HashClient(buckets=self.buckets)
+        with self.assertRaises(PyRedisError):
+            with client.pipeline(transaction=True):
+                pass
+        self.assertFalse(client.bulk)
+
+    def test_bulk_count_errors(self):
+        conn_mocks = [Mock(), Mock(), Mock()]
+        for conn_mock in conn_mocks:
+            conn_mock.read_timeout = None
+            conn_mock.skip_many.side_effect = lambda count: count
+        self.connection_mock.side_effect = conn_mocks
+
+        client = pyredis.client.HashClient(buckets=self.buckets)
+        client.bulk_start(keep_results=False, count_errors=True)
+        for i in range(10):
+            client.set(f'key{i}', 'value')
+        self.assertEqual(client.bulk_stop(), 10)
+        for conn_mock in conn_mocks:
+            conn_mock.read_many.assert_not_called()
+
+    def test_execute_cross_bucket(self):
+        conn_mock_1 = Mock()
+        conn_mock_1.read.return_value = [b'1', b'2']
+        conn_mock_2 = Mock()
+        conn_mock_3 = Mock()
+        conn_mock_3.read.return_value = [b'3']
+        self.connection_mock.side_effect = [conn_mock_1, conn_mock_2, conn_mock_3]
+
+        client = pyredis.client.HashClient(buckets=self.buckets)
+        self.assertEqual(
+            client.mget('key1', 'key3', 'key2'),
+            [b'1', b'3', b'2']
+        )
+        conn_mock_1.write.assert_called_once_with(b'MGET', 'key1', 'key2')
+        conn_mock_3.write.assert_called_once_with(b'MGET', 'key3')
+        conn_mock_1.read.assert_called_once_with(raise_on_result_err=False)
+
+    def test_execute_cross_bucket_error(self):
+        conn_mock_1 = Mock()
+        conn_mock_1.read.return_value = ReplyError('WRONGTYPE')
+        conn_mock_2 = Mock()
+        conn_mock_3 = Mock()
+        conn_mock_3.read.return_value = 1
+        self.connection_mock.side_effect = [conn_mock_1, conn_mock_2, conn_mock_3]
+
+        client = pyredis.client.HashClient(buckets=self.buckets)
+        self.assertRaises(ReplyError, client.exists, 'key1', 'key3')
+        conn_mock_3.read.assert_called_once_with(raise_on_result_err=False)
+
+    def test_noreply(self):
+        conn_mocks = [Mock(), Mock(), Mock()]
+        for conn_mock in conn_mocks:
+            conn_mock.read_timeout = None
+        self.connection_mock.side_effect = conn_mocks
+
+        client = pyredis.client.HashClient(buckets=self.buckets)
+        with client.noreply(bulk_size=4):
+            for i in range(10):
+                client.set(f'key{i}', 'value')
+        for conn_mock in conn_mocks:
+            self.assertEqual(
+                conn_mock.queue.call_args_list[0], call('CLIENT', 'REPLY', 'OFF')
+            )
+            self.assertEqual(
+                conn_mock.queue.call_args_list[-1], call('CLIENT', 'REPLY', 'ON')
+            )
+            conn_mock.sync.assert_called_once_with()
+            conn_mock.read_many.assert_not_called()
+        self.assertEqual(
+            sum(conn_mock.queue.call_count for conn_mock in conn_mocks), 16
+        )
+        self.assertFalse(client.bulk)
+
     def test_close(self):
         conn_mock_1 = Mock()
         conn_mock_2 = Mock()
@@ -535,7 +939,8 @@ class TestSentinelClientUnit(TestCase):
 
         self.assertTrue(client._sentinel_connect(sentinel=('host1', 12345)))
         self.connection_mock.assert_called_with(
-            host='host1', port=12345, conn_timeout=0.1, sentinel=True, password='blubber', username=None)
+            host='host1', port=12345, conn_timeout=0.1, sentinel=True, password='blubber', username=None,
+            socket_options=None)
         client.execute.assert_called_with('PING')
         self.assertEqual(client._conn, conn_mock)
 
@@ -550,7 +955,8 @@ class TestSentinelClientUnit(TestCase):
 
         self.assertFalse(client._sentinel_connect(sentinel=('host1', 12345)))
         self.connection_mock.assert_called_with(
-            host='host1', port=12345, conn_timeout=0.1, sentinel=True, password=None, username=None)
+            host='host1', port=12345, conn_timeout=0.1, sentinel=True, password=None, username=None,
+            socket_options=None)
         client.execute.assert_called_with('PING')
         client.close.assert_called_with()
 
@@ -734,6 +1140,123 @@ class TestClusterClientUnit(TestCase):
         self.clustermap_mock.assert_called_with(seeds=self.seeds)
         self.assertEqual(self.client._map_id, self.clustermap_inst.id)
 
+    def test_pipeline(self):
+        conn1_12345 = Mock()
+        conn1_12345.read_many.return_value = [b'OK', b'1']
+        conn2_12345 = Mock()
+        conn2_12345.read_many.return_value = [b'2']
+        self.client._conns['conn1_12345'] = conn1_12345
+        self.client._conns['conn2_12345'] = conn2_12345
+        self.clustermap_inst.get_slot.side_effect = lambda shard_key, slave: {
+            'a': 'conn1_12345', 'b': 'conn2_12345'
+        }[shard_key]
+        with self.client.pipeline() as pipe:
+            pipe.set('a', 'value')
+            pipe.get('b')
+            pipe.get('a')
+        conn1_12345.queue.assert_has_calls([
+            call(b'SET', 'a', 'value'),
+            call(b'GET', 'a'),
+        ])
+        conn2_12345.queue.assert_called_once_with(b'GET', 'b')
+        conn1_12345.flush.assert_called_once_with()
+        conn1_12345.read_many.assert_called_once_with(2)
+        conn2_12345.read_many.assert_called_once_with(1)
+        self.assertEqual(pipe.result.values, [b'OK', b'2', b'1'])
+        self.clustermap_inst.update.assert_not_called()
+
+    def test_pipeline_moved(self):
+        conn1_12345 = Mock()
+        conn1_12345.read_many.return_value = [b'1', ReplyError('MOVED 1234 conn2:12345')]
+        conn2_12345 = Mock()
+        conn2_12345.read_many.return_value = [b'2']
+        self.client._conns['conn1_12345'] = conn1_12345
+        self.client._conns['conn2_12345'] = conn2_12345
+        self.clustermap_inst.hosts.return_value = ['conn1_12345', 'conn2_12345']
+        self.clustermap_inst.get_slot.side_effect = [
+            'conn1_12345', 'conn1_12345', 'conn2_12345'
+        ]
+        with self.client.pipeline() as pipe:
+            pipe.get('a')
+            pipe.get('b')
+        self.clustermap_inst.moved.assert_called_once_with(1234, 'conn2_12345')
+        self.clustermap_inst.update.assert_not_called()
+        conn2_12345.queue.assert_called_once_with(b'GET', 'b')
+        self.assertEqual(pipe.result.values, [b'1', b'2'])
+
+    def test_pipeline_ask(self):
+        conn1_12345 = Mock()
+        conn1_12345.read_many.return_value = [ReplyError('ASK 1234 conn2:12345')]
+        conn2_12345 = Mock()
+        conn2_12345.read_many.return_value = [b'OK', b'2']
+        self.client._conns['conn1_12345'] = conn1_12345
+        self.client._conns['conn2_12345'] = conn2_12345
+        self.clustermap_inst.get_slot.return_value = 'conn1_12345'
+        with self.client.pipeline() as pipe:
+            pipe.get('a')
+        conn2_12345.queue.assert_has_calls([call('ASKING'), call(b'GET', 'a')])
+        conn2_12345.read_many.assert_called_once_with(2)
+        self.clustermap_inst.update.assert_not_called()
+        self.assertEqual(pipe.result.values, [b'2'])
+
+    def test_pipeline_moved_too_often(self):
+        conn1_12345 = Mock()
+        conn1_12345.read_many.return_value = [ReplyError('MOVED 1234 conn1:12345')]
+        self.client._conns['conn1_12345'] = conn1_12345
+        self.clustermap_inst.hosts.return_value = ['conn1_12345']
+        self.clustermap_inst.get_slot.return_value = 'conn1_12345'
+        with self.client.pipeline() as pipe:
+            pipe.get('a')
+        self.assertEqual(conn1_12345.read_many.call_count, 3)
+        self.assertIsInstance(pipe.result[0], PyRedisError)
+
+    def test_pipeline_conn_error_closes_unread(self):
+        conn1_12345 = Mock()
+        conn1_12345.read_many.side_effect = PyRedisConnReadTimeout()
+        conn2_12345 = Mock()
+        self.client._conns['conn1_12345'] = conn1_12345
+        self.client._conns['conn2_12345'] = conn2_12345
+        self.clustermap_inst.get_slot.side_effect = ['conn1_12345', 'conn2_12345']
+        with self.assertRaises(PyRedisConnReadTimeout):
+            with self.client.pipeline() as pipe:
+                pipe.get('a')
+                pipe.get('b')
+        conn1_12345.close.assert_called_once_with()
+        conn2_12345.close.assert_called_once_with()
+        self.assertEqual(self.client._conns, {})
+        self.clustermap_inst.refresh.assert_called_once_with()
+
+    def test_execute_cross_slot(self):
+        conn1_12345 = Mock()
+        conn1_12345.read_many.return_value = [[b'1', b'3'], [b'2']]
+        self.client._conns['conn1_12345'] = conn1_12345
+        self.clustermap_inst.get_slot.return_value = 'conn1_12345'
+        self.assertEqual(
+            self.client.mget('a', 'b', '{a}x'),
+            [b'1', b'2', b'3']
+        )
+        conn1_12345.queue.assert_has_calls([
+            call(b'MGET', 'a', '{a}x'),
+            call(b'MGET', 'b'),
+        ])
+        conn1_12345.read_many.assert_called_once_with(2)
+        conn1_12345.write.assert_not_called()
+
+    def test_execute_cross_slot_count(self):
+        conn1_12345 = Mock()
+        conn1_12345.read_many.return_value = [1]
+        conn2_12345 = Mock()
+        conn2_12345.read_many.return_value = [0]
+        self.client._conns['conn1_12345'] = conn1_12345
+        self.client._conns['conn2_12345'] = conn2_12345
+        self.clustermap_inst.get_slot.side_effect = ['conn1_12345', 'conn2_12345']
+        self.assertEqual(self.client.delete('a', 'b'), 1)
+
+    def test_pipeline_transaction(self):
+        with self.assertRaises(PyRedisError):
+            with self.client.pipeline(transaction=True):
+                pass
+
     def test___init__map(self):
         map = Mock()
         client = pyredis.client.ClusterClient(cluster_map=map)
@@ -785,7 +1308,10 @@ class TestClusterClientUnit(TestCase):
             encoding=self.client._encoding,
             password=self.client._password,
             database=self.client._database,
-            username=self.client._username
+            username=self.client._username,
+            read_buffer_size=self.client._read_buffer_size,
+            max_read_buffer=self.client._max_read_buffer,
+            socket_options=self.client._socket_options
         )
 
     def test__get_slot_info(self):
@@ -877,16 +1403,12 @@ class TestClusterClientUnit(TestCase):
         conn2.read.side_effect = ['success']
         self.connection_mock.side_effect = [conn1, conn2]
 
-        self.client._cleanup_conns = Mock()
-
-        id = self.client._map_id
-
         result = self.client.execute('GET', 'test', shard_key='test')
         self.assertEqual(result, 'success')
         conn1.write.assert_called_with('GET', 'test')
         conn2.write.assert_called_with('GET', 'test')
-        self.assertTrue(self.client._cleanup_conns.called)
-        self.clustermap_inst.update.assert_called_with(id)
+        self.clustermap_inst.moved.assert_called_once_with(42, 'host2_12345')
+        self.clustermap_inst.update.assert_not_called()
 
     def test_execute_ReplyError_to_many_retries(self):
         self.client._get_slot_info = Mock()
@@ -925,7 +1447,7 @@ class TestClusterClientUnit(TestCase):
         self.assertRaises(PyRedisConnError, self.client.execute, 'GET', 'test', shard_key='test')
         self.assertTrue(conn1.close.called)
         self.assertNotIn(conn1, self.client._conns)
-        self.clustermap_inst.update.assert_called_with(self.client._map_id)
+        self.clustermap_inst.refresh.assert_called_once_with()
 
     def test_execute_PyRedisConnReadTimeout(self):
         self.client._get_slot_info = Mock()
@@ -937,7 +1459,7 @@ class TestClusterClientUnit(TestCase):
         self.assertRaises(PyRedisConnReadTimeout, self.client.execute, 'GET', 'test', shard_key='test')
         self.assertTrue(conn1.close.called)
         self.assertNotIn(conn1, self.client._conns)
-        self.clustermap_inst.update.assert_called_with(self.client._map_id)
+        self.clustermap_inst.refresh.assert_called_once_with()
 
     def test_geo_commands(self):
         self.client.execute = Mock(return_value=b'OK')
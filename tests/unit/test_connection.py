@@ -3,11 +3,28 @@ from unittest.mock import Mock, MagicMock, PropertyMock, call, patch
 
 from pyredis.exceptions import *
 
+import pyredis.client
 import pyredis.connection
 from pyredis.protocol import writer, Reader
 import socket
 
 
+def recv_chunks(chunks):
+    chunks = list(chunks)
+
+    def recv_into(view):
+        chunk = chunks.pop(0)
+        if isinstance(chunk, type) and issubclass(chunk, BaseException):
+            raise chunk
+        if len(chunk) > len(view):
+            chunks.insert(0, chunk[len(view):])
+            chunk = chunk[:len(view)]
+        view[:len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
 class TestConnectionUnit(TestCase):
     def setUp(self):
         self.addCleanup(patch.stopall)
@@ -70,32 +87,111 @@ class TestConnectionUnit(TestCase):
             unix_sock='/tmp/test.sock'
         )
 
-    def test__authenticate_ok(self):
+    def test__handshake_commands_auth(self):
         connection = pyredis.connection.Connection(host='127.0.0.1', password='testpass')
-        connection.write = Mock()
-        connection.read = Mock()
-        connection.read.return_value = b'OK'
-        connection._sock = Mock()
-        connection._authenticate()
-        connection.write.assert_called_with('AUTH', 'testpass')
+        self.assertEqual(connection._handshake_commands(), [['AUTH', 'testpass']])
 
-    def test__authenticate_acl_ok(self):
+    def test__handshake_commands_auth_acl(self):
         connection = pyredis.connection.Connection(host='127.0.0.1', password='testpass', username='username')
-        connection.write = Mock()
-        connection.read = Mock()
-        connection.read.return_value = b'OK'
+        self.assertEqual(
+            connection._handshake_commands(),
+            [['AUTH', 'username', 'testpass']]
+        )
+
+    def test__handshake_commands_hello_3(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1', protocol=3)
+        self.assertEqual(connection._handshake_commands(), [['HELLO', 3]])
+
+    def test__handshake_commands_hello_3_password(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1', protocol=3, password='testpass')
+        self.assertEqual(
+            connection._handshake_commands(),
+            [['HELLO', 3, 'AUTH', 'default', 'testpass']]
+        )
+
+    def test__handshake_commands_hello_3_acl(self):
+        connection = pyredis.connection.Connection(
+            host='127.0.0.1', protocol=3, password='testpass', username='username'
+        )
+        self.assertEqual(
+            connection._handshake_commands(),
+            [['HELLO', 3, 'AUTH', 'username', 'testpass']]
+        )
+
+    def test__handshake_commands_hello_3_client_name(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1', protocol=3, client_name='worker')
+        self.assertEqual(
+            connection._handshake_commands(),
+            [['HELLO', 3, 'SETNAME', 'worker']]
+        )
+
+    def test__handshake_commands_all(self):
+        connection = pyredis.connection.Connection(
+            host='127.0.0.1', password='testpass', database=0, read_only=True, client_name='worker'
+        )
+        self.assertEqual(
+            connection._handshake_commands(),
+            [
+                ['AUTH', 'testpass'],
+                ['CLIENT', 'SETNAME', 'worker'],
+                ['SELECT', 0],
+                ['READONLY'],
+            ]
+        )
+
+    def test__handshake_commands_none(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        self.assertEqual(connection._handshake_commands(), [])
+
+    def test__handshake_commands_sentinel(self):
+        connection = pyredis.connection.Connection(
+            host='127.0.0.1', password='testpass', database=0, read_only=True, sentinel=True
+        )
+        self.assertEqual(connection._handshake_commands(), [['AUTH', 'testpass']])
+
+    def test__handshake_single_round_trip(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1', password='testpass', database=0)
         connection._sock = Mock()
-        connection._authenticate()
-        connection.write.assert_called_with('AUTH', 'username', 'testpass')
+        connection._sock.recv_into.side_effect = recv_chunks([b'+OK\r\n+OK\r\n'])
+        connection._reader = Reader()
+        sent = []
+        connection._sock.sendall.side_effect = lambda data: sent.append(bytes(data))
+        connection._handshake()
+        self.assertEqual(sent, [writer('AUTH', 'testpass') + writer('SELECT', 0)])
+        self.assertEqual(connection._sock.recv_into.call_count, 1)
+
+    def test__handshake_before_queued_commands(self):
+        self.reader_mock.side_effect = lambda **kwargs: Reader(**kwargs)
+        sock = self.socket_mock.socket.return_value
+        sock.recv_into.side_effect = recv_chunks([b'+OK\r\n+OK\r\n', b'+OK\r\n'])
+        sent = []
+        sock.sendall.side_effect = lambda data: sent.append(bytes(data))
+        connection = pyredis.connection.Connection(
+            host='127.0.0.1', password='testpass', database=3
+        )
+        connection.queue('SET', 'a', '1')
+        connection.flush()
+        self.assertEqual(sent, [
+            writer('AUTH', 'testpass') + writer('SELECT', 3),
+            writer('SET', 'a', '1'),
+        ])
+        self.assertEqual(connection.read_many(1), [b'OK'])
+
+    def test__handshake_noop(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._sock = Mock()
+        connection._handshake()
+        connection._sock.sendall.assert_not_called()
 
-    def test__authenticate_exception(self):
-        connection = pyredis.connection.Connection(host='127.0.0.1', password='testpass')
-        connection.write = Mock()
-        connection.read = Mock()
-        connection.read.side_effect = ReplyError
+    def test__handshake_exception(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1', password='testpass', database=23234)
         connection._sock = Mock()
-        self.assertRaises(ReplyError, connection._authenticate)
-        connection.write.assert_called_with('AUTH', 'testpass')
+        connection._sock.recv_into.side_effect = recv_chunks(
+            [b'+OK\r\n-ERR DB index is out of range\r\n']
+        )
+        connection._reader = Reader()
+        self.assertRaises(ReplyError, connection._handshake)
+        self.assertTrue(connection.closed)
 
     def test__connect_inet46_ok(self):
         connection = pyredis.connection.Connection(host='127.0.0.1')
@@ -109,6 +205,56 @@ class TestConnectionUnit(TestCase):
             second=self.socket_mock.socket.return_value
         )
 
+    def test__connect_inet46_tcp_nodelay_default(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        sock = connection._connect_inet46()
+        sock.setsockopt.assert_called_once_with(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+
+    def test__connect_inet46_socket_options(self):
+        connection = pyredis.connection.Connection(
+            host='127.0.0.1',
+            socket_options={
+                'tcp_nodelay': False,
+                'keepalive_idle': 60,
+                'keepalive_interval': 10,
+                'keepalive_count': 3,
+                'send_buffer': 65536,
+                'recv_buffer': 131072,
+                'user_timeout': 2.5,
+            }
+        )
+        sock = connection._connect_inet46()
+        expected = [
+            call(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536),
+            call(socket.SOL_SOCKET, socket.SO_RCVBUF, 131072),
+            call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            call(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+            call(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+            call(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
+            call(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, 2500),
+        ]
+        self.assertEqual(sock.setsockopt.call_args_list, expected)
+
+    def test__connect_inet46_socket_options_unknown(self):
+        self.assertRaises(
+            PyRedisError,
+            pyredis.connection.Connection,
+            host='127.0.0.1',
+            socket_options={'nodelay': True}
+        )
+
+    def test__connect_inet46_socket_options_error(self):
+        sock = self.socket_mock.socket.return_value
+        sock.setsockopt.side_effect = OSError
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        self.assertRaises(
+            PyRedisConnError,
+            connection._connect_inet46
+        )
+        sock.close.assert_called_once_with()
+
     def test__connect_inet46_OSError(self):
         self.socket_mock.create_connection.side_effect = OSError
         connection = pyredis.connection.Connection(host='127.0.0.1')
@@ -149,6 +295,16 @@ class TestConnectionUnit(TestCase):
             connection._connect_inet46
         )
 
+    def test__connect_unix_socket_options(self):
+        connection = pyredis.connection.Connection(
+            unix_sock='/tmp/test.sock',
+            socket_options={'keepalive': True, 'send_buffer': 65536}
+        )
+        sock = connection._connect_unix()
+        sock.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, 65536
+        )
+
     def test__connect_unix(self):
         connection = pyredis.connection.Connection(unix_sock='/tmp/test.sock')
         sock = connection._connect_unix()
@@ -203,8 +359,7 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         connection._connect()
 
         sock_mock.settimeout.assert_called_with(2)
@@ -220,8 +375,7 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         connection._connect()
 
         sock_mock.settimeout.assert_called_with(2)
@@ -237,8 +391,7 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='::1')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         connection._connect()
 
         sock_mock.settimeout.assert_called_with(2)
@@ -248,8 +401,7 @@ class TestConnectionUnit(TestCase):
         self.socket_mock.socket.return_value = sock_mock
 
         connection = pyredis.connection.Connection(unix_sock='/tmp/test.sock')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         connection._connect()
         connection.close()
 
@@ -258,44 +410,79 @@ class TestConnectionUnit(TestCase):
         self.assertIsNone(connection._reader)
         self.assertTrue(connection._closed)
 
-    def test__setdb_0(self):
-        connection = pyredis.connection.Connection(host='localhost', database=0)
-        connection.read = Mock()
-        connection.read.return_value = b'OK'
-        connection.write = Mock()
+    @patch('pyredis.connection.connection.time.monotonic')
+    def test_deadline_recv_timeout(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._sock = Mock()
+        connection._sock.recv_into.side_effect = recv_chunks([b'+OK\r\n'])
+        connection._reader = Reader()
+        with connection.deadline(102.5):
+            self.assertEqual(connection.read(), b'OK')
+        connection._sock.settimeout.assert_has_calls([call(2.5), call(2)])
+
+    @patch('pyredis.connection.connection.time.monotonic')
+    def test_deadline_shared_between_chunks(self, monotonic_mock):
+        monotonic_mock.side_effect = [100.0, 101.5]
+        connection = pyredis.connection.Connection(host='127.0.0.1')
         connection._sock = Mock()
-        connection._setdb()
-        connection.write.assert_called_with('SELECT', 0)
-        connection.read.assert_called_with()
+        connection._sock.recv_into.side_effect = recv_chunks([b'$5\r\nhel', b'lo\r\n'])
+        connection._reader = Reader()
+        with connection.deadline(102.0):
+            self.assertEqual(connection.read(), b'hello')
+        self.assertEqual(
+            connection._sock.settimeout.call_args_list[:2],
+            [call(2.0), call(0.5)]
+        )
 
-    def test__setdb_none(self):
-        connection = pyredis.connection.Connection(host='localhost')
-        connection.read = Mock()
-        connection.read.return_value = b'OK'
-        connection.write = Mock()
+    @patch('pyredis.connection.connection.time.monotonic')
+    def test_deadline_exceeded(self, monotonic_mock):
+        monotonic_mock.return_value = 103.0
+        connection = pyredis.connection.Connection(host='127.0.0.1')
         connection._sock = Mock()
-        connection.write.assert_not_called()
-        connection.read.assert_not_called()
+        connection._reader = Reader()
+        with connection.deadline(102.0):
+            self.assertRaises(PyRedisDeadlineExceeded, connection.read)
+        self.assertTrue(connection.closed)
 
-    def test__setdb_invalid_db(self):
-        connection = pyredis.connection.Connection(host='localhost', database=23234)
-        connection.read = Mock()
-        connection.read.side_effect = ReplyError
-        connection.write = Mock()
+    def test_deadline_socket_timeout(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1')
         connection._sock = Mock()
-        self.assertRaises(ReplyError, connection._setdb)
-        connection.write.assert_called_with('SELECT', 23234)
-        connection.read.assert_called_with()
+        connection._sock.recv_into.side_effect = socket.timeout
+        connection._reader = Reader()
+        with connection.deadline(float('inf')):
+            self.assertRaises(PyRedisDeadlineExceeded, connection.read)
+        self.assertTrue(connection.closed)
 
-    def test__set_read_only_true(self):
-        connection = pyredis.connection.Connection(host='localhost', read_only=True)
-        connection.read = Mock()
-        connection.read.return_value = b'OK'
-        connection.write = Mock()
+    def test_deadline_inf_blocks(self):
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._sock = Mock()
+        connection._sock.recv_into.side_effect = recv_chunks([b'+OK\r\n'])
+        connection._reader = Reader()
+        with connection.deadline(float('inf')):
+            connection.read()
+        connection._sock.settimeout.assert_has_calls([call(None), call(2)])
+
+    @patch('pyredis.connection.connection.time.monotonic')
+    def test_deadline_write_timeout(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        connection = pyredis.connection.Connection(host='127.0.0.1')
         connection._sock = Mock()
-        connection._set_read_only()
-        connection.write.assert_called_with('READONLY')
-        connection.read.assert_called_with()
+        connection._sock.sendall.side_effect = socket.timeout
+        with connection.deadline(101.0):
+            self.assertRaises(PyRedisDeadlineExceeded, connection.write, 'PING')
+        self.assertTrue(connection.closed)
+
+    @patch('pyredis.connection.connection.time.monotonic')
+    def test_deadline_caps_conn_timeout(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        with connection.deadline(100.5):
+            connection._connect_inet46()
+        self.socket_mock.create_connection.assert_called_with(
+            address=('127.0.0.1', 6379),
+            timeout=0.5
+        )
 
     def test_closed_false(self):
         connection = pyredis.connection.Connection(unix_sock='/tmp/test.sock')
@@ -319,8 +506,7 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         connection.write(cmd, payload)
 
         self.assertEqual(sock_mock.sendall.call_args_list, [call(msg)])
@@ -338,12 +524,73 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         connection.write(cmd, payload)
 
         self.assertEqual(sock_mock.sendall.call_args_list, [call(msg)])
 
+    def test_queue_flush(self):
+        sent = []
+        sock_mock = Mock()
+        sock_mock.sendall.side_effect = lambda data: sent.append(bytes(data))
+        self.socket_mock.socket.return_value = sock_mock
+
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._handshake = Mock()
+        connection.queue('SET', 'key', 'value')
+        connection.queue('GET', 'key')
+        sock_mock.sendall.assert_not_called()
+        connection.flush()
+        self.assertEqual(sent, [writer('SET', 'key', 'value') + writer('GET', 'key')])
+        self.assertEqual(connection._out, bytearray())
+        connection.flush()
+        self.assertEqual(sock_mock.sendall.call_count, 1)
+
+    def test_write_many(self):
+        sent = []
+        sock_mock = Mock()
+        sock_mock.sendall.side_effect = lambda data: sent.append(bytes(data))
+        self.socket_mock.socket.return_value = sock_mock
+
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._handshake = Mock()
+        connection.write_many([('PING',), ('ECHO', 'x')])
+        self.assertEqual(sent, [writer('PING') + writer('ECHO', 'x')])
+
+    def test_write_large_arg_sendmsg(self):
+        value = b'x' * 100000
+        sent = []
+
+        def sendmsg(buffers):
+            data = b''.join(bytes(buf) for buf in buffers)[:70000]
+            sent.append(data)
+            return len(data)
+
+        sock_mock = Mock()
+        sock_mock.sendmsg.side_effect = sendmsg
+        self.socket_mock.socket.return_value = sock_mock
+
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._handshake = Mock()
+        connection.write('SET', 'key', value)
+        self.assertEqual(b''.join(sent), writer('SET', 'key', value))
+        self.assertEqual(sock_mock.sendmsg.call_count, 2)
+        sock_mock.sendall.assert_not_called()
+
+    def test_write_large_arg_without_sendmsg(self):
+        value = b'x' * 100000
+        sock_mock = Mock(spec=['sendall', 'settimeout', 'setsockopt', 'connect', 'close'])
+        self.socket_mock.socket.return_value = sock_mock
+
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._handshake = Mock()
+        connection.write('SET', 'key', value)
+        self.assertEqual(
+            b''.join(c.args[0] for c in sock_mock.sendall.call_args_list),
+            writer('SET', 'key', value)
+        )
+        self.assertIs(sock_mock.sendall.call_args_list[1].args[0], value)
+
     def test_write_exception_brokenpipeerror(self):
         cmd = 'ECHO'
         payload = "x" * 512
@@ -357,8 +604,7 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         connection._connect()
         self.assertRaises(PyRedisConnError, connection.write, cmd, payload)
 
@@ -367,15 +613,14 @@ class TestConnectionUnit(TestCase):
         answer = 'XXXXXXXXXX'
 
         sock_mock = Mock()
-        sock_mock.recv.side_effect = [raw_answer]
+        sock_mock.recv_into.side_effect = recv_chunks([raw_answer])
         self.socket_mock.socket.return_value = sock_mock
 
         reader_mock = Mock()
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         pyredis.connection.Reader = Reader
         connection._connect()
         result = connection.read()
@@ -387,15 +632,14 @@ class TestConnectionUnit(TestCase):
         answer = 'XXXXXXXXXX'
 
         sock_mock = Mock()
-        sock_mock.recv.side_effect = [raw_answer1, raw_answer2]
+        sock_mock.recv_into.side_effect = recv_chunks([raw_answer1, raw_answer2])
         self.socket_mock.socket.return_value = sock_mock
 
         reader_mock = Mock()
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         pyredis.connection.Reader = Reader
         connection._connect()
         result = connection.read()
@@ -406,15 +650,14 @@ class TestConnectionUnit(TestCase):
         answer = 'XXXXXXXXXX'
 
         sock_mock = Mock()
-        sock_mock.recv.side_effect = [raw_answer]
+        sock_mock.recv_into.side_effect = recv_chunks([raw_answer])
         self.socket_mock.socket.return_value = sock_mock
 
         reader_mock = Mock()
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         pyredis.connection.Reader = Reader
         connection._connect()
         result = connection.read()
@@ -426,26 +669,345 @@ class TestConnectionUnit(TestCase):
         answer2 = 'YYYYYYYYYY'
 
         sock_mock = Mock()
-        sock_mock.recv.side_effect = [raw_answer]
+        sock_mock.recv_into.side_effect = recv_chunks([raw_answer])
         self.socket_mock.socket.return_value = sock_mock
 
         reader_mock = Mock()
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         pyredis.connection.Reader = Reader
         connection._connect()
         result1 = connection.read()
         result2 = connection.read()
         self.assertEqual(result1, answer1)
         self.assertEqual(result2, answer2)
-        self.assertEqual(sock_mock.recv.call_args_list, [call(1500)])
+        self.assertEqual(sock_mock.recv_into.call_count, 1)
+
+    def test_read_push_handler(self):
+        raw_answer = b'>2\r\n$10\r\ninvalidate\r\n*1\r\n$3\r\nkey\r\n+OK\r\n'
+
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([raw_answer])
+        self.socket_mock.socket.return_value = sock_mock
+
+        push_handler = Mock()
+        connection = pyredis.connection.Connection(host='127.0.0.1', push_handler=push_handler)
+        connection._handshake = Mock()
+        pyredis.connection.Reader = Reader
+        connection._connect()
+        result = connection.read()
+        self.assertEqual(result, b'OK')
+        push_handler.assert_called_once_with([b'invalidate', [b'key']])
+
+    def test_read_push_without_handler(self):
+        raw_answer = b'>2\r\n$7\r\nmessage\r\n$4\r\ndata\r\n'
+
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([raw_answer])
+        self.socket_mock.socket.return_value = sock_mock
+
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._handshake = Mock()
+        pyredis.connection.Reader = Reader
+        connection._connect()
+        result = connection.read()
+        self.assertEqual(result, [b'message', b'data'])
+
+    def test_read_large_bulk_recv_into(self):
+        payload = b'x' * 200000
+        raw_answer = b'$200000\r\n' + payload[:1000]
+
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([raw_answer, payload[1000:], b'\r\n'])
+        self.socket_mock.socket.return_value = sock_mock
+
+        connection = pyredis.connection.Connection(host='127.0.0.1', bulk_type=bytearray)
+        connection._handshake = Mock()
+        pyredis.connection.Reader = Reader
+        connection._connect()
+        result = connection.read()
+        self.assertEqual(result, payload)
+        self.assertIsInstance(result, bytearray)
+        self.assertEqual(sock_mock.recv_into.call_count, 3)
+
+    def _stream_connection(self, sock_mock, **kwargs):
+        self.socket_mock.socket.return_value = sock_mock
+        connection = pyredis.connection.Connection(host='127.0.0.1', **kwargs)
+        connection._handshake = Mock()
+        pyredis.connection.Reader = Reader
+        connection._connect()
+        return connection
+
+    def test_read_into_bytearray(self):
+        payload = b'\r\n' + b'x' * 9998
+
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks(
+            [b'$10000\r\n' + payload[:1000], payload[1000:], b'\r\n']
+        )
+        connection = self._stream_connection(sock_mock)
+        target = bytearray(12000)
+        self.assertEqual(connection.read_into(target), 10000)
+        self.assertEqual(target[:10000], payload)
+
+    def test_read_into_file(self):
+        from io import BytesIO
+        payload = b'y' * 150000
+
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'$150000\r\n' + payload + b'\r\n+OK\r\n'])
+        connection = self._stream_connection(sock_mock)
+        target = BytesIO()
+        self.assertEqual(connection.read_into(target), 150000)
+        self.assertEqual(target.getvalue(), payload)
+        self.assertEqual(connection.read(), b'OK')
+
+    def test_read_into_push_handler(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks(
+            [b'>3\r\n$7\r\nmessage\r\n$2\r\nch\r\n$2\r\nhi\r\n$3\r\nfoo\r\n']
+        )
+        pushes = []
+        connection = self._stream_connection(sock_mock, push_handler=pushes.append)
+        target = bytearray(3)
+        self.assertEqual(connection.read_into(target), 3)
+        self.assertEqual(target, b'foo')
+        self.assertEqual(pushes, [[b'message', b'ch', b'hi']])
+
+    def test_read_into_nil(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'$-1\r\n'])
+        connection = self._stream_connection(sock_mock)
+        self.assertIsNone(connection.read_into(bytearray(10)))
+
+    def test_read_into_error(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'-WRONGTYPE no string\r\n'])
+        connection = self._stream_connection(sock_mock)
+        self.assertRaises(ReplyError, connection.read_into, bytearray(10))
+        self.assertFalse(connection.closed)
+
+    def test_read_into_target_too_small(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'$5\r\nhello\r\n'])
+        connection = self._stream_connection(sock_mock)
+        self.assertRaises(PyRedisError, connection.read_into, bytearray(4))
+        self.assertTrue(connection.closed)
+
+    def test_write_stream_buffer(self):
+        sock_mock = Mock()
+        connection = self._stream_connection(sock_mock)
+        connection.write_stream((b'SET', b'key'), b'value', tail=(b'EX', 10))
+        sent = b''.join(bytes(c.args[0]) for c in sock_mock.sendall.call_args_list)
+        self.assertEqual(sent, writer(b'SET', b'key', b'value', b'EX', 10))
+
+    def test_write_stream_file(self):
+        from io import BytesIO
+        payload = b'z' * 100000
+        source = BytesIO(payload)
+        sock_mock = Mock()
+        sent = []
+        sock_mock.sendall.side_effect = lambda data: sent.append(bytes(data))
+        connection = self._stream_connection(sock_mock)
+        connection.write_stream((b'SET', b'key'), source)
+        self.assertEqual(b''.join(sent), writer(b'SET', b'key', payload))
+
+    def test_write_stream_short_source(self):
+        from io import BytesIO
+        sock_mock = Mock()
+        connection = self._stream_connection(sock_mock)
+        self.assertRaises(
+            PyRedisError,
+            connection.write_stream, (b'SET', b'key'), BytesIO(b'abc'), length=10
+        )
+        self.assertTrue(connection.closed)
+
+    def test_read_iter(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'*3\r\n$1\r\na\r\n', b'*1\r\n:1\r\n$1\r', b'\nc\r\n'])
+        connection = self._stream_connection(sock_mock)
+        stream = connection.read_iter()
+        self.assertEqual(sock_mock.recv_into.call_count, 1)
+        self.assertEqual(next(stream), b'a')
+        self.assertEqual(sock_mock.recv_into.call_count, 1)
+        self.assertEqual(list(stream), [[1], b'c'])
+
+    def test_read_iter_push_handler(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks(
+            [b'>2\r\n$7\r\nmessage\r\n$2\r\nhi\r\n*2\r\n$1\r\na\r\n$1\r\nb\r\n']
+        )
+        pushes = []
+        connection = self._stream_connection(sock_mock, push_handler=pushes.append)
+        self.assertEqual(list(connection.read_iter()), [b'a', b'b'])
+        self.assertEqual(pushes, [[b'message', b'hi']])
+
+    def test_read_iter_map(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'%2\r\n+a\r\n:1\r\n+b\r\n:2\r\n'])
+        connection = self._stream_connection(sock_mock)
+        self.assertEqual(list(connection.read_iter()), [(b'a', 1), (b'b', 2)])
+
+    def test_read_iter_nil_and_scalar(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'*-1\r\n$2\r\nok\r\n'])
+        connection = self._stream_connection(sock_mock)
+        self.assertEqual(list(connection.read_iter()), [])
+        self.assertEqual(list(connection.read_iter()), [b'ok'])
+
+    def test_read_iter_error(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'-WRONGTYPE no list\r\n'])
+        connection = self._stream_connection(sock_mock)
+        self.assertRaises(ReplyError, connection.read_iter)
+
+    def test_read_iter_abandoned(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'*3\r\n:1\r\n', b':2\r\n:3\r\n+PONG\r\n'])
+        connection = self._stream_connection(sock_mock)
+        stream = connection.read_iter()
+        self.assertEqual(next(stream), 1)
+        connection.write('PING')
+        self.assertEqual(connection.read(), b'PONG')
+        self.assertRaises(PyRedisError, next, stream)
+
+    def test_read_many(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'+OK\r\n-ERR x\r\n:1', b'\r\n$1\r\na\r\n+rest\r\n'])
+        connection = self._stream_connection(sock_mock)
+        results = connection.read_many(4)
+        self.assertEqual(results[0], b'OK')
+        self.assertIsInstance(results[1], ReplyError)
+        self.assertEqual(results[2:], [1, b'a'])
+        self.assertEqual(sock_mock.recv_into.call_count, 2)
+        self.assertEqual(connection.read(), b'rest')
+
+    def test_skip_many(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'+OK\r\n-ERR x\r\n$3', b'\r\nfoo\r\n+rest\r\n'])
+        connection = self._stream_connection(sock_mock)
+        self.assertEqual(connection.skip_many(3), 1)
+        self.assertEqual(sock_mock.recv_into.call_count, 2)
+        self.assertEqual(connection.read(), b'rest')
+
+    def test_skip_many_push_handler(self):
+        pushes = []
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'>2\r\n+a\r\n+b\r\n:1\r\n:2\r\n'])
+        self.socket_mock.socket.return_value = sock_mock
+        connection = pyredis.connection.Connection(host='127.0.0.1', push_handler=pushes.append)
+        connection._handshake = Mock()
+        pyredis.connection.Reader = Reader
+        connection._connect()
+        self.assertEqual(connection.skip_many(2), 0)
+        self.assertEqual(pushes, [[b'a', b'b']])
+
+    def test_read_ready(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'+OK\r\n:1', b'\r\n:2\r\n'])
+        connection = self._stream_connection(sock_mock)
+        connection._readable = Mock(side_effect=[True, False, True, False])
+        self.assertEqual(connection.read_ready(3), [b'OK'])
+        self.assertEqual(sock_mock.recv_into.call_count, 1)
+        self.assertEqual(connection.read_ready(3), [1, 2])
+        self.assertEqual(connection.read_ready(0), [])
+        self.assertEqual(connection._readable.call_count, 4)
+
+    def test_skip_ready(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks(
+            [b'*3\r\n$1\r\na\r\n$1\r\nb', b'\r\n$1\r\nc\r\n-ERR x\r\n+rest\r\n']
+        )
+        connection = self._stream_connection(sock_mock)
+        connection._readable = Mock(side_effect=[True, False, True])
+        self.assertEqual(connection.skip_ready(2), (0, 0))
+        self.assertEqual(connection.skip_ready(2), (2, 1))
+        self.assertEqual(connection.read(), b'rest')
+
+    def test_bulk_window_skip_split_arrays(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([
+            b'*3\r\n$1\r\na\r\n$1\r\nb',
+            b'\r\n$1\r\nc\r\n*2\r\n:1',
+            b'\r\n:2\r\n-ERR x\r\n',
+            b'+rest\r\n',
+        ])
+        client = pyredis.client.Client(host='127.0.0.1')
+        client._conn = self._stream_connection(sock_mock)
+        client._conn._readable = Mock(side_effect=[True, False, True, False, True])
+        client.bulk_start(
+            bulk_size=1, keep_results=False, window=1, count_errors=True
+        )
+        client.execute('LRANGE', 'a', 0, -1)
+        self.assertEqual(client._bulk_outstanding, 1)
+        client.execute('LRANGE', 'b', 0, -1)
+        self.assertEqual(client._bulk_outstanding, 1)
+        client.execute('INCR', 'c')
+        self.assertEqual(client._bulk_outstanding, 0)
+        self.assertEqual(client.bulk_stop(), 1)
+        self.assertEqual(client._conn.read(), b'rest')
+
+    def test_sync(self):
+        sock_mock = Mock()
+        connection = self._stream_connection(sock_mock)
+        connection.queue = Mock()
+        connection.flush = Mock()
+        connection.read = Mock()
+        with patch('pyredis.connection.connection.os.urandom', return_value=b'\x00\x01'):
+            connection.read.side_effect = [b'OK', b'PONG', '0001']
+            connection.sync()
+        connection.queue.assert_called_once_with('PING', '0001')
+        connection.flush.assert_called_once_with()
+        self.assertEqual(connection.read.call_count, 3)
+        connection.read.assert_called_with(
+            close_on_timeout=True, raise_on_result_err=False
+        )
+
+    def test__readable(self):
+        left, right = socket.socketpair()
+        self.addCleanup(left.close)
+        self.addCleanup(right.close)
+        connection = pyredis.connection.Connection(host='127.0.0.1')
+        connection._sock = left
+        self.assertFalse(connection._readable())
+        right.sendall(b'+OK\r\n')
+        self.assertTrue(connection._readable())
+
+    def test_read_many_push_handler(self):
+        pushes = []
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks([b'>2\r\n+a\r\n+b\r\n:1\r\n:2\r\n'])
+        self.socket_mock.socket.return_value = sock_mock
+        connection = pyredis.connection.Connection(host='127.0.0.1', push_handler=pushes.append)
+        connection._handshake = Mock()
+        pyredis.connection.Reader = Reader
+        connection._connect()
+        self.assertEqual(connection.read_many(2), [1, 2])
+        self.assertEqual(pushes, [[b'a', b'b']])
+
+    def test_read_buffer_adapts(self):
+        sock_mock = Mock()
+        sock_mock.recv_into.side_effect = recv_chunks(
+            [b'x' * 1024, b'x' * 2048, b'x' * 4096, b'x' * 4096] + [b'x'] * 32
+        )
+        self.socket_mock.socket.return_value = sock_mock
+        connection = pyredis.connection.Connection(
+            host='127.0.0.1', read_buffer_size=1024, max_read_buffer=4096
+        )
+        connection._handshake = Mock()
+        connection._connect()
+        for size in (1024, 2048, 4096, 4096):
+            self.assertEqual(len(connection._recv(True)), size)
+        self.assertEqual(len(connection._read_view), 4096)
+        for _ in range(32):
+            connection._recv(True)
+        self.assertEqual(len(connection._read_view), 1024)
 
     def test_read_exception_socket_timeout(self):
         sock_mock = Mock()
-        sock_mock.recv.side_effect = [socket.timeout]
+        sock_mock.recv_into.side_effect = recv_chunks([socket.timeout])
         self.socket_mock.socket.return_value = sock_mock
         self.socket_mock.timeout = socket.timeout
 
@@ -453,8 +1015,7 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         pyredis.connection.Reader = Reader
         connection._connect()
         self.assertRaises(PyRedisConnReadTimeout, connection.read)
@@ -462,7 +1023,7 @@ class TestConnectionUnit(TestCase):
 
     def test_read_exception_socket_timeout_close_on_timeout_false(self):
         sock_mock = Mock()
-        sock_mock.recv.side_effect = [socket.timeout]
+        sock_mock.recv_into.side_effect = recv_chunks([socket.timeout])
         self.socket_mock.socket.return_value = sock_mock
         self.socket_mock.timeout = socket.timeout
 
@@ -470,8 +1031,7 @@ class TestConnectionUnit(TestCase):
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         pyredis.connection.Reader = Reader
         connection._connect()
         self.assertRaises(PyRedisConnReadTimeout, connection.read, close_on_timeout=False)
@@ -479,15 +1039,14 @@ class TestConnectionUnit(TestCase):
 
     def test_read_exception_connection_lost(self):
         sock_mock = Mock()
-        sock_mock.recv.side_effect = ['']
+        sock_mock.recv_into.side_effect = recv_chunks([b''])
         self.socket_mock.socket.return_value = sock_mock
 
         reader_mock = Mock()
         self.reader_mock.return_value = reader_mock
 
         connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8')
-        connection._authenticate = Mock()
-        connection._setdb = Mock()
+        connection._handshake = Mock()
         pyredis.connection.Reader = Reader
         connection._connect()
         self.assertRaises(PyRedisConnClosed, connection.read)
@@ -502,18 +1061,12 @@ class TestConnectionUnit(TestCase):
         connection._reader = reader_mock
         self.assertRaises(ReplyError, connection.read)
 
-    def test_authenticate_sentinel(self):
-        connection = pyredis.connection.Connection(host='127.0.0.1', encoding='utf-8', sentinel=True)
-        authenticate_mock = Mock()
-        setdb_mock = Mock()
-        set_read_only_mock = Mock()
-
-        connection._authenticate = authenticate_mock
-        connection._setdb = setdb_mock
-        connection._set_read_only = set_read_only_mock
+    def test_handshake_sentinel(self):
+        connection = pyredis.connection.Connection(
+            host='127.0.0.1', encoding='utf-8', sentinel=True, database=0, read_only=True
+        )
+        connection.write_many = Mock()
 
         connection._connect()
 
-        authenticate_mock.assert_called()
-        setdb_mock.assert_not_called()
-        set_read_only_mock.assert_not_called()
+        connection.write_many.assert_not_called()
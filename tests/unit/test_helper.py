@@ -4,10 +4,14 @@ from collections import deque
 from unittest import TestCase
 from unittest.mock import Mock, call, patch
 from uuid import uuid4
+import math
 import threading
 
-from pyredis.exceptions import PyRedisError
+from pyredis.exceptions import PyRedisError, ReplyError
 from pyredis.helper import dict_from_list, tag_from_key, slot_from_key, ClusterMap
+from pyredis.helper import NO_NODE
+from pyredis.helper import get_deadline
+from pyredis.helper import merge_multi_key, parse_redirect, split_multi_key
 
 
 class TestHelperUnit(TestCase):
@@ -20,6 +24,26 @@ class TestHelperUnit(TestCase):
         result = dict_from_list(source)
         self.assertEqual(result, expected)
 
+    def test_dict_from_list_resp3_map(self):
+        source = {'test1': 1234}
+        self.assertIs(dict_from_list(source), source)
+
+    @patch('pyredis.helper.time.monotonic', Mock(return_value=100.0))
+    def test_get_deadline(self):
+        self.assertIsNone(get_deadline())
+        self.assertEqual(get_deadline(timeout=5), 105.0)
+        self.assertEqual(get_deadline(deadline=103.0), 103.0)
+        self.assertEqual(get_deadline(timeout=5, deadline=103.0), 103.0)
+        self.assertEqual(get_deadline(timeout=2, deadline=103.0), 102.0)
+
+    @patch('pyredis.helper.time.monotonic', Mock(return_value=100.0))
+    def test_get_deadline_block(self):
+        self.assertEqual(get_deadline(block=b'10', read_timeout=2), 112.0)
+        self.assertEqual(get_deadline(timeout=1, block=10, read_timeout=2), 111.0)
+        self.assertEqual(get_deadline(block=0, read_timeout=2), math.inf)
+        self.assertEqual(get_deadline(timeout=1, block='0'), math.inf)
+        self.assertEqual(get_deadline(block=10), math.inf)
+
     def test_tag_from_key_no_tag(self):
         key = 'testkey'
         result = tag_from_key(key)
@@ -53,6 +77,41 @@ class TestHelperUnit(TestCase):
         result = slot_from_key(key)
         self.assertEqual(5534, result)
 
+    def test_split_multi_key(self):
+        parts = split_multi_key((b'MGET', 'a', 'b', '{a}x'))
+        self.assertEqual(parts, [
+            (15495, (b'MGET', 'a', '{a}x'), [0, 2]),
+            (3300, (b'MGET', 'b'), [1]),
+        ])
+        self.assertEqual(merge_multi_key(parts, [[b'1', b'3'], [b'2']]), [b'1', b'2', b'3'])
+
+    def test_split_multi_key_route(self):
+        route = Mock(side_effect=lambda slot: 'bucket1' if slot == 3300 else 'bucket2')
+        parts = split_multi_key(('mset', 'a', 1, 'b', 2, 'c', 3), route=route)
+        self.assertEqual(parts, [
+            ('bucket2', ('mset', 'a', 1, 'c', 3), [0, 2]),
+            ('bucket1', ('mset', 'b', 2), [1]),
+        ])
+        self.assertEqual(route.call_count, 3)
+        self.assertEqual(merge_multi_key(parts, [b'OK', b'OK']), b'OK')
+
+    def test_split_multi_key_unsplit(self):
+        self.assertIsNone(split_multi_key((b'GET', 'a')))
+        self.assertIsNone(split_multi_key((b'DEL', 'a')))
+        self.assertIsNone(split_multi_key((b'DEL', '{a}1', '{a}2')))
+        self.assertIsNone(split_multi_key((b'MSET', 'a', 1, 'b')))
+
+    def test_parse_redirect(self):
+        self.assertEqual(
+            parse_redirect('MOVED 3999 127.0.0.1:6381'), (3999, '127.0.0.1_6381')
+        )
+        self.assertEqual(parse_redirect('ASK 42 ::1:6381'), (42, '::1_6381'))
+
+    def test_merge_multi_key(self):
+        parts = split_multi_key((b'DEL', 'a', 'b'))
+        self.assertEqual(merge_multi_key(parts, [1, 1]), 2)
+        self.assertRaises(PyRedisError, merge_multi_key, parts, [1, PyRedisError('ERR')])
+
 
 class TestClusterMap(TestCase):
     def setUp(self):
@@ -105,7 +164,8 @@ class TestClusterMap(TestCase):
 
     def test___init__(self):
         clustermap = ClusterMap(self.seeds, password='blubber')
-        self.assertEqual(clustermap._map, {})
+        self.assertEqual(clustermap.hosts(), set())
+        self.assertRaises(KeyError, clustermap.get_slot, 'blarg')
         self.assertEqual(clustermap._seeds, deque(self.seeds))
         self.assertEqual(clustermap._password, 'blubber')
 
@@ -115,7 +175,7 @@ class TestClusterMap(TestCase):
 
     def test__fetch_map_first_try_ok(self):
         conn1 = Mock()
-        conn1.read.return_value = self.map
+        conn1.read.side_effect = [ReplyError('ERR unknown subcommand'), self.map]
 
         self.connection_mock.return_value = conn1
 
@@ -126,7 +186,10 @@ class TestClusterMap(TestCase):
         result = clustermap._fetch_map()
 
         self.assertEqual(result, self.map)
-        conn1.write.assert_called_with(b'CLUSTER', b'SLOTS')
+        conn1.write.assert_has_calls([
+            call(b'CLUSTER', b'SHARDS'), call(b'CLUSTER', b'SLOTS')
+        ])
+        self.assertFalse(clustermap._shards)
         self.assertTrue(conn1.close.called)
         self.connection_mock.assert_called_with(
             host='host1',
@@ -140,7 +203,7 @@ class TestClusterMap(TestCase):
         conn1 = Mock()
         conn1.read.side_effect = PyRedisError
         conn2 = Mock()
-        conn2.read.return_value = self.map
+        conn2.read.side_effect = [ReplyError('ERR unknown subcommand'), self.map]
 
         self.connection_mock.side_effect = [conn1, conn2]
 
@@ -149,7 +212,7 @@ class TestClusterMap(TestCase):
         result = clustermap._fetch_map()
 
         self.assertEqual(result, self.map)
-        conn1.write.assert_called_with(b'CLUSTER', b'SLOTS')
+        conn1.write.assert_called_with(b'CLUSTER', b'SHARDS')
         self.assertTrue(conn1.close.called)
         conn2.write.assert_called_with(b'CLUSTER', b'SLOTS')
         self.assertTrue(conn2.close.called)
@@ -193,41 +256,173 @@ class TestClusterMap(TestCase):
             ),
         ])
 
-        conn1.write.assert_called_with(b'CLUSTER', b'SLOTS')
+        conn1.write.assert_called_with(b'CLUSTER', b'SHARDS')
         self.assertTrue(conn1.close.called)
-        conn2.write.assert_called_with(b'CLUSTER', b'SLOTS')
+        conn2.write.assert_called_with(b'CLUSTER', b'SHARDS')
         self.assertTrue(conn2.close.called)
-        conn3.write.assert_called_with(b'CLUSTER', b'SLOTS')
+        conn3.write.assert_called_with(b'CLUSTER', b'SHARDS')
         self.assertTrue(conn3.close.called)
 
+    def test__fetch_map_shards(self):
+        conn1 = Mock()
+        conn1.read.return_value = [
+            [
+                'slots', [0, 5460, 10923, 10925],
+                'nodes', [
+                    [
+                        'id', 'a', 'port', 7000, 'ip', '10.0.0.1',
+                        'endpoint', '?', 'role', 'master', 'health', 'online'
+                    ],
+                    [
+                        'id', 'b', 'port', 7003, 'ip', '10.0.0.2',
+                        'endpoint', 'node-b', 'role', 'replica',
+                        'health', 'online'
+                    ],
+                    [
+                        'id', 'c', 'port', 7004, 'ip', '10.0.0.3',
+                        'endpoint', 'node-c', 'role', 'replica',
+                        'health', 'failed'
+                    ],
+                ],
+            ],
+            {
+                'slots': [5461, 10922],
+                'nodes': [
+                    {
+                        'id': 'd', 'port': 7001, 'ip': '10.0.0.4',
+                        'endpoint': 'node-d', 'role': 'master',
+                        'health': 'online'
+                    },
+                ],
+            },
+        ]
+        self.connection_mock.return_value = conn1
+
+        clustermap = ClusterMap(self.seeds)
+
+        self.assertEqual(clustermap._fetch_map(), [
+            [0, 5460, ['10.0.0.1', 7000], ['node-b', 7003]],
+            [10923, 10925, ['10.0.0.1', 7000], ['node-b', 7003]],
+            [5461, 10922, ['node-d', 7001]],
+        ])
+        conn1.write.assert_called_once_with(b'CLUSTER', b'SHARDS')
+        self.assertTrue(clustermap._shards)
+
+    def test__fetch_map_shards_other_error(self):
+        conn1 = Mock()
+        conn1.read.side_effect = ReplyError('LOADING Redis is loading the dataset')
+        conn2 = Mock()
+        conn2.read.return_value = []
+        self.connection_mock.side_effect = [conn1, conn2]
+
+        clustermap = ClusterMap(self.seeds)
+
+        self.assertEqual(clustermap._fetch_map(), [])
+        conn1.write.assert_called_once_with(b'CLUSTER', b'SHARDS')
+        conn2.write.assert_called_once_with(b'CLUSTER', b'SHARDS')
+        self.assertTrue(clustermap._shards)
+
+    def test__fetch_map_known_nodes_first(self):
+        conn1 = Mock()
+        conn1.read.side_effect = PyRedisError
+        conn2 = Mock()
+        conn2.read.side_effect = [ReplyError('ERR unknown subcommand'), self.map]
+        self.connection_mock.side_effect = [conn1, conn2]
+
+        clustermap = ClusterMap(self.seeds)
+        clustermap._table = clustermap._build([[0, 16383, ['host3', 12345]]])
+        clustermap._fetch_map()
+
+        self.assertEqual(
+            clustermap._endpoints(),
+            [('host3', 12345), ('host1', 12345), ('host2', 12345)]
+        )
+        self.assertEqual(
+            self.connection_mock.call_args_list[0][1]['host'], 'host3'
+        )
+
+    def test_moved(self):
+        clustermap = ClusterMap(self.seeds)
+        clustermap._fetch_map = Mock()
+        clustermap._fetch_map.return_value = self.map
+        clustermap.update(clustermap.id)
+        map_id = clustermap.id
+        clustermap.refresh = Mock()
+
+        clustermap.moved(slot_from_key('blarg'), '127.0.0.1_7002')
+        clustermap.moved(slot_from_key('blub'), '127.0.0.1_7010')
+
+        self.assertEqual(clustermap.get_slot('blarg'), '127.0.0.1_7002')
+        self.assertEqual(clustermap.get_slot('blarg', slave=True), '127.0.0.1_7002')
+        self.assertEqual(clustermap.get_slot('blub'), '127.0.0.1_7010')
+        self.assertIn('127.0.0.1_7010', clustermap.hosts())
+        self.assertEqual(len(clustermap._table[0]), 7)
+        self.assertEqual(clustermap.id, map_id)
+        self.assertEqual(clustermap.refresh.call_count, 2)
+        clustermap._fetch_map.assert_called_once_with()
+
+    def test_refresh(self):
+        clustermap = ClusterMap(self.seeds, refresh_delay=0.01)
+        done = threading.Event()
+        clustermap._fetch_map = Mock(side_effect=lambda: done.set() or self.map)
+        map_id = clustermap.id
+
+        clustermap.refresh()
+        clustermap.refresh()
+        self.assertTrue(done.wait(5))
+        clustermap._refresh_timer.join(5)
+
+        clustermap._fetch_map.assert_called_once_with()
+        self.assertNotEqual(clustermap.id, map_id)
+        self.assertEqual(clustermap.get_slot('blarg'), '127.0.0.1_7001')
+
+    def test_refresh_interval(self):
+        clustermap = ClusterMap(self.seeds, refresh_delay=0.01, refresh_interval=30)
+        clustermap._fetch_map = Mock(side_effect=PyRedisError)
+        self.assertEqual(clustermap._refresh_wait(), 0.01)
+
+        clustermap.refresh()
+        clustermap._refresh_timer.join(5)
+
+        clustermap._fetch_map.assert_called_once_with()
+        self.assertGreater(clustermap._refresh_wait(), 29)
+
     def test_update(self):
         clustermap = ClusterMap(self.seeds)
-        update = Mock()
         id = clustermap.id
-        clustermap._update_slot = update
         clustermap._fetch_map = Mock()
         clustermap._fetch_map.return_value = self.minimap
         id_new = clustermap.update(clustermap.id)
-        clustermap._update_slot.assert_has_calls(
-            [
-                call(0, ['127.0.0.1', 7000], [['127.0.0.1', 7003]]),
-                call(1, ['127.0.0.1', 7000], [['127.0.0.1', 7003]]),
-                call(2, ['127.0.0.1', 7000], [['127.0.0.1', 7003]]),
-                call(3, ['127.0.0.1', 7001], [['127.0.0.1', 7004]]),
-                call(4, ['127.0.0.1', 7002], [['127.0.0.1', 7005]]),
-                call(5, ['127.0.0.1', 7002], [['127.0.0.1', 7005]])
-            ]
+        nodes, masters, slaves, _, _ = clustermap._table
+        self.assertEqual(
+            [nodes[index] for index in masters[:6]],
+            ['127.0.0.1_7000'] * 3 + ['127.0.0.1_7001'] + ['127.0.0.1_7002'] * 2
         )
+        self.assertEqual(
+            [nodes[index] for index in slaves[:6]],
+            ['127.0.0.1_7003'] * 3 + ['127.0.0.1_7004'] + ['127.0.0.1_7005'] * 2
+        )
+        self.assertEqual(set(masters[6:]), {NO_NODE})
+        self.assertEqual(len(nodes), 6)
         self.assertNotEqual(clustermap.id, id)
         self.assertEqual(clustermap.id, id_new)
+        self.assertEqual(clustermap.update(id), id_new)
+        clustermap._fetch_map.assert_called_once_with()
 
-    def test_update_slot(self):
+    def test_update_unmapped_slot(self):
         clustermap = ClusterMap(self.seeds)
-        clustermap._update_slot(0, ['127.0.0.1', 7000], [['127.0.0.1', 7003]])
-        self.assertEqual(
-            clustermap._map[0],
-            {'master': '127.0.0.1_7000', 'slave': '127.0.0.1_7003'}
-        )
+        clustermap._fetch_map = Mock()
+        clustermap._fetch_map.return_value = self.minimap
+        clustermap.update(clustermap.id)
+        self.assertRaises(KeyError, clustermap.get_slot, 'blarg')
+
+    def test_update_no_replicas(self):
+        clustermap = ClusterMap(self.seeds)
+        clustermap._fetch_map = Mock()
+        clustermap._fetch_map.return_value = [[0, 16383, ['127.0.0.1', 7000]]]
+        clustermap.update(clustermap.id)
+        self.assertEqual(clustermap.get_slot('blarg', slave=True), '127.0.0.1_7000')
+        self.assertEqual(clustermap.hosts(slave=True), {'127.0.0.1_7000'})
 
     def test_get_slot_master(self):
         clustermap = ClusterMap(self.seeds)
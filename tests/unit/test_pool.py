@@ -82,6 +82,48 @@ class TestBasePoolUnit(TestCase):
             call.release()
         ])
 
+    def test_execute_stream(self):
+        client = Mock()
+        client.closed = False
+        client.execute.return_value = iter([b'a', b'b'])
+        self.pool._pool_free.add(client)
+
+        result = self.pool.execute(b'KEYS', b'*', stream=True)
+        self.assertIn(client, self.pool._pool_used)
+        self.assertEqual(next(result), b'a')
+        self.assertIn(client, self.pool._pool_used)
+        self.assertEqual(list(result), [b'b'])
+        self.assertIn(client, self.pool._pool_free)
+
+    def test_execute_stream_close(self):
+        client = Mock()
+        client.closed = False
+        client.execute.return_value = iter([b'a', b'b'])
+        self.pool._pool_free.add(client)
+
+        result = self.pool.execute(b'KEYS', b'*', stream=True)
+        result.close()
+        self.assertIn(client, self.pool._pool_free)
+
+    def test_execute_stream_dropped(self):
+        client = Mock()
+        client.closed = False
+        client.execute.return_value = iter([b'a', b'b'])
+        self.pool._pool_free.add(client)
+
+        result = self.pool.execute(b'KEYS', b'*', stream=True)
+        next(result)
+        self.pool._lock = Mock()
+        del result
+        self.pool._lock.acquire.assert_not_called()
+        client.close.assert_called_once_with()
+        self.assertIn(client, self.pool._pool_used)
+
+        self.pool._connect = Mock()
+        self.assertIs(self.pool.acquire(), self.pool._connect.return_value)
+        self.assertNotIn(client, self.pool._pool_used)
+        self.assertNotIn(client, self.pool._pool_free)
+
     def test_release(self):
         client = Mock()
         client.closed = False
@@ -228,10 +270,27 @@ class TestClusterPoolUnit(TestCase):
             encoding=None,
             slave_ok=False,
             database=0,
-            username=None
+            username=None,
+            read_buffer_size=16384,
+            max_read_buffer=1048576,
+            socket_options=None
         )
         self.assertEqual(self.client_mock_inst, client)
 
+    def test_pipeline(self):
+        client_mock = MagicMock()
+        self.client_mock.return_value = client_mock
+        with self.pool.pipeline(bulk_size=100) as pipe:
+            self.assertIn(client_mock, self.pool._pool_used)
+        client_mock.pipeline.assert_called_once_with(bulk_size=100)
+        self.assertEqual(
+            pipe, client_mock.pipeline.return_value.__enter__.return_value
+        )
+        self.assertEqual(self.pool._pool_used, set())
+
+    def test_noreply(self):
+        self.assertRaises(PyRedisError, self.pool.noreply)
+
 
 class TestHashPoolUnit(TestCase):
     def setUp(self):
@@ -257,7 +316,10 @@ class TestHashPoolUnit(TestCase):
             encoding=self.pool.encoding,
             conn_timeout=self.pool.conn_timeout,
             read_timeout=self.pool.read_timeout,
-            username=None
+            username=None,
+            read_buffer_size=16384,
+            max_read_buffer=1048576,
+            socket_options=None
         )
         self.assertEqual(client, client_mock)
 
@@ -307,10 +369,47 @@ class TestPoolUnit(TestCase):
             encoding=self.pool.encoding,
             conn_timeout=self.pool.conn_timeout,
             read_timeout=self.pool.read_timeout,
-            username=None
+            username=None,
+            read_buffer_size=16384,
+            max_read_buffer=1048576,
+            socket_options=None
         )
         self.assertEqual(client, client_mock)
 
+    def test_pipeline(self):
+        client_mock = MagicMock()
+        client_mock.closed = False
+        self.client_mock.return_value = client_mock
+        with self.pool.pipeline(transaction=True) as pipe:
+            self.assertIn(client_mock, self.pool._pool_used)
+        client_mock.pipeline.assert_called_once_with(transaction=True)
+        self.assertEqual(
+            pipe, client_mock.pipeline.return_value.__enter__.return_value
+        )
+        self.assertIn(client_mock, self.pool._pool_free)
+
+    def test_pipeline_error_releases(self):
+        client_mock = MagicMock()
+        client_mock.closed = False
+        self.client_mock.return_value = client_mock
+        with self.assertRaises(ValueError):
+            with self.pool.pipeline():
+                raise ValueError()
+        self.assertEqual(self.pool._pool_used, set())
+        self.assertIn(client_mock, self.pool._pool_free)
+
+    def test_noreply(self):
+        client_mock = MagicMock()
+        client_mock.closed = False
+        self.client_mock.return_value = client_mock
+        with self.pool.noreply(bulk_size=10) as client:
+            self.assertIn(client_mock, self.pool._pool_used)
+        client_mock.noreply.assert_called_once_with(bulk_size=10)
+        self.assertEqual(
+            client, client_mock.noreply.return_value.__enter__.return_value
+        )
+        self.assertIn(client_mock, self.pool._pool_free)
+
 
 class TestSentinelPoolUnit(TestCase):
     def setUp(self):
@@ -334,7 +433,8 @@ class TestSentinelPoolUnit(TestCase):
         self.sentinelclient_mock.assert_called_with(
             sentinels=[('host1', 12345)],
             password=None,
-            username=None
+            username=None,
+            socket_options=None
         )
         self.assertEqual(pool.name, 'mymaster')
         self.assertEqual(pool.retries, 3)
@@ -355,7 +455,8 @@ class TestSentinelPoolUnit(TestCase):
         self.sentinelclient_mock.assert_called_with(
             sentinels=[('host1', 12345)],
             password='blubber',
-            username='blarg'
+            username='blarg',
+            socket_options=None
         )
         self.assertEqual(pool.name, 'mymaster')
         self.assertEqual(pool.retries, 5)
@@ -446,7 +547,10 @@ class TestSentinelPoolUnit(TestCase):
             encoding=None,
             database=0,
             port=12345,
-            username=None
+            username=None,
+            read_buffer_size=16384,
+            max_read_buffer=1048576,
+            socket_options=None
         )
         self.assertEqual(client, client_mock)
 
@@ -1,6 +1,6 @@
 from unittest import TestCase
 import pyredis.protocol as hiredis
-from pyredis.protocol import writer, to_bytes
+from pyredis.protocol import writer, writer_iov, writer_many, to_bytes, has_large_arg
 import sys
 
 # The class ReaderTest is more or less copied from the hiredis python package.
@@ -220,6 +220,152 @@ class ReaderTest(TestCase):
         self.reader.feed(b'*1\r\n*1\r\n*1\r\n*1\r\n$1\r\n!\r\n')
         self.assertEqual([[[[b'!']]]], self.reply())
 
+    def test_nested_multi_bulk_deep(self):
+        depth = 10000
+        self.reader.feed(b'*1\r\n' * depth + b':1\r\n')
+        result = self.reply()
+        for _ in range(depth):
+            self.assertEqual(1, len(result))
+            result = result[0]
+        self.assertEqual(1, result)
+
+    def test_wide_multi_bulk_chunked(self):
+        count = 10000
+        data = b'*%d\r\n' % count + b'$5\r\nhello\r\n:42\r\n' * (count // 2)
+        for offset in range(0, len(data), 7):
+            self.assertEqual(False, self.reply())
+            self.reader.feed(data[offset:offset + 7])
+        self.assertEqual([b'hello', 42] * (count // 2), self.reply())
+
+    def test_nested_multi_bulk_resume_with_empty_and_null(self):
+        self.reader.feed(b'*4\r\n*0\r\n*-1\r\n$-1\r\n*1\r')
+        self.assertEqual(False, self.reply())
+        self.reader.feed(b'\n+ok\r\n+next\r\n')
+        self.assertEqual([[], None, None, [b'ok']], self.reply())
+        self.assertEqual(b'next', self.reply())
+
+    def test_resp3_null(self):
+        self.reader.feed(b'_\r\n')
+        self.assertEqual(None, self.reply())
+
+    def test_resp3_boolean(self):
+        self.reader.feed(b'#t\r\n#f\r\n')
+        self.assertIs(True, self.reply())
+        self.assertIs(False, self.reply())
+
+    def test_resp3_double(self):
+        self.reader.feed(b',1.5\r\n,inf\r\n,-inf\r\n,10\r\n')
+        self.assertEqual(1.5, self.reply())
+        self.assertEqual(float('inf'), self.reply())
+        self.assertEqual(float('-inf'), self.reply())
+        self.assertEqual(10.0, self.reply())
+
+    def test_resp3_big_number(self):
+        self.reader.feed(b'(3492890328409238509324850943850943825024385\r\n')
+        self.assertEqual(3492890328409238509324850943850943825024385, self.reply())
+
+    def test_resp3_blob_error(self):
+        self.reader.feed(b'!21\r\nSYNTAX invalid syntax\r\n')
+        error = self.reply()
+        self.assertEqual(hiredis.ReplyError, type(error))
+        self.assertEqual(('SYNTAX invalid syntax',), error.args)
+
+    def test_resp3_verbatim_string(self):
+        self.reader = hiredis.Reader(encoding='utf-8')
+        self.reader.feed(b'=15\r\ntxt:Some string\r\n')
+        self.assertEqual('Some string', self.reply())
+
+    def test_resp3_map(self):
+        self.reader.feed(b'%2\r\n+first\r\n:1\r\n$6\r\nsecond\r\n*1\r\n:2\r\n')
+        self.assertEqual({b'first': 1, b'second': [2]}, self.reply())
+
+    def test_resp3_empty_map(self):
+        self.reader.feed(b'%0\r\n')
+        self.assertEqual({}, self.reply())
+
+    def test_resp3_map_partial(self):
+        self.reader.feed(b'%1\r\n+key\r\n$5\r\nval')
+        self.assertEqual(False, self.reply())
+        self.reader.feed(b'ue\r\n')
+        self.assertEqual({b'key': b'value'}, self.reply())
+
+    def test_resp3_set(self):
+        self.reader.feed(b'~3\r\n+a\r\n+b\r\n+a\r\n')
+        self.assertEqual({b'a', b'b'}, self.reply())
+
+    def test_resp3_set_unhashable(self):
+        self.reader.feed(b'~1\r\n*1\r\n:1\r\n')
+        self.assertEqual([[1]], self.reply())
+
+    def test_resp3_attribute(self):
+        self.reader.feed(
+            b'|1\r\n+key-popularity\r\n%1\r\n$1\r\na\r\n,0.19\r\n'
+            b'*2\r\n:2039123\r\n:9543892\r\n'
+        )
+        self.assertEqual([2039123, 9543892], self.reply())
+
+    def test_resp3_attribute_nested(self):
+        self.reader.feed(b'*2\r\n:1\r\n|1\r\n+ttl\r\n:3600\r\n:2\r\n')
+        self.assertEqual([1, 2], self.reply())
+
+    def test_resp3_push(self):
+        self.reader.feed(b'>3\r\n$7\r\nmessage\r\n$4\r\nchan\r\n$5\r\nhello\r\n')
+        result = self.reply()
+        self.assertIsInstance(result, hiredis.Push)
+        self.assertEqual([b'message', b'chan', b'hello'], result)
+
+    def test_bulk_string_prealloc_feed(self):
+        payload = bytes(range(256)) * 1024 + b'\r\n'
+        data = b'$%d\r\n' % len(payload) + payload + b'\r\n+next\r\n'
+        for offset in range(0, len(data), 1500):
+            self.reader.feed(data[offset:offset + 1500])
+            if offset + 1500 < len(payload):
+                self.assertEqual(False, self.reply())
+        self.assertEqual(payload, self.reply())
+        self.assertEqual(b'next', self.reply())
+
+    def test_bulk_string_prealloc_bulk_view(self):
+        payload = b'x' * (hiredis.PREALLOC_THRESHOLD * 2)
+        self.reader.feed(b'*2\r\n$%d\r\n' % len(payload) + payload[:100])
+        self.assertEqual(False, self.reply())
+        view = self.reader.bulk_view()
+        self.assertEqual(len(payload) - 100, len(view))
+        view[:] = payload[100:]
+        view.release()
+        self.reader.bulk_advance(len(payload) - 100)
+        self.assertIsNone(self.reader.bulk_view())
+        self.assertEqual(False, self.reply())
+        self.reader.feed(b'\r\n:1\r\n')
+        self.assertEqual([payload, 1], self.reply())
+
+    def test_bulk_view_none(self):
+        self.assertIsNone(self.reader.bulk_view())
+        self.reader.feed(b'$5\r\nhel')
+        self.assertEqual(False, self.reply())
+        self.assertIsNone(self.reader.bulk_view())
+
+    def test_bulk_type_bytearray(self):
+        payload = b'x' * (hiredis.PREALLOC_THRESHOLD + 1)
+        self.reader = hiredis.Reader(bulk_type=bytearray)
+        self.reader.feed(b'*2\r\n$5\r\nhello\r\n$%d\r\n' % len(payload))
+        self.reader.feed(payload + b'\r\n')
+        result = self.reply()
+        self.assertEqual([b'hello', payload], result)
+        self.assertIsInstance(result[0], bytearray)
+        self.assertIsInstance(result[1], bytearray)
+
+    def test_bulk_type_memoryview(self):
+        self.reader = hiredis.Reader(bulk_type=memoryview)
+        self.reader.feed(b'$5\r\nhello\r\n$5\r\nworld\r\n')
+        first = self.reply()
+        second = self.reply()
+        self.assertIsInstance(first, memoryview)
+        self.assertEqual(b'hello', first.tobytes())
+        self.assertEqual(b'world', second.tobytes())
+
+    def test_bulk_type_invalid(self):
+        self.assertRaises(TypeError, hiredis.Reader, bulk_type=str)
+
     def test_subclassable(self):
         class TestReader(hiredis.Reader):
             def __init__(self, *args, **kwargs):
@@ -252,6 +398,97 @@ class ReaderTest(TestCase):
             self.reader.feed(bytearray(b'+ok\r\n'))
             self.assertEqual(b'ok', self.reply())
 
+    def test_feed_memoryview_offset_length(self):
+        data = memoryview(b'blah+ok\r\nblah')
+        self.reader.feed(data, 4, 5)
+        self.assertEqual(b'ok', self.reply())
+        self.assertEqual(False, self.reply())
+
+    def test_empty_status_string(self):
+        self.reader.feed(b'+\r\n+ok\r\n')
+        self.assertEqual(b'', self.reply())
+        self.assertEqual(b'ok', self.reply())
+
+    def test_bulk_string_trailing_crlf(self):
+        self.reader.feed(b'$4\r\nab\r\n\r\n')
+        self.assertEqual(b'ab\r\n', self.reply())
+
+    def test_many_replies_compact(self):
+        count = 20000
+        self.reader.feed(b'$5\r\nhello\r\n' * count + b'$5\r\nwor')
+        for _ in range(count):
+            self.assertEqual(b'hello', self.reply())
+        self.assertEqual(False, self.reply())
+        self.reader.feed(b'ld\r\n')
+        self.assertEqual(b'world', self.reply())
+
+
+    def test_gets_header_bulk_take(self):
+        self.reader.feed(b'$10\r\n01234')
+        self.assertEqual((b'$', 10), self.reader.gets_header())
+        self.assertEqual(b'012', self.reader.take(3))
+        self.assertEqual(b'34', self.reader.take(10))
+        self.assertEqual(b'', self.reader.take(10))
+        self.reader.feed(b'56789\r\n+ok\r\n')
+        self.assertEqual(b'56789\r\n', self.reader.take(7))
+        self.assertEqual(b'ok', self.reply())
+
+    def test_gets_header_other_reply(self):
+        self.reader.feed(b':5\r\n$-1\r\n$3')
+        self.assertEqual((None, 5), self.reader.gets_header())
+        self.assertEqual((b'$', -1), self.reader.gets_header())
+        self.assertEqual(False, self.reader.gets_header())
+
+    def test_gets_header_push(self):
+        self.reader.feed(b'>2\r\n$7\r\nmessage\r\n$2\r\nhi\r\n*1\r\n')
+        kind, push = self.reader.gets_header()
+        self.assertIsNone(kind)
+        self.assertIsInstance(push, hiredis.Push)
+        self.assertEqual([b'message', b'hi'], push)
+        self.assertEqual((b'*', 1), self.reader.gets_header())
+
+    def test_stream_length(self):
+        import io
+        self.assertEqual(5, hiredis.stream_length(b'hello'))
+        source = io.BytesIO(b'hello')
+        source.read(2)
+        self.assertEqual(3, hiredis.stream_length(source))
+        self.assertEqual(2, source.tell())
+        self.assertRaises(ValueError, hiredis.stream_length, object())
+
+    def test_gets_many(self):
+        self.reader.feed(b'+a\r\n:1\r\n*2\r\n$1\r\nb\r\n-ERR x\r\n$1\r\nc')
+        self.assertEqual([b'a', 1], self.reader.gets_many(2))
+        result = self.reader.gets_many(10)
+        self.assertEqual(1, len(result))
+        self.assertEqual(b'b', result[0][0])
+        self.assertIsInstance(result[0][1], hiredis.ReplyError)
+        self.assertEqual([], self.reader.gets_many(10))
+        self.reader.feed(b'\r\n')
+        self.assertEqual([b'c'], self.reader.gets_many(10))
+
+    def test_skip_many(self):
+        self.reader.feed(b'+a\r\n-ERR x\r\n*2\r\n$3\r\nfoo\r\n%1\r\n:1\r\n!3\r\nbad\r\n')
+        self.assertEqual((3, 1), self.reader.skip_many(10))
+        self.reader.feed(b'!3\r\nbad\r\n$5\r\nhel')
+        self.assertEqual((1, 1), self.reader.skip_many(10))
+        self.reader.feed(b'lo\r')
+        self.assertEqual((0, 0), self.reader.skip_many(10))
+        self.reader.feed(b'\n|1\r\n+k\r\n+v\r\n:1\r\n_\r\n+next\r\n')
+        self.assertEqual((3, 0), self.reader.skip_many(3))
+        self.assertEqual(b'next', self.reader.gets())
+
+    def test_skip_many_push(self):
+        pushes = []
+        self.reader.feed(b'>2\r\n+a\r\n+b\r\n:1\r\n>1\r\n')
+        self.assertEqual((1, 0), self.reader.skip_many(10, push_handler=pushes.append))
+        self.assertEqual([[b'a', b'b']], pushes)
+        self.reader.feed(b'+c\r\n>1\r\n+d\r\n:2\r\n')
+        self.assertEqual((1, 0), self.reader.skip_many(10, push_handler=pushes.append))
+        self.assertEqual([[b'a', b'b'], [b'c'], [b'd']], pushes)
+        self.reader.feed(b'>1\r\n+e\r\n:3\r\n')
+        self.assertEqual((1, 0), self.reader.skip_many(10))
+        self.assertEqual(3, len(pushes))
 
 class TestWriter(TestCase):
     def test_encode_0_args(self):
@@ -279,6 +516,24 @@ class TestWriter(TestCase):
             expected)
 
 
+class TestWriterMany(TestCase):
+    def test_matches_writer(self):
+        commands = [
+            ('SET', 'Key/Name', 'SomeValue_?#!ÄÜÖ'),
+            (b'GET', b'Key/Name'),
+            ('SET', 'big', b'x' * 5000),
+            ('DEL', *range(100)),
+        ]
+        expected = b''.join(writer(*args) for args in commands)
+        self.assertEqual(bytes(writer_many(commands)), expected)
+        self.assertEqual(bytes(writer_many(commands)), expected)
+
+    def test_appends_to_buffer(self):
+        out = bytearray(b'*1\r\n$4\r\nPING\r\n')
+        result = writer_many([('ECHO', 1)], out)
+        self.assertIs(result, out)
+        self.assertEqual(bytes(out), writer('PING') + writer('ECHO', 1))
+
 class TestToBytes(TestCase):
     def test_int(self):
         expected = b'512'
@@ -302,3 +557,35 @@ class TestToBytes(TestCase):
 
     def test_ValueError(self):
         self.assertRaises(ValueError, to_bytes, object())
+
+    def test_bytearray(self):
+        value = bytearray(b'0815')
+        self.assertIs(to_bytes(value), value)
+
+    def test_memoryview(self):
+        value = memoryview(b'0815')
+        self.assertIs(to_bytes(value), value)
+
+    def test_buffer_protocol(self):
+        import array
+        value = array.array('H', [1, 2])
+        result = to_bytes(value)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(bytes(result), value.tobytes())
+
+
+class TestWriterIov(TestCase):
+    def test_small_args_joined(self):
+        self.assertEqual(writer_iov('SET', 'key', 'value'), [writer('SET', 'key', 'value')])
+
+    def test_large_arg_referenced(self):
+        value = bytearray(b'x' * hiredis.IOV_THRESHOLD)
+        parts = writer_iov('SET', 'key', value, 'EX', 10)
+        self.assertEqual(len(parts), 3)
+        self.assertIs(parts[1], value)
+        self.assertEqual(b''.join(parts), writer('SET', 'key', bytes(value), 'EX', 10))
+
+    def test_has_large_arg(self):
+        self.assertFalse(has_large_arg(('SET', 'key', 'value', 10, object())))
+        self.assertTrue(has_large_arg(('SET', 'key', b'x' * hiredis.IOV_THRESHOLD)))
+        self.assertTrue(has_large_arg(('SET', 'key', memoryview(b'x' * hiredis.IOV_THRESHOLD))))